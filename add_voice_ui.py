@@ -32,9 +32,13 @@ document.getElementById('saveTrigger').onclick = async () => {
 
 '''
     
-    new_content = content[:insert_pos] + voice_ui + content[insert_pos:]
-    
-    with open('templates/dashboard.html', 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    
+    # Write the three pieces straight through a large buffer instead of
+    # concatenating them into a second full-size string first
+    with open('templates/dashboard.html', 'wb', buffering=1 << 20) as f:
+        f.writelines([
+            content[:insert_pos].encode('utf-8'),
+            voice_ui.encode('utf-8'),
+            content[insert_pos:].encode('utf-8'),
+        ])
+
     print("✓ Voice UI added")
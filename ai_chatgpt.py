@@ -0,0 +1,231 @@
+"""
+Calendar Chatbot - conversational assistant over the user's calendar
+
+This module is responsible for:
+1. Holding a multi-turn conversation with the user
+2. Injecting calendar context into the prompt when provided
+3. Keeping the conversation history inside a fixed token budget
+
+History is trimmed by token count, not message count: truncating to
+"the last N messages" lets a single pasted schedule balloon input
+tokens into the thousands. Each message's token count is computed once
+when appended (tiktoken when installed, ~4 chars/token otherwise), so
+trimming is O(1) per dropped message and per-call input cost is
+bounded at O(budget).
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Optional, List, Dict
+
+try:
+    import openai
+except ImportError:
+    raise ImportError("Please install openai: pip install openai")
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+import os
+
+try:
+    from dotenv import load_dotenv
+    DOTENV_AVAILABLE = True
+except ImportError:
+    load_dotenv = None
+    DOTENV_AVAILABLE = False
+
+from src.openai_client import get_sync_client
+
+# Parse .env once at import - never per chatbot instance
+if DOTENV_AVAILABLE:
+    load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['CalendarChatbot', 'initialize_chatbot', 'is_chatgpt_available']
+
+OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
+
+# Worker pool for overlapping context retrieval with chat preparation
+_retrieval_executor = ThreadPoolExecutor(max_workers=2)
+
+SYSTEM_MESSAGE = """You are a helpful calendar assistant. You help users manage their schedule,
+answer questions about their events, and draft meeting-related text.
+Keep answers short and conversational - they may be spoken aloud."""
+
+
+class CalendarChatbot:
+    """Multi-turn chat with a token-budgeted conversation history."""
+
+    def __init__(self, model: str = OPENAI_MODEL,
+                 history_token_budget: int = 2000):
+        self.model = model
+        self.history_token_budget = history_token_budget
+        # entries: {"role": str, "content": str, "tokens": int}
+        self.conversation_history: List[Dict] = []
+        self._encoding = None
+        if TIKTOKEN_AVAILABLE:
+            try:
+                self._encoding = tiktoken.encoding_for_model(model)
+            except Exception:
+                try:
+                    self._encoding = tiktoken.get_encoding("cl100k_base")
+                except Exception:
+                    self._encoding = None
+
+    def _count_tokens(self, text: str) -> int:
+        """Token count for text (estimate when tiktoken is missing)."""
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return max(1, len(text) // 4)
+
+    def _append(self, role: str, content: str) -> None:
+        """Add a message, collapsing consecutive same-role messages."""
+        if (self.conversation_history
+                and self.conversation_history[-1]["role"] == role):
+            merged = self.conversation_history[-1]["content"] + "\n" + content
+            self.conversation_history[-1] = {
+                "role": role, "content": merged,
+                "tokens": self._count_tokens(merged)}
+        else:
+            self.conversation_history.append({
+                "role": role, "content": content,
+                "tokens": self._count_tokens(content)})
+        self._trim_history()
+
+    def _trim_history(self) -> None:
+        """Drop oldest messages until history fits the token budget."""
+        total = sum(m["tokens"] for m in self.conversation_history)
+        while (len(self.conversation_history) > 1
+               and total > self.history_token_budget):
+            dropped = self.conversation_history.pop(0)
+            total -= dropped["tokens"]
+
+    def chat(self, message: str, calendar_context: Optional[str] = None) -> str:
+        """
+        Send one user message and return the assistant's reply.
+
+        Args:
+            message: The user's message
+            calendar_context: Optional calendar/events text to ground
+                              the answer (not stored in history)
+
+        Returns:
+            str: Assistant reply
+        """
+        self._append("user", message)
+        return self._complete(calendar_context)
+
+    def chat_with_retrieval(
+        self,
+        message: str,
+        context_fetcher: Callable[[], Optional[str]]
+    ) -> str:
+        """
+        Chat while the calendar context is fetched concurrently.
+
+        The serial flow (fetch context -> build prompt -> call LLM)
+        stacks the Google Calendar round trip in front of everything
+        else. Here the fetcher runs on a worker thread while this
+        thread does client setup and history bookkeeping; the fetch
+        and the local prep overlap, and a slow or failing fetcher
+        degrades to an uncontexted answer instead of an error.
+
+        Args:
+            message: The user's message
+            context_fetcher: Zero-arg callable returning context text
+                             (or None), run concurrently
+
+        Returns:
+            str: Assistant reply
+        """
+        future = _retrieval_executor.submit(context_fetcher)
+        get_sync_client()  # build the pooled client while the fetch runs
+        self._append("user", message)
+        try:
+            calendar_context = future.result(timeout=5)
+        except Exception as e:
+            logger.warning(f"Context retrieval failed: {e}")
+            calendar_context = None
+        return self._complete(calendar_context)
+
+    def _complete(self, calendar_context: Optional[str]) -> str:
+        """Build the messages list, call the model, record the reply."""
+        client = get_sync_client()
+        if client is None:
+            raise RuntimeError("OpenAI API key not configured")
+
+        messages = [{"role": "system", "content": SYSTEM_MESSAGE}]
+        if calendar_context:
+            messages.append({
+                "role": "system",
+                "content": f"Current calendar context:\n{calendar_context}"})
+        messages.extend({"role": m["role"], "content": m["content"]}
+                        for m in self.conversation_history)
+
+        response = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=300
+        )
+        reply = response.choices[0].message.content.strip()
+        self._append("assistant", reply)
+        return reply
+
+    def analyze_schedule(self, question: str, events: List[Dict]) -> str:
+        """
+        Answer a question about a list of calendar events.
+
+        The events summary is memoized on (id, updated) pairs, so
+        back-to-back questions over an unchanged schedule ("am I
+        overbooked?", "do I have breaks?") reuse one pre-built summary
+        instead of re-serializing the event list each call.
+
+        Args:
+            question: The user's question about the schedule
+            events: Google Calendar event dicts
+
+        Returns:
+            str: Assistant reply
+        """
+        key = tuple(
+            (e.get('id', ''), e.get('updated', ''),
+             e.get('summary', '(no title)'),
+             (e.get('start') or {}).get('dateTime')
+             or (e.get('start') or {}).get('date', ''),
+             (e.get('end') or {}).get('dateTime')
+             or (e.get('end') or {}).get('date', ''))
+            for e in events[:10])
+        return self.chat(question, calendar_context=_format_events_summary(key))
+
+    def reset(self) -> None:
+        """Clear the conversation history."""
+        self.conversation_history = []
+
+
+@lru_cache(maxsize=128)
+def _format_events_summary(events_key: tuple) -> str:
+    """Format an events summary once per distinct (id, updated) set."""
+    if not events_key:
+        return "No events scheduled."
+    lines = [f"- {start} to {end}: {summary}"
+             for _id, _updated, summary, start, end in events_key]
+    return "Schedule:\n" + "\n".join(lines)
+
+
+def is_chatgpt_available() -> bool:
+    """True when an API key is configured."""
+    return bool(OPENAI_API_KEY)
+
+
+def initialize_chatbot() -> CalendarChatbot:
+    """Create a chatbot instance (raises if openai is unusable)."""
+    return CalendarChatbot()
@@ -14,22 +14,50 @@ replacing all old regex/pattern matching logic.
 import json
 import logging
 import asyncio
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+try:
+    import re2 as _re  # linear-time DFA matching (google-re2)
+except ImportError:
+    import re as _re
+
 try:
     import openai
     from openai import AsyncOpenAI
 except ImportError:
     raise ImportError("Please install openai: pip install openai")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 import os
 from dotenv import load_dotenv
 
+try:
+    from src.semantic_cache import SemanticCache
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SemanticCache = None
+    SEMANTIC_CACHE_AVAILABLE = False
+
 load_dotenv()
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Voice commands cluster heavily ("book meeting tomorrow at 2pm"
+# variants), so paraphrases of a prior utterance can reuse its parsed
+# intent instead of paying the LLM round-trip. Dates/times/event ids are
+# canonicalized away before matching, so entity-specific parameters
+# never false-match across utterances.
+_intent_cache = (SemanticCache(similarity_threshold=0.92, ttl_seconds=3600)
+                 if SEMANTIC_CACHE_AVAILABLE else None)
+
 # AI Configuration
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
 OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
@@ -37,8 +65,60 @@ OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
 if not OPENAI_API_KEY:
     logger.warning("OPENAI_API_KEY not set. AI intent handler will not work.")
 
-# Initialize async OpenAI client
-client = AsyncOpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+# Strict structured output: guarantees schema conformance (no
+# json_parse_error path) and lets generation stop as soon as the small
+# object is complete
+INTENT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "voice_intent",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "intent": {
+                    "type": "string",
+                    "enum": ["create_event", "delete_event",
+                             "show_events", "unknown"]
+                },
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": ["string", "null"]},
+                        "date": {"type": ["string", "null"]},
+                        "time": {"type": ["string", "null"]},
+                        "event_title": {"type": ["string", "null"]},
+                        "date_range": {"type": ["string", "null"]}
+                    },
+                    "required": ["title", "date", "time",
+                                 "event_title", "date_range"],
+                    "additionalProperties": False
+                },
+                "confidence": {"type": "number"}
+            },
+            "required": ["intent", "parameters", "confidence"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
+def _json_loads(text):
+    """Parse JSON with orjson (2-5x faster) when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize compact JSON with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+# Shared client: one connection pool across the AI modules
+from src.openai_client import get_async_client
+client = get_async_client()
 
 
 async def interpret(text: str) -> Dict[str, Any]:
@@ -68,6 +148,14 @@ async def interpret(text: str) -> Dict[str, Any]:
         }
     """
     
+    # Fast path: obvious commands match a tiny precompiled grammar and
+    # never reach the model (works even without an API key)
+    if text and text.strip():
+        fast = _fast_path(text)
+        if fast is not None:
+            logger.info(f"⚡ Fast-path intent: {fast['intent']}")
+            return fast
+
     if not client:
         logger.error("OpenAI client not initialized. Check OPENAI_API_KEY.")
         return {
@@ -77,7 +165,7 @@ async def interpret(text: str) -> Dict[str, Any]:
             "confidence": 0.0,
             "raw_response": "OpenAI API key not configured."
         }
-    
+
     if not text or not text.strip():
         return {
             "success": False,
@@ -87,10 +175,19 @@ async def interpret(text: str) -> Dict[str, Any]:
             "raw_response": "No text provided."
         }
     
+    # Semantic cache: return the stored intent for near-identical
+    # utterances. Utterances carrying concrete dates/times/ids are
+    # never cached - their parameters wouldn't transfer.
+    if _intent_cache is not None and _is_cacheable(text):
+        cached = _intent_cache.lookup(text)
+        if cached is not None:
+            logger.info(f"✅ Intent cache hit: {cached.get('intent')}")
+            return dict(cached)
+
     try:
         # Load system prompt from file
         system_prompt = _load_system_prompt()
-        
+
         logger.info(f"🤖 AI Interpreting: '{text}'")
         
         # Call OpenAI with async
@@ -106,19 +203,19 @@ async def interpret(text: str) -> Dict[str, Any]:
                     "content": text
                 }
             ],
-            temperature=0.3,  # Low temperature for consistent JSON
-            max_tokens=500,
-            response_format={"type": "json_object"}  # Force JSON output
+            temperature=0,  # deterministic: exact-match caching works
+            max_tokens=120,  # a 4-field object never needs more
+            response_format=INTENT_RESPONSE_FORMAT
         )
         
         # Extract response text
         response_text = response.choices[0].message.content
         logger.debug(f"🤖 AI Raw Response: {response_text}")
         
-        # Parse JSON
+        # Parse JSON (orjson raises a JSONDecodeError subclassing ValueError)
         try:
-            parsed = json.loads(response_text)
-        except json.JSONDecodeError as e:
+            parsed = _json_loads(response_text)
+        except ValueError as e:
             logger.error(f"Failed to parse AI response as JSON: {response_text}")
             return {
                 "success": False,
@@ -131,16 +228,26 @@ async def interpret(text: str) -> Dict[str, Any]:
         # Validate required fields
         if "intent" not in parsed:
             parsed["intent"] = "unknown"
-        
+
         if "parameters" not in parsed:
             parsed["parameters"] = {}
+        else:
+            # strict schema emits every key; drop the null slots so
+            # callers' parameters.get(..., default) behavior holds
+            parsed["parameters"] = {k: v for k, v
+                                    in parsed["parameters"].items()
+                                    if v is not None}
         
         parsed["success"] = parsed.get("intent") != "unknown"
         parsed["confidence"] = parsed.get("confidence", 0.8)
         parsed["raw_response"] = response_text
         
         logger.info(f"✅ Intent: {parsed['intent']} | Confidence: {parsed['confidence']}")
-        
+
+        if (_intent_cache is not None and parsed["success"]
+                and _is_cacheable(text)):
+            _intent_cache.store(text, dict(parsed))
+
         return parsed
     
     except Exception as e:
@@ -154,21 +261,218 @@ async def interpret(text: str) -> Dict[str, Any]:
         }
 
 
+# Fast-path grammar: a large share of voice commands fit these few
+# shapes, and matching them locally answers in <5ms instead of a
+# ~500ms GPT round trip. Patterns are anchored and compiled once
+# (with google-re2's DFA when installed, stdlib re otherwise).
+_SHOW_PATTERN = _re.compile(
+    r"^(?:show|list|what's(?: on)?|whats(?: on)?|tell me)\s+(?:my\s+)?"
+    r"(?:calendar|events?|schedule|agenda)"
+    r"(?:\s+(?:for\s+)?(today|tomorrow|this week|this month))?$")
+_DELETE_PATTERN = _re.compile(
+    r"^(?:delete|cancel|remove)\s+(?:my\s+|the\s+)?(.+?)$")
+_CREATE_PATTERN = _re.compile(
+    r"^(?:book|schedule|create|add)\s+(?:a\s+|an\s+)?(.+?)"
+    r"\s+(?:on\s+|for\s+)?(today|tomorrow|next \w+|[a-z]+day)"
+    r"(?:\s+at\s+(\d{1,2}(?::\d{2})?\s*(?:am|pm)?))?$")
+_TIME_PATTERN = _re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)?$")
+
+
+def _normalize_time(raw: Optional[str]) -> Optional[str]:
+    """'2pm' / '2:30 pm' / '14:00' -> 'HH:MM'."""
+    if not raw:
+        return None
+    match = _TIME_PATTERN.match(raw.strip().lower())
+    if not match:
+        return None
+    hour = int(match.group(1))
+    minute = int(match.group(2) or 0)
+    meridiem = match.group(3)
+    if meridiem == 'pm' and hour != 12:
+        hour += 12
+    elif meridiem == 'am' and hour == 12:
+        hour = 0
+    if hour > 23 or minute > 59:
+        return None
+    return f"{hour:02d}:{minute:02d}"
+
+
+def _resolve_date(token: str) -> Optional[str]:
+    """Resolve a relative date token to YYYY-MM-DD."""
+    try:
+        from src.nlu_parser import parse_date
+        parsed = parse_date(token)
+        return parsed.isoformat() if parsed else None
+    except ImportError:
+        return None
+
+
+def _fast_path(text: str) -> Optional[Dict[str, Any]]:
+    """Classify an obvious command locally; None defers to the LLM."""
+    normalized = ' '.join(text.lower().split()).rstrip('.!?')
+
+    match = _SHOW_PATTERN.match(normalized)
+    if match:
+        parameters = {}
+        if match.group(1):
+            parameters["date_range"] = match.group(1)
+        return {"success": True, "intent": "show_events",
+                "parameters": parameters, "confidence": 0.95,
+                "raw_response": "fast_path"}
+
+    match = _CREATE_PATTERN.match(normalized)
+    if match:
+        date = _resolve_date(match.group(2))
+        time = _normalize_time(match.group(3))
+        if date:
+            parameters = {"title": match.group(1), "date": date}
+            if time:
+                parameters["time"] = time
+            return {"success": True, "intent": "create_event",
+                    "parameters": parameters, "confidence": 0.9,
+                    "raw_response": "fast_path"}
+
+    match = _DELETE_PATTERN.match(normalized)
+    if match:
+        title = _re.sub(r"\s+(?:event|meeting|appointment)$", "",
+                        match.group(1)).strip()
+        if title:
+            return {"success": True, "intent": "delete_event",
+                    "parameters": {"event_title": title},
+                    "confidence": 0.9, "raw_response": "fast_path"}
+
+    return None
+
+
+def interpret_fast(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Local-only classification, synchronous and allocation-cheap.
+
+    Returns the same dict shape as interpret() when the transcript is
+    an obvious command, or None when the LLM is actually needed. Lets
+    synchronous callers skip the event-loop handoff entirely on the
+    fast path.
+    """
+    if not text or not text.strip():
+        return None
+    return _fast_path(text)
+
+
+async def interpret_and_respond(text: str) -> Dict[str, Any]:
+    """
+    Classify intent and draft the spoken confirmation in one call.
+
+    The two-call flow (interpret -> execute -> generate_response) pays
+    two TLS round trips and two system prompts per utterance. This
+    fused variant asks the model for a confirmation_text field
+    alongside the intent; the caller executes the command and speaks
+    confirmation_text as-is on success, falling back to
+    ai_response._fallback_response (or a targeted second call) only
+    when execution fails.
+
+    Args:
+        text (str): Raw user voice transcript
+
+    Returns:
+        Dict: interpret()-shaped result plus "confirmation_text"
+    """
+    fast = _fast_path(text) if text and text.strip() else None
+    if fast is not None:
+        # templated confirmations are deterministic anyway
+        from ai_response import _fallback_response
+        fast["confirmation_text"] = _fallback_response(
+            fast["intent"], fast["parameters"], True)
+        return fast
+
+    if not client:
+        logger.error("OpenAI client not initialized. Check OPENAI_API_KEY.")
+        return {"success": False, "intent": "error", "parameters": {},
+                "confidence": 0.0, "confirmation_text": "",
+                "raw_response": "OpenAI API key not configured."}
+
+    try:
+        response = await client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": _load_system_prompt()},
+                {"role": "system", "content":
+                    'Additionally include a "confirmation_text" field: '
+                    "one short, friendly sentence confirming the action "
+                    "as if it already succeeded."},
+                {"role": "user", "content": text}
+            ],
+            temperature=0,
+            max_tokens=180,
+            response_format=_FUSED_RESPONSE_FORMAT
+        )
+        response_text = response.choices[0].message.content
+        parsed = _json_loads(response_text)
+        parsed["parameters"] = {k: v for k, v
+                                in parsed.get("parameters", {}).items()
+                                if v is not None}
+        parsed.setdefault("intent", "unknown")
+        parsed.setdefault("confirmation_text", "")
+        parsed["success"] = parsed["intent"] != "unknown"
+        parsed["confidence"] = parsed.get("confidence", 0.8)
+        parsed["raw_response"] = response_text
+        return parsed
+    except Exception as e:
+        logger.error(f"Fused interpretation error: {str(e)}")
+        return {"success": False, "intent": "error", "parameters": {},
+                "confidence": 0.0, "confirmation_text": "",
+                "raw_response": str(e)}
+
+
+def _build_fused_format() -> Dict[str, Any]:
+    """Intent schema extended with the confirmation_text field."""
+    import copy
+    fmt = copy.deepcopy(INTENT_RESPONSE_FORMAT)
+    schema = fmt["json_schema"]["schema"]
+    schema["properties"]["confirmation_text"] = {"type": "string"}
+    schema["required"].append("confirmation_text")
+    fmt["json_schema"]["name"] = "voice_intent_with_confirmation"
+    return fmt
+
+
+_FUSED_RESPONSE_FORMAT = _build_fused_format()
+
+
+def _is_cacheable(text: str) -> bool:
+    """True when the utterance carries no entity the cache would erase.
+
+    SemanticCache canonicalizes dates, times and event ids to
+    placeholders before matching; a cached intent for "book meeting
+    tomorrow at 2pm" would otherwise be served for "... at 3pm" with the
+    wrong parameters. Relative words like "today"/"tomorrow" survive
+    canonicalization and stay cacheable.
+    """
+    from src.semantic_cache import canonicalize
+    return '<' not in canonicalize(text)
+
+
+_PROMPT_FILE = "ai_prompts/system_prompt.txt"
+
+
 def _load_system_prompt() -> str:
     """
     Load AI system prompt from file.
     This tells the AI exactly how to interpret commands.
-    
+
+    The file is read once and memoized keyed on its mtime: no
+    open/read/close syscalls per utterance, while edits to the prompt
+    file during development still take effect on the next call. The
+    byte-identical string, placed first in the messages list, also lets
+    OpenAI's prefix cache serve the prompt's input tokens at the
+    cached-read rate (~10% of base) on repeats.
+
     Returns:
         str: System prompt content
     """
-    prompt_file = "ai_prompts/system_prompt.txt"
-    
     try:
-        with open(prompt_file, 'r') as f:
-            return f.read().strip()
+        mtime = os.stat(_PROMPT_FILE).st_mtime
+        return _read_system_prompt(mtime)
     except FileNotFoundError:
-        logger.warning(f"System prompt file not found: {prompt_file}")
+        logger.warning(f"System prompt file not found: {_PROMPT_FILE}")
         # Fallback prompt
         return """You are the AI command interpreter for a voice assistant calendar app.
 Your job is to extract intent and parameters from natural voice commands.
@@ -196,18 +500,317 @@ For "unknown":
 Always respond with valid JSON only."""
 
 
-async def interpret_batch(texts: list) -> list:
+@lru_cache(maxsize=1)
+def _read_system_prompt(mtime: float) -> str:
+    """Read the prompt file; re-reads only when its mtime changes."""
+    with open(_PROMPT_FILE, 'r') as f:
+        return f.read().strip()
+
+
+class AsyncOpenAIRateLimiter:
+    """
+    Token bucket tracking both requests/min and tokens/min.
+
+    Unbounded gather() either trips the RPM/TPM limits (429s followed by
+    backoff stalls) or under-utilizes them. Workers call
+    acquire(estimated_tokens) before each request; the buckets refill
+    continuously, so throughput sits at the limit without thrash.
+    """
+
+    def __init__(self, rpm: int = 500, tpm: int = 200_000):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        import time
+        now = time.monotonic()
+        if self._last_refill is not None:
+            elapsed = now - self._last_refill
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+        self._last_refill = now
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Block until one request + estimated_tokens fit in the budget."""
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= estimated_tokens:
+                    self._requests -= 1
+                    self._tokens -= estimated_tokens
+                    return
+                # seconds until the scarcer budget has refilled enough
+                need_req = max(0.0, (1 - self._requests) * 60 / self.rpm)
+                need_tok = max(0.0, (estimated_tokens - self._tokens) * 60 / self.tpm)
+                delay = max(need_req, need_tok, 0.05)
+            await asyncio.sleep(delay)
+
+
+async def interpret_batch(
+    texts: list,
+    max_workers: int = 8,
+    limiter: Optional[AsyncOpenAIRateLimiter] = None
+) -> list:
     """
     Process multiple texts at once (async batch processing).
-    
+
+    A fixed worker pool pulls from a queue and acquires RPM/TPM budget
+    from AsyncOpenAIRateLimiter before each call, instead of firing one
+    unbounded task per text. Rate-limited calls retry with exponential
+    backoff plus jitter.
+
     Args:
         texts (list): List of strings to interpret
-    
+        max_workers (int): Concurrent in-flight requests
+        limiter: Shared rate limiter (defaults to a fresh one)
+
+    Returns:
+        list: List of interpretation results, in input order
+    """
+    if not texts:
+        return []
+
+    limiter = limiter or AsyncOpenAIRateLimiter()
+    results = [None] * len(texts)
+
+    # Batched cache pass first: one embedding call and one index query
+    # cover every cacheable text, so only true misses reach the workers
+    if _intent_cache is not None:
+        cacheable = [i for i, t in enumerate(texts)
+                     if t and t.strip() and _is_cacheable(t)]
+        if cacheable:
+            cached_rows = _intent_cache.lookup_many(
+                [texts[i] for i in cacheable])
+            for i, cached in zip(cacheable, cached_rows):
+                if cached is not None:
+                    results[i] = dict(cached)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for i, text in enumerate(texts):
+        if results[i] is None:
+            queue.put_nowait((i, text))
+    if queue.empty():
+        return results
+
+    async def worker():
+        import random
+        while True:
+            try:
+                i, text = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            # rough estimate: prompt + utterance at ~4 chars/token,
+            # plus the max_tokens completion budget
+            estimated = len(_load_system_prompt()) // 4 + len(text) // 4 + 500
+            for attempt in range(5):
+                await limiter.acquire(estimated)
+                result = await interpret(text)
+                raw = str(result.get("raw_response", ""))
+                rate_limited = (result.get("intent") == "error"
+                                and ("rate limit" in raw.lower()
+                                     or "429" in raw))
+                if not rate_limited:
+                    break
+                delay = min(30, 2 ** attempt) + random.uniform(0, 1)
+                logger.warning(f"Rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            results[i] = result
+
+    await asyncio.gather(*(worker() for _ in
+                           range(min(max_workers, len(texts)))))
+    return results
+
+
+async def interpret_multi(texts: list, k: int = 8) -> list:
+    """
+    Classify several utterances in one chat.completions request.
+
+    interpret_batch still pays one HTTP round trip (and one system
+    prompt's worth of input tokens) per text. Packing K utterances into
+    a single numbered prompt amortizes both: the system prompt is
+    tokenized once and K requests collapse into ceil(N/K). Groups are
+    interpreted concurrently.
+
+    Args:
+        texts (list): List of strings to interpret
+        k (int): Utterances per request
+
     Returns:
-        list: List of interpretation results
+        list: List of interpretation results, in input order
     """
-    tasks = [interpret(text) for text in texts]
-    return await asyncio.gather(*tasks)
+    if not texts:
+        return []
+    if not client:
+        logger.error("OpenAI client not initialized. Check OPENAI_API_KEY.")
+        return [{"success": False, "intent": "error", "parameters": {},
+                 "confidence": 0.0, "raw_response": "OpenAI API key not configured."}
+                for _ in texts]
+
+    groups = [texts[i:i + k] for i in range(0, len(texts), k)]
+    group_results = await asyncio.gather(
+        *(_interpret_group(group) for group in groups))
+    return [result for group in group_results for result in group]
+
+
+async def _interpret_group(texts: list) -> list:
+    """Interpret one group of utterances with a single API call."""
+    numbered = "\n".join(f"{i + 1}. {text}" for i, text in enumerate(texts))
+    user_message = (
+        "Classify each numbered line below as a separate voice command. "
+        'Respond with a JSON object {"results": [...]} containing one '
+        "intent object per line, in the same order, each with the usual "
+        '"intent", "parameters" and "confidence" fields.\n'
+        f"{numbered}"
+    )
+
+    error = {"success": False, "intent": "error", "parameters": {},
+             "confidence": 0.0, "raw_response": ""}
+    # bound up front: the ValueError handler reads it, and the API call
+    # itself can raise ValueError before the response is assigned
+    response_text = ""
+    try:
+        response = await client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": _load_system_prompt()},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=0.3,
+            max_tokens=500 * len(texts),
+            response_format={"type": "json_object"}
+        )
+        response_text = response.choices[0].message.content
+        results = _json_loads(response_text).get("results", [])
+    except ValueError:
+        logger.error("Failed to parse multi-intent response as JSON")
+        return [dict(error, intent="json_parse_error",
+                     raw_response=response_text) for _ in texts]
+    except Exception as e:
+        logger.error(f"Multi-intent interpretation error: {str(e)}")
+        return [dict(error, raw_response=str(e)) for _ in texts]
+
+    # pad/truncate defensively: the model must return one entry per line
+    parsed_list = []
+    for i in range(len(texts)):
+        parsed = results[i] if i < len(results) and isinstance(results[i], dict) else {}
+        parsed.setdefault("intent", "unknown")
+        parsed.setdefault("parameters", {})
+        parsed["success"] = parsed.get("intent") != "unknown"
+        parsed["confidence"] = parsed.get("confidence", 0.8)
+        parsed["raw_response"] = response_text
+        parsed_list.append(parsed)
+    return parsed_list
+
+
+async def interpret_batch_offline(
+    texts: list,
+    wait: bool = True,
+    poll_seconds: int = 30
+) -> Dict[str, Any]:
+    """
+    Interpret a large batch through OpenAI's Batch API.
+
+    For non-latency-sensitive workloads (offline re-interpretation of
+    transcripts, evals) the /v1/batches endpoint costs half the online
+    rate and draws from a separate, higher rate-limit pool. Keep
+    interpret_batch() for small interactive batches; use this for
+    anything big enough that RPM limits would throttle gather().
+
+    Args:
+        texts: Strings to interpret
+        wait: Poll until the batch completes; False returns the batch
+              id immediately for later retrieval
+        poll_seconds: Seconds between status polls when waiting
+
+    Returns:
+        Dict with:
+        {
+            "success": bool,
+            "batch_id": str,
+            "status": str,
+            "results": {custom_id: interpretation dict}  # when completed
+        }
+    """
+    if not client:
+        logger.error("OpenAI client not initialized. Check OPENAI_API_KEY.")
+        return {"success": False, "batch_id": None,
+                "status": "error", "results": {}}
+
+    system_prompt = _load_system_prompt()
+    lines = []
+    for i, text in enumerate(texts):
+        lines.append(_json_dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": OPENAI_MODEL,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": text}
+                ],
+                "temperature": 0.3,
+                "max_tokens": 500,
+                "response_format": {"type": "json_object"}
+            }
+        }))
+
+    try:
+        input_file = await client.files.create(
+            file=("intent_batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"📦 Batch submitted: {batch.id} ({len(texts)} texts)")
+
+        if not wait:
+            return {"success": True, "batch_id": batch.id,
+                    "status": batch.status, "results": {}}
+
+        while batch.status not in ("completed", "failed",
+                                   "expired", "cancelled"):
+            await asyncio.sleep(poll_seconds)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            logger.error(f"Batch {batch.id} ended as {batch.status}")
+            return {"success": False, "batch_id": batch.id,
+                    "status": batch.status, "results": {}}
+
+        output = await client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            row = _json_loads(line)
+            body = (row.get("response") or {}).get("body") or {}
+            try:
+                content = body["choices"][0]["message"]["content"]
+                parsed = _json_loads(content)
+            except (KeyError, IndexError, ValueError):
+                parsed = {"success": False, "intent": "json_parse_error",
+                          "parameters": {}, "confidence": 0.0}
+            parsed.setdefault("intent", "unknown")
+            parsed.setdefault("parameters", {})
+            parsed["success"] = parsed.get("intent") != "unknown"
+            results[row.get("custom_id")] = parsed
+
+        logger.info(f"✅ Batch {batch.id} completed: {len(results)} results")
+        return {"success": True, "batch_id": batch.id,
+                "status": batch.status, "results": results}
+
+    except Exception as e:
+        logger.error(f"Batch interpretation error: {str(e)}")
+        return {"success": False, "batch_id": None,
+                "status": "error", "results": {}}
 
 
 def interpret_sync(text: str) -> Dict[str, Any]:
@@ -220,20 +823,10 @@ def interpret_sync(text: str) -> Dict[str, Any]:
     Returns:
         Dict: Interpretation result
     """
-    try:
-        # Run async function in event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is already running, use run_in_executor
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, interpret(text))
-                return future.result()
-        else:
-            return asyncio.run(interpret(text))
-    except RuntimeError:
-        # No event loop, create one
-        return asyncio.run(interpret(text))
+    # Run on the shared background loop so the AsyncOpenAI client's
+    # keep-alive connections survive between sync calls
+    from async_runner import run_sync
+    return run_sync(interpret(text))
 
 
 # Example usage (for testing)
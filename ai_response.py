@@ -14,9 +14,13 @@ we use AI to create natural language like:
 """
 
 import json
+import re
+import hashlib
 import logging
+import random
+import time
 import asyncio
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 
 try:
     from openai import AsyncOpenAI
@@ -35,15 +39,101 @@ logger = logging.getLogger(__name__)
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
 OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
 
-# Initialize async OpenAI client
-client = AsyncOpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+# Shared client: one keep-alive HTTP/2 connection pool across the AI
+# modules, so successive completions reuse one TLS connection instead
+# of paying a handshake per call
+from src.openai_client import get_async_client
+client = get_async_client()
+
+# Single module-level constant so every call sends a byte-identical
+# system message first; OpenAI's prefix cache then serves those input
+# tokens at the cached-read rate on repeated calls.
+SYSTEM_MESSAGE = """You are a friendly voice assistant. Generate a short, natural response (1-2 sentences max)
+                    to confirm an action was completed. Be conversational and warm."""
+
+
+#: Intents whose confirmations are pure boilerplate - a template says
+#: "Added X on DATE at TIME" as well as the model does, for zero cost
+#: and <1ms instead of a ~400-800ms round trip.
+_TEMPLATED_INTENTS = {"create_event", "delete_event", "show_events"}
+
+# Cache for LLM-generated confirmations (the natural=True / novel-
+# intent path): the inputs collapse to a handful of shapes, so repeats
+# can reuse a stored phrasing instead of paying another round trip.
+# Up to _RESPONSE_CACHE_VARIANTS phrasings are kept per shape and one
+# is picked at random so responses don't sound robotic; while a shape
+# has fewer variants than that, a fraction of hits regenerate to
+# collect another. Redis when configured, in-process dict otherwise.
+_RESPONSE_CACHE_TTL = 86400
+_RESPONSE_CACHE_VARIANTS = 5
+_RESPONSE_REGEN_CHANCE = 0.25
+
+_response_redis = None
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis as _response_redis_mod
+        _response_redis = _response_redis_mod.Redis.from_url(
+            os.environ['REDIS_URL'], socket_timeout=0.2)
+    except Exception as e:
+        logger.warning("Redis response cache unavailable: %s", e)
+
+_response_cache_local = {}  # key -> (expires_at, [variants])
+
+
+def _response_cache_key(intent, parameters, result, success) -> str:
+    """Normalize the response inputs down to their shape."""
+    title = parameters.get('title') or parameters.get('event_title') or ''
+    date = parameters.get('date') or parameters.get('date_range') or ''
+    count = (result or {}).get('event_count', '')
+    raw = f"{intent}|{success}|{title}|{date}|{count}"
+    return 'resp:' + hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[str]:
+    """Random stored phrasing for key, or None to (re)generate."""
+    variants = None
+    if _response_redis is not None:
+        try:
+            raw = _response_redis.lrange(key, 0, _RESPONSE_CACHE_VARIANTS - 1)
+            variants = [v.decode() for v in raw]
+        except Exception as e:
+            logger.warning("Response cache read failed: %s", e)
+    if variants is None:
+        entry = _response_cache_local.get(key)
+        if entry and entry[0] > time.time():
+            variants = entry[1]
+    if not variants:
+        return None
+    if (len(variants) < _RESPONSE_CACHE_VARIANTS
+            and random.random() < _RESPONSE_REGEN_CHANCE):
+        return None
+    return random.choice(variants)
+
+
+def _response_cache_put(key: str, text: str) -> None:
+    if _response_redis is not None:
+        try:
+            pipe = _response_redis.pipeline()
+            pipe.lpush(key, text)
+            pipe.ltrim(key, 0, _RESPONSE_CACHE_VARIANTS - 1)
+            pipe.expire(key, _RESPONSE_CACHE_TTL)
+            pipe.execute()
+            return
+        except Exception as e:
+            logger.warning("Response cache write failed: %s", e)
+    entry = _response_cache_local.get(key)
+    variants = entry[1] if entry and entry[0] > time.time() else []
+    variants.insert(0, text)
+    del variants[_RESPONSE_CACHE_VARIANTS:]
+    _response_cache_local[key] = (time.time() + _RESPONSE_CACHE_TTL, variants)
 
 
 async def generate_response(
     intent: str,
     parameters: Dict[str, Any],
     result: Dict[str, Any],
-    success: bool = True
+    success: bool = True,
+    natural: bool = False
 ) -> str:
     """
     ========================================
@@ -58,45 +148,126 @@ async def generate_response(
         result (Dict): Result from executing the command (success status, created IDs, etc.)
         success (bool): Whether the command succeeded
     
+    Args (additional):
+        natural (bool): Force the LLM path even for templated intents
+
     Returns:
         str: Natural language response to speak to the user
     """
-    
+
+    # Deterministic templates are the primary path: confirmations have
+    # no creative value, so only novel intents (or natural=True) pay
+    # for the model
+    if not natural and (not success or intent in _TEMPLATED_INTENTS):
+        return _fallback_response(intent, parameters, success,
+                                  result=result)
+
+    # LLM path: reuse a cached phrasing for this response shape
+    cache_key = _response_cache_key(intent, parameters, result, success)
+    cached = _response_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    chunks = []
+    try:
+        async for chunk in generate_response_stream(
+                intent, parameters, result, success):
+            chunks.append(chunk)
+    except Exception as e:
+        logger.error(f"Error generating response: {str(e)}")
+        if not chunks:
+            return _fallback_response(intent, parameters, success)
+
+    response_text = "".join(chunks).strip()
+    if response_text:
+        _response_cache_put(cache_key, response_text)
+    logger.info(f"✅ Generated response: {response_text}")
+    return response_text
+
+
+async def generate_response_stream(
+    intent: str,
+    parameters: Dict[str, Any],
+    result: Dict[str, Any],
+    success: bool = True
+) -> AsyncIterator[str]:
+    """
+    Stream the natural response token by token.
+
+    For voice, waiting on the full completion delays TTS by the whole
+    generation time; yielding deltas lets the TTS pipeline start
+    speaking the first sentence while the model is still writing the
+    rest. Pair with stream_sentences() to flush on sentence boundaries.
+
+    Args:
+        intent: The intent executed
+        parameters: Extracted parameters
+        result: Execution result
+        success: Whether it succeeded
+
+    Yields:
+        str: Token deltas as they arrive
+    """
+
     if not client:
         logger.error("OpenAI client not initialized.")
-        return "I'm not able to respond right now. Please check your API key."
-    
+        yield "I'm not able to respond right now. Please check your API key."
+        return
+
     # Build a prompt for the AI to generate a response
     prompt = _build_response_prompt(intent, parameters, result, success)
-    
-    try:
-        logger.info(f"🤖 Generating response for intent: {intent}")
-        
-        response = await client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are a friendly voice assistant. Generate a short, natural response (1-2 sentences max) 
-                    to confirm an action was completed. Be conversational and warm."""
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.7,  # Slightly higher for natural variation
-            max_tokens=100
-        )
-        
-        response_text = response.choices[0].message.content.strip()
-        logger.info(f"✅ Generated response: {response_text}")
-        
-        return response_text
-    
-    except Exception as e:
-        logger.error(f"Error generating response: {str(e)}")
-        return _fallback_response(intent, parameters, success)
+
+    logger.info(f"🤖 Generating response for intent: {intent}")
+
+    response = await client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": SYSTEM_MESSAGE
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        temperature=0.7,  # Slightly higher for natural variation
+        max_tokens=100,
+        stream=True
+    )
+
+    async for chunk in response:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
+
+
+_SENTENCE_END = re.compile(r'([.!?]["\')\]]?\s)')
+
+
+async def stream_sentences(stream: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Regroup a token stream into complete sentences.
+
+    TTS consumers should iterate this instead of the raw deltas: each
+    yielded string ends at a sentence boundary, so synthesis can start
+    on the first sentence before generation finishes.
+    """
+    buffer = ""
+    async for delta in stream:
+        buffer += delta
+        while True:
+            match = _SENTENCE_END.search(buffer)
+            if not match:
+                break
+            cut = match.end()
+            sentence = buffer[:cut].strip()
+            buffer = buffer[cut:]
+            if sentence:
+                yield sentence
+    tail = buffer.strip()
+    if tail:
+        yield tail
 
 
 def _build_response_prompt(
@@ -146,38 +317,76 @@ def _build_response_prompt(
         return f"""Generate a brief, friendly response confirming the action was completed."""
 
 
-def _fallback_response(intent: str, parameters: Dict[str, Any], success: bool) -> str:
+# A few phrasings per intent so back-to-back confirmations don't sound
+# robotic; picked by hash of the parameters, so the same command always
+# gets the same wording (cache- and test-friendly)
+_RESPONSE_TEMPLATES = {
+    "create_event": [
+        "Added {title} to your calendar on {date} at {time}.",
+        "Done - {title} is booked for {date} at {time}.",
+        "{title} is on your calendar for {date} at {time}.",
+    ],
+    "delete_event": [
+        "Deleted {title} from your calendar.",
+        "Done - {title} has been removed.",
+        "{title} is off your calendar.",
+    ],
+    "show_events": [
+        "Here's what's on your calendar.",
+        "Here's your schedule.",
+        "This is what you have coming up.",
+    ],
+}
+
+
+def _fallback_response(
+    intent: str,
+    parameters: Dict[str, Any],
+    success: bool,
+    result: Optional[Dict[str, Any]] = None
+) -> str:
     """
-    Fallback responses when AI fails.
-    
+    Deterministic template responses (primary path, and the fallback
+    when the AI errors).
+
     Args:
         intent: The intent
         parameters: Extracted parameters
         success: Whether it succeeded
-    
+        result: Execution result (for event counts)
+
     Returns:
-        str: Fallback response
+        str: Templated response
     """
-    
+
     if not success:
         return "Sorry, something went wrong. Please try again."
-    
-    if intent == "create_event":
-        title = parameters.get("title", "event")
-        date = parameters.get("date", "")
-        time = parameters.get("time", "")
-        return f"Added {title} to your calendar on {date} at {time}."
-    
-    elif intent == "delete_event":
-        title = parameters.get("event_title", "event")
-        return f"Deleted {title} from your calendar."
-    
-    elif intent == "show_events":
-        return "Here's what's on your calendar."
-    
-    else:
+
+    templates = _RESPONSE_TEMPLATES.get(intent)
+    if templates is None:
         return "Done!"
 
+    slots = {
+        "title": parameters.get("title")
+                 or parameters.get("event_title") or "your event",
+        "date": parameters.get("date", "the scheduled date"),
+        "time": parameters.get("time", "the scheduled time"),
+    }
+    choice = hash(tuple(sorted(str(v) for v in parameters.values())))
+    template = templates[choice % len(templates)]
+
+    if intent == "show_events" and result:
+        count = result.get("event_count")
+        if count == 0:
+            return "You have nothing scheduled for {}.".format(
+                parameters.get("date_range", "that time"))
+        if count:
+            return "You have {} event{} scheduled for {}.".format(
+                count, "" if count == 1 else "s",
+                parameters.get("date_range", "that time"))
+
+    return template.format(**slots)
+
 
 def generate_response_sync(
     intent: str,
@@ -197,17 +406,10 @@ def generate_response_sync(
     Returns:
         str: Natural language response
     """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, generate_response(intent, parameters, result, success))
-                return future.result()
-        else:
-            return asyncio.run(generate_response(intent, parameters, result, success))
-    except RuntimeError:
-        return asyncio.run(generate_response(intent, parameters, result, success))
+    # Run on the shared background loop so the AsyncOpenAI client's
+    # keep-alive connections survive between sync calls
+    from async_runner import run_sync
+    return run_sync(generate_response(intent, parameters, result, success))
 
 
 # Example usage
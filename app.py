@@ -4,13 +4,25 @@ Registers all blueprints and handles application setup
 """
 
 import os
+
+# Under gevent workers the stdlib must be patched before anything else
+# imports socket/ssl/threading, or blocking calls pin the event loop
+if os.environ.get('WSGI_SERVER') == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
 import json
 import secrets
+import hashlib
 import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict
+import time
+import itertools
+from collections import defaultdict, deque
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_from_directory, abort
+from flask import Flask, g, render_template, request, jsonify, session, redirect, url_for, send_from_directory, abort
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -28,22 +40,20 @@ except ImportError:
 # In production, ALWAYS use HTTPS
 os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
 
-# Import blueprints
+# Import blueprints (ai_bp is imported at registration time so
+# ENABLE_AI=0 skips its module tree entirely)
 from src.auth_blueprint import auth_bp
 from src.calendar_blueprint import calendar_bp
 from src.voice_blueprint import voice_bp
-from src.ai_blueprint import ai_bp
 
-# Import existing modules
+# Keep ./src on the path for modules the blueprints import lazily.
+# The heavy helpers (book, get_details, voice_handler, recommender,
+# voice_parser, calendar_actions) are no longer imported here: nothing
+# in this file uses them at module level, and loading them anyway cost
+# tens of MB of RSS per gunicorn worker. Views that need one import it
+# locally.
 import sys
 sys.path.insert(0, './src')
-import book
-import get_details
-import voice_handler
-import src.recommender as recommender
-from src.scheduler_handler import SchedulerCommandHandler, create_scheduler_endpoints
-from src.ai.voice_parser import parse_transcript, normalize_transcript
-from src.actions.calendar_actions import create_event, get_events, cancel_event
 
 # Defer importing the optional AI module to runtime to avoid blocking imports (e.g., when openai is not installed)
 initialize_chatbot = None
@@ -53,47 +63,164 @@ is_chatgpt_available = lambda: False
 app = Flask(__name__, template_folder='templates', static_folder='static')
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', secrets.token_hex(16))
 
+# orjson for jsonify/get_json when available (2-5x faster than stdlib)
+from src.json_provider import init_orjson
+init_orjson(app)
+
 # Configure session security
 app.config['SESSION_COOKIE_SECURE'] = os.environ.get('ENV', 'development') == 'production'
 app.config['SESSION_COOKIE_HTTPONLY'] = True
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=7)
 
+# Server-side sessions: the signed cookie carried the OAuth tokens on
+# every request (multi-KB payload, HMAC verify + JSON decode each
+# time). With Flask-Session + Redis the cookie shrinks to a session id,
+# tokens stay server-side, and sessions are shared across workers.
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis as _session_redis
+        from flask_session import Session
+        app.config.update(
+            SESSION_TYPE='redis',
+            SESSION_REDIS=_session_redis.Redis.from_url(
+                os.environ['REDIS_URL']),
+            SESSION_USE_SIGNER=True,
+            SESSION_PERMANENT=True,
+        )
+        Session(app)
+    except ImportError as e:
+        print(f"[WARN] Flask-Session unavailable, using cookie sessions: {e}")
+
 # Get OpenAI model from environment
 OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-3.5-turbo')
 
-# Voice command logging setup
+# Voice command logging setup: request threads only enqueue records
+# (~µs); a background QueueListener thread does the disk write + flush
+# so no view ever blocks on the log file
 os.makedirs('logs', exist_ok=True)
-logging.basicConfig(
-    filename='logs/voice.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_log_queue = queue.Queue(-1)
+_log_file_handler = RotatingFileHandler(
+    'logs/voice.log', maxBytes=10_000_000, backupCount=3)
+_log_file_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 voice_logger = logging.getLogger('voice_assistant')
 
-# Rate limiting: track requests per user per minute
-rate_limit_tracker = defaultdict(list)
+# Rate limiting: 60 one-second integer buckets per user instead of a
+# per-request timestamp list - O(1) increment + O(60) int sum per call,
+# ~500B per user, and no datetime construction on the hot path
+rate_limit_tracker = defaultdict(
+    lambda: {'buckets': deque([0] * 60, maxlen=60), 'last_sec': 0})
 MAX_REQUESTS_PER_MINUTE = 60
+RATE_LIMIT_WINDOW_MS = 60_000
+
+# Amortized GC: every 10k checks, drop users idle for a full window so
+# the tracker stays bounded in long-running processes
+_rate_limit_gc_counter = itertools.count()
+_RATE_LIMIT_GC_EVERY = 10_000
+
+# Redis sliding window (preferred): correct across gunicorn workers and
+# bounded by TTL, unlike the per-process tracker. One Lua script does
+# trim + count + add + expire atomically in a single round trip.
+try:
+    import redis as _redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    _redis = None
+    REDIS_AVAILABLE = False
+
+_RATE_LIMIT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1] - ARGV[2])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[1])
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+_rate_limit_script = None
+if REDIS_AVAILABLE and os.environ.get('REDIS_URL'):
+    try:
+        _redis_client = _redis.Redis.from_url(
+            os.environ['REDIS_URL'], socket_timeout=0.2)
+        _rate_limit_script = _redis_client.register_script(_RATE_LIMIT_LUA)
+    except Exception as e:
+        print(f"[WARN] Redis rate limiting unavailable: {e}")
+        _rate_limit_script = None
+
 
 def check_rate_limit(user_id: str) -> bool:
     """Check if user has exceeded rate limit (60 requests/minute)"""
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(minutes=1)
+    if _rate_limit_script is not None:
+        try:
+            now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+            allowed = _rate_limit_script(
+                keys=[f"rl:{user_id}"],
+                args=[now_ms, RATE_LIMIT_WINDOW_MS, MAX_REQUESTS_PER_MINUTE])
+            return bool(allowed)
+        except Exception as e:
+            voice_logger.warning("Redis rate limit check failed: %s", e)
+            # fall through to the in-process tracker
+
+    sec = int(time.monotonic())
+
+    # Counter-triggered sweep keeps the sweep off the hot path
+    if next(_rate_limit_gc_counter) % _RATE_LIMIT_GC_EVERY == 0:
+        for uid, stale in list(rate_limit_tracker.items()):
+            if sec - stale['last_sec'] > 60:
+                del rate_limit_tracker[uid]
+
+    entry = rate_limit_tracker[user_id]
+    buckets = entry['buckets']
 
-    # Clean old requests
-    rate_limit_tracker[user_id] = [
-        req_time for req_time in rate_limit_tracker[user_id]
-        if req_time > cutoff
-    ]
+    # Roll the window forward: one zero per elapsed second (capped at
+    # the window size - the deque drops the oldest buckets itself)
+    elapsed = sec - entry['last_sec']
+    if elapsed > 0:
+        buckets.extend([0] * min(elapsed, 60))
+        entry['last_sec'] = sec
 
     # Check limit
-    if len(rate_limit_tracker[user_id]) >= MAX_REQUESTS_PER_MINUTE:
+    if sum(buckets) >= MAX_REQUESTS_PER_MINUTE:
         return False
 
     # Add current request
-    rate_limit_tracker[user_id].append(now)
+    buckets[-1] += 1
     return True
 
+
+@app.before_request
+def enforce_rate_limit():
+    """Centralized rate limiting before routing.
+
+    Enforced here rather than per-view so a new endpoint can't silently
+    bypass it; over-limit traffic is rejected before any view runs.
+    """
+    if request.endpoint in (None, 'static'):
+        return
+    user_id = session.get('user_email') or request.remote_addr
+    if not check_rate_limit(user_id):
+        abort(429)
+    g._rate_limit_user = user_id
+
+
+@app.after_request
+def add_rate_limit_headers(response):
+    """Tell clients how much budget is left (best effort: the exact
+    count lives in Redis when configured; this reads the local view)."""
+    user_id = g.get('_rate_limit_user')
+    if user_id is not None and user_id in rate_limit_tracker:
+        used = sum(rate_limit_tracker[user_id]['buckets'])
+        response.headers['X-RateLimit-Remaining'] = str(
+            max(0, MAX_REQUESTS_PER_MINUTE - used))
+    return response
+
+
 # Google OAuth configuration
 SCOPES = [
     # Use the canonical userinfo scopes to match what Google's token endpoint returns
@@ -113,8 +240,38 @@ for f in os.listdir('.config'):
 if not CLIENT_SECRET_FILE:
     print("⚠️  Warning: client_secret JSON not found in .config/")
 
+# Service objects keyed on a digest of the access token: building one
+# parses the bundled discovery document (tens of ms of JSON + object
+# graph), which is pure waste when repeated for the same token. Keyed
+# on sha1 so raw OAuth tokens never sit in a module-level dict.
+_calendar_service_cache = {}
+_CALENDAR_SERVICE_CACHE_MAX = 32
+
+
+def _build_calendar_service(token):
+    """Return a (possibly cached) Calendar service for an access token."""
+    digest = hashlib.sha1(token.encode()).hexdigest()
+    service = _calendar_service_cache.get(digest)
+    if service is None:
+        creds = Credentials(token=token)
+        # static_discovery: use the discovery doc shipped with the
+        # client library instead of fetching it over HTTP per build
+        service = build('calendar', 'v3', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
+        if len(_calendar_service_cache) >= _CALENDAR_SERVICE_CACHE_MAX:
+            _calendar_service_cache.clear()
+        _calendar_service_cache[digest] = service
+    return service
+
+
 def get_calendar_service(access_token=None):
-    """Build and return a Google Calendar service with current credentials."""
+    """Build and return a Google Calendar service with current credentials.
+
+    The service is reused via flask.g within a request and via a
+    per-token cache across requests, so handlers that call this more
+    than once (or the same user hitting several endpoints) don't
+    rebuild the API client each time.
+    """
     if not access_token and 'access_token' not in session:
         return None
 
@@ -122,25 +279,39 @@ def get_calendar_service(access_token=None):
     if not token:
         return None
 
+    # per-request reuse for the session-token path
+    if access_token is None:
+        cached = g.get('_calendar_service')
+        if cached is not None:
+            return cached
+
     try:
-        creds = Credentials(token=token)
-        service = build('calendar', 'v3', credentials=creds)
-        return service
+        service = _build_calendar_service(token)
     except Exception as e:
         print(f"Error building service: {e}")
         return None
 
+    if access_token is None:
+        g._calendar_service = service
+    return service
+
 # Register blueprints
 app.register_blueprint(auth_bp)
 app.register_blueprint(calendar_bp)
 app.register_blueprint(voice_bp)
-app.register_blueprint(ai_bp)
+
+# AI blueprint is the heaviest (semantic cache, chatbot); deployments
+# that don't use it can drop it (and its memory) with ENABLE_AI=0
+if os.environ.get('ENABLE_AI', '1') == '1':
+    from src.ai_blueprint import ai_bp
+    app.register_blueprint(ai_bp)
 
 # Initialize Smart Scheduler (Optional - for web-first architecture)
 # NOTE: Smart Scheduler and optional AI features are disabled for web deployment
 scheduler_handler = None
 # Uncomment below to enable optional AI scheduler features:
 # try:
+#     from src.scheduler_handler import SchedulerCommandHandler, create_scheduler_endpoints
 #     scheduler_handler = SchedulerCommandHandler()
 #     create_scheduler_endpoints(app, scheduler_handler)
 #     print("[INFO] Smart Scheduler initialized and endpoints registered")
@@ -22,11 +22,16 @@ Everything goes through the AI model first.
 import os
 import json
 import secrets
+import hashlib
 import logging
-import asyncio
+import queue
+import atexit
+import time
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Flask, g, render_template, request, jsonify, session, redirect, url_for
 from flask_cors import CORS
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.credentials import Credentials
@@ -34,6 +39,7 @@ from google.oauth2.credentials import Credentials
 # Import our AI and calendar modules
 import ai_intent_handler
 import ai_response
+from async_runner import run_sync
 from calendar_service import GoogleCalendarService
 import voice_utils
 
@@ -44,22 +50,56 @@ try:
 except ImportError:
     pass
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: request threads only enqueue records (~µs); the
+# QueueListener thread does the actual write + flush off-thread
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # =====================================================
 # FLASK SETUP
 # =====================================================
 
+# Environment resolved once at import: these were re-read (dict get +
+# lowercase pass) inside views on every request
+DEBUG_MODE = os.environ.get('DEBUG', 'True').lower() == 'true'
+OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
+FLASK_RUN_PORT = int(os.environ.get('FLASK_RUN_PORT', 5000))
+
 app = Flask(__name__, template_folder='templates', static_folder='static')
 app.secret_key = os.environ.get('FLASK_SECRET', secrets.token_hex(32))
+
+# orjson for jsonify/get_json when available (2-5x faster than stdlib)
+from src.json_provider import init_orjson
+init_orjson(app)
 app.config['SESSION_COOKIE_HTTPONLY'] = True
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 
+# Server-side sessions when Redis is configured: the OAuth tokens stay
+# out of the cookie (smaller request headers, no HMAC-verify + JSON
+# decode of a multi-KB payload per request) and sessions survive worker
+# restarts. Without REDIS_URL we keep the default signed-cookie store.
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis as _session_redis
+        from flask_session import Session
+        app.config.update(
+            SESSION_TYPE='redis',
+            SESSION_REDIS=_session_redis.Redis.from_url(
+                os.environ['REDIS_URL']),
+            SESSION_USE_SIGNER=True,
+            SESSION_PERMANENT=True,
+        )
+        Session(app)
+    except ImportError as e:
+        logger.warning("Flask-Session unavailable, using cookie sessions: %s", e)
+
 CORS(app)
 
 # Unsafe for dev only
@@ -84,7 +124,22 @@ if os.path.exists('.config'):
             CLIENT_SECRET_FILE = os.path.join('.config', f)
             break
 
-logger.info(f"🔐 Google OAuth Client Secret: {CLIENT_SECRET_FILE}")
+logger.info("🔐 Google OAuth Client Secret: %s", CLIENT_SECRET_FILE)
+
+# Parse the client secret once at import; the OAuth routes use
+# Flow.from_client_config so each login doesn't re-open and re-parse
+# the JSON file
+CLIENT_CFG = None
+if CLIENT_SECRET_FILE:
+    try:
+        with open(CLIENT_SECRET_FILE) as fh:
+            CLIENT_CFG = json.load(fh)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not parse %s: %s", CLIENT_SECRET_FILE, e)
+
+# Shared Flow constructor arguments, assembled once so the per-login
+# calls only add what varies (redirect_uri, state)
+_FLOW_KWARGS = dict(client_config=CLIENT_CFG, scopes=SCOPES)
 
 # =====================================================
 # GLOBAL CALENDAR SERVICE
@@ -93,40 +148,134 @@ logger.info(f"🔐 Google OAuth Client Secret: {CLIENT_SECRET_FILE}")
 calendar_service = None
 
 
+@app.before_request
+def load_session_identity():
+    """Deserialize the session once per request into flask.g.
+
+    Every @login_required view (and several helpers) used to hit the
+    session mapping separately; with server-side sessions each access
+    is a store lookup. One read here, then everything checks g.
+    """
+    g.user = session.get('user_email')
+    g.token = session.get('access_token')
+
+
 def login_required(f):
     """Decorator for protected routes"""
     from functools import wraps
-    
+
     @wraps(f)
     def decorated(*args, **kwargs):
-        if 'access_token' not in session:
+        if g.token is None:
             return redirect(url_for('login'))
         return f(*args, **kwargs)
     return decorated
 
 
+# Cache wrappers per access token (keyed on sha1 so raw tokens never
+# sit in a module dict): building the service parses the discovery
+# document each time, which every protected route was paying on entry.
+_calendar_service_cache = {}
+_CALENDAR_SERVICE_CACHE_MAX = 32
+
+# Worker pool for speculative event prefetch during AI interpretation
+_prefetch_executor = ThreadPoolExecutor(max_workers=2)
+
+# Short-TTL response cache for /api/events: the dashboard polls this
+# endpoint and the calendar rarely changes between polls, so most polls
+# can be answered with a 304 (or a cached body) instead of a ~200ms
+# Google round trip. Redis when configured, in-process dict otherwise.
+_EVENTS_CACHE_TTL = 60
+
+_events_cache_redis = None
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis as _events_redis
+        _events_cache_redis = _events_redis.Redis.from_url(
+            os.environ['REDIS_URL'], socket_timeout=0.2)
+    except Exception as e:
+        logger.warning("Redis events cache unavailable: %s", e)
+
+_events_cache_local = {}  # user -> (expires_at, etag, payload)
+
+
+def _events_cache_get(user):
+    """Return (etag, payload) for user, or None when cold/expired."""
+    if _events_cache_redis is not None:
+        try:
+            raw = _events_cache_redis.get(f"events:{user}")
+            if raw:
+                etag, _, payload = raw.decode().partition('|')
+                return etag, payload
+            return None
+        except Exception as e:
+            logger.warning("Events cache read failed: %s", e)
+    entry = _events_cache_local.get(user)
+    if entry and entry[0] > time.monotonic():
+        return entry[1], entry[2]
+    return None
+
+
+def _events_cache_set(user, etag, payload):
+    if _events_cache_redis is not None:
+        try:
+            _events_cache_redis.setex(
+                f"events:{user}", _EVENTS_CACHE_TTL, etag + '|' + payload)
+            return
+        except Exception as e:
+            logger.warning("Events cache write failed: %s", e)
+    _events_cache_local[user] = (
+        time.monotonic() + _EVENTS_CACHE_TTL, etag, payload)
+
+
+def _events_cache_invalidate(user):
+    """Drop the cached event list after a mutation so polls see it."""
+    if _events_cache_redis is not None:
+        try:
+            _events_cache_redis.delete(f"events:{user}")
+        except Exception:
+            pass
+    _events_cache_local.pop(user, None)
+
+
 def get_calendar_service() -> GoogleCalendarService:
     """
     Get authenticated Google Calendar service.
-    Creates new instance if credentials available.
-    
+
+    Reused via flask.g within a request and via a per-token cache
+    across requests, so a new API client is only built when the
+    access token actually changes.
+
     Returns:
         GoogleCalendarService: Calendar API wrapper
     """
-    if 'access_token' not in session:
-        return None
-    
-    try:
-        creds = Credentials(
-            token=session.get('access_token'),
-            refresh_token=session.get('refresh_token')
-        )
-        service = GoogleCalendarService(CLIENT_SECRET_FILE, creds)
-        return service
-    except Exception as e:
-        logger.error(f"Failed to get calendar service: {str(e)}")
+    token = g.get('token') or session.get('access_token')
+    if not token:
         return None
 
+    cached = g.get('_calendar_service')
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha1(token.encode()).hexdigest()
+    service = _calendar_service_cache.get(digest)
+    if service is None:
+        try:
+            creds = Credentials(
+                token=token,
+                refresh_token=session.get('refresh_token')
+            )
+            service = GoogleCalendarService(CLIENT_SECRET_FILE, creds)
+        except Exception as e:
+            logger.error("Failed to get calendar service: %s", str(e))
+            return None
+        if len(_calendar_service_cache) >= _CALENDAR_SERVICE_CACHE_MAX:
+            _calendar_service_cache.clear()
+        _calendar_service_cache[digest] = service
+
+    g._calendar_service = service
+    return service
+
 
 # =====================================================
 # ROUTES - AUTHENTICATION
@@ -151,36 +300,34 @@ def login():
 @app.route('/auth/login')
 def auth_login():
     """Initiate Google OAuth flow"""
-    if not CLIENT_SECRET_FILE:
+    if not CLIENT_CFG:
         return jsonify({'error': 'Google OAuth not configured'}), 500
-    
+
     try:
-        flow = Flow.from_client_secrets_file(
-            CLIENT_SECRET_FILE,
-            scopes=SCOPES,
+        flow = Flow.from_client_config(
+            **_FLOW_KWARGS,
             redirect_uri=url_for('oauth_callback', _external=True)
         )
         auth_url, state = flow.authorization_url(prompt='select_account')
         session['oauth_state'] = state
         
-        logger.info(f"🔐 Initiating OAuth flow")
+        logger.info("🔐 Initiating OAuth flow")
         return redirect(auth_url)
     except Exception as e:
-        logger.error(f"OAuth error: {str(e)}")
+        logger.error("OAuth error: %s", str(e))
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/oauth2callback')
 def oauth_callback():
     """Handle Google OAuth callback"""
-    if not CLIENT_SECRET_FILE:
+    if not CLIENT_CFG:
         return 'Error: Google OAuth not configured', 500
-    
+
     try:
         state = session.get('oauth_state')
-        flow = Flow.from_client_secrets_file(
-            CLIENT_SECRET_FILE,
-            scopes=SCOPES,
+        flow = Flow.from_client_config(
+            **_FLOW_KWARGS,
             state=state,
             redirect_uri=url_for('oauth_callback', _external=True)
         )
@@ -193,15 +340,16 @@ def oauth_callback():
         
         # Get user info
         from googleapiclient.discovery import build
-        service = build('oauth2', 'v2', credentials=creds)
+        service = build('oauth2', 'v2', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
         user_info = service.userinfo().get().execute()
         session['user_email'] = user_info.get('email')
         
-        logger.info(f"✅ User authenticated: {session['user_email']}")
+        logger.info("✅ User authenticated: %s", session['user_email'])
         
         return redirect(url_for('home'))
     except Exception as e:
-        logger.error(f"OAuth callback error: {str(e)}")
+        logger.error("OAuth callback error: %s", str(e))
         return f'Authentication failed: {str(e)}', 400
 
 
@@ -222,7 +370,7 @@ def home():
     """Main dashboard"""
     return render_template('index.html', 
                          user_email=session.get('user_email'),
-                         debug_mode=os.environ.get('DEBUG', 'True').lower() == 'true')
+                         debug_mode=DEBUG_MODE)
 
 
 # =====================================================
@@ -239,21 +387,46 @@ def get_events():
         {success: bool, events: [...], error: str}
     """
     try:
+        user = g.user or 'anonymous'
+        if_none_match = request.headers.get('If-None-Match')
+
+        cached = _events_cache_get(user)
+        if cached:
+            etag, payload = cached
+            if if_none_match == etag:
+                return '', 304, {'ETag': etag}
+            response = app.response_class(
+                payload, mimetype='application/json')
+            response.headers['ETag'] = etag
+            return response
+
         service = get_calendar_service()
         if not service:
             return jsonify({'error': 'Calendar service unavailable', 'events': []}), 500
-        
-        events = service.get_events(max_results=30)
-        
-        logger.info(f"📅 Retrieved {len(events)} events")
-        return jsonify({
+
+        # incremental sync: only the delta since the last poll comes
+        # back from Google (usually nothing)
+        events = service.get_events_synced(user, max_results=30)
+
+        logger.info("📅 Retrieved %s events", len(events))
+        payload = app.json.dumps({
             'success': True,
             'events': events,
             'count': len(events)
         })
-    
+        etag = hashlib.md5(payload.encode()).hexdigest()
+        _events_cache_set(user, etag, payload)
+
+        # identical list as last poll: headers only, no body
+        if if_none_match == etag:
+            return '', 304, {'ETag': etag}
+
+        response = app.response_class(payload, mimetype='application/json')
+        response.headers['ETag'] = etag
+        return response
+
     except Exception as e:
-        logger.error(f"Error fetching events: {str(e)}")
+        logger.error("Error fetching events: %s", str(e))
         return jsonify({'error': str(e), 'events': []}), 500
 
 
@@ -323,23 +496,43 @@ def process_command():
                 'intent': 'error'
             }), 400
         
-        logger.info(f"🎤 Processing command: '{transcript}'")
+        logger.info("🎤 Processing command: '%s'", transcript)
         
         # =====================================================
         # STEP 1: AI INTERPRETATION
         # =====================================================
         # The AI reads the transcript and decides what the user wants
         
-        ai_result = asyncio.run(ai_intent_handler.interpret(transcript))
+        # Speculative prefetch: show_events and delete_event both need
+        # the event list, so the Google round trip starts on a worker
+        # thread while the AI call is in flight - the slower of the two
+        # sets the wall clock instead of their sum. The service is
+        # resolved here because the worker thread has no session.
+        service = get_calendar_service()
+        _user = g.user or 'anonymous'
+        events_future = (
+            _prefetch_executor.submit(
+                service.get_events_synced, _user, max_results=100)
+            if service else None)
+
+        # Deterministic fast path first: obvious commands ("show my
+        # events", "cancel meeting X") classify locally in microseconds
+        # with no OpenAI round trip and no event-loop handoff.
+        # run_sync submits to the persistent background loop instead of
+        # asyncio.run, so the shared OpenAI client keeps its warm
+        # connections across requests (no per-request loop + TLS setup)
+        ai_result = ai_intent_handler.interpret_fast(transcript)
+        if ai_result is None:
+            ai_result = run_sync(ai_intent_handler.interpret(transcript))
         
         intent = ai_result.get('intent', 'unknown')
         parameters = ai_result.get('parameters', {})
         confidence = ai_result.get('confidence', 0.0)
         
-        logger.info(f"🤖 AI decided: intent='{intent}', confidence={confidence:.2f}")
+        logger.info("🤖 AI decided: intent='%s', confidence=%.2f", intent, confidence)
         
         if not ai_result.get('success', False):
-            logger.warning(f"⚠️ AI uncertain about intent")
+            logger.warning("⚠️ AI uncertain about intent")
             return jsonify({
                 'success': False,
                 'intent': intent,
@@ -352,21 +545,29 @@ def process_command():
         # =====================================================
         # Based on what the AI decided, execute the action
         
-        execution_result = _execute_intent(intent, parameters)
+        execution_result = _execute_intent(intent, parameters,
+                                           service=service,
+                                           events_future=events_future)
+
+        # A successful mutation makes the cached /api/events response
+        # stale; drop it so the next dashboard poll refetches
+        if (execution_result.get('success')
+                and intent in ('create_event', 'delete_event')):
+            _events_cache_invalidate(g.user or 'anonymous')
         
         # =====================================================
         # STEP 3: GENERATE NATURAL RESPONSE
         # =====================================================
         # Use AI to create a friendly response
         
-        ai_response_text = asyncio.run(ai_response.generate_response(
+        ai_response_text = run_sync(ai_response.generate_response(
             intent=intent,
             parameters=parameters,
             result=execution_result,
             success=execution_result.get('success', False)
         ))
         
-        logger.info(f"💬 AI Response: '{ai_response_text}'")
+        logger.info("💬 AI Response: '%s'", ai_response_text)
         
         # =====================================================
         # STEP 4: RETURN TO FRONTEND
@@ -382,12 +583,12 @@ def process_command():
             # Debug info (only in dev mode)
             'debug': {
                 'raw_ai_output': ai_result,
-                'debug_mode': os.environ.get('DEBUG', 'False').lower() == 'true'
+                'debug_mode': DEBUG_MODE
             }
         })
     
     except Exception as e:
-        logger.error(f"Error processing command: {str(e)}")
+        logger.error("Error processing command: %s", str(e))
         return jsonify({
             'success': False,
             'error': str(e),
@@ -395,22 +596,39 @@ def process_command():
         }), 500
 
 
-def _execute_intent(intent: str, parameters: dict) -> dict:
+def _resolve_prefetch(events_future):
+    """Collect a prefetched event list, or None if it failed/is absent."""
+    if events_future is None:
+        return None
+    try:
+        return events_future.result(timeout=10)
+    except Exception as e:
+        logger.warning("Event prefetch failed: %s", e)
+        return None
+
+
+def _execute_intent(intent: str, parameters: dict,
+                    service=None, events_future=None) -> dict:
     """
     Execute the action based on AI-determined intent.
-    
+
     This is where the AI's decision is turned into action.
-    
+
     Args:
         intent (str): "create_event", "delete_event", "show_events"
         parameters (dict): Intent-specific parameters
-    
+        service: Optional pre-resolved GoogleCalendarService
+        events_future: Optional future for a speculatively prefetched
+                       event list (used by show/delete, cancelled by
+                       create)
+
     Returns:
         dict: Execution result with success status and details
     """
-    
+
     try:
-        service = get_calendar_service()
+        if service is None:
+            service = get_calendar_service()
         if not service:
             return {'success': False, 'error': 'Calendar service unavailable'}
         
@@ -418,6 +636,29 @@ def _execute_intent(intent: str, parameters: dict) -> dict:
         # CREATE EVENT
         # =====================================================
         if intent == 'create_event':
+            # the speculative fetch is useless here
+            if events_future is not None:
+                events_future.cancel()
+
+            # Multi-event transcripts ("book meetings Mon-Fri 9am")
+            # arrive as a list; batch them into one HTTP round trip
+            # instead of one TLS exchange per event
+            event_specs = parameters.get('events')
+            if isinstance(event_specs, list) and event_specs:
+                outcomes = service.create_events_batch(event_specs)
+                created = [o['event'] for o in outcomes.values()
+                           if o.get('success')]
+                errors = [o['error'] for o in outcomes.values()
+                          if not o.get('success')]
+                return {
+                    'success': bool(created),
+                    'created_count': len(created),
+                    'events': created,
+                    'errors': errors,
+                    'message': f"✅ Created {len(created)} of "
+                               f"{len(event_specs)} events"
+                }
+
             title = parameters.get('title', 'Untitled')
             date = parameters.get('date')
             time = parameters.get('time', '09:00')
@@ -430,7 +671,7 @@ def _execute_intent(intent: str, parameters: dict) -> dict:
             if not voice_utils.is_valid_date(date) or not voice_utils.is_valid_time(time):
                 return {'success': False, 'error': 'Invalid date or time format'}
             
-            logger.info(f"📝 Creating event: '{title}' on {date} at {time}")
+            logger.info("📝 Creating event: '%s' on %s at %s", title, date, time)
             
             result = service.create_event(
                 title=title,
@@ -460,10 +701,12 @@ def _execute_intent(intent: str, parameters: dict) -> dict:
             if not event_title:
                 return {'success': False, 'error': 'No event title provided'}
             
-            logger.info(f"🗑️ Deleting event: '{event_title}'")
+            logger.info("🗑️ Deleting event: '%s'", event_title)
             
-            # Find event by title
-            event = service.find_event_by_title(event_title)
+            # Find event by title (searching the prefetched list when
+            # the speculative fetch landed)
+            event = service.find_event_by_title(
+                event_title, events=_resolve_prefetch(events_future))
             
             if not event:
                 return {'success': False, 'error': f"Event '{event_title}' not found"}
@@ -486,9 +729,13 @@ def _execute_intent(intent: str, parameters: dict) -> dict:
         elif intent == 'show_events':
             date_range = parameters.get('date_range', 'today')
             
-            logger.info(f"📅 Fetching events for: {date_range}")
-            
-            events = service.get_events()
+            logger.info("📅 Fetching events for: %s", date_range)
+
+            events = _resolve_prefetch(events_future)
+            if events is None:
+                events = service.get_events()
+            else:
+                events = events[:20]  # match get_events' default page size
             
             return {
                 'success': True,
@@ -501,14 +748,14 @@ def _execute_intent(intent: str, parameters: dict) -> dict:
         # UNKNOWN INTENT
         # =====================================================
         else:
-            logger.warning(f"⚠️ Unknown intent: {intent}")
+            logger.warning("⚠️ Unknown intent: %s", intent)
             return {
                 'success': False,
                 'error': f"Unknown intent: {intent}"
             }
     
     except Exception as e:
-        logger.error(f"Error executing intent: {str(e)}")
+        logger.error("Error executing intent: %s", str(e))
         return {
             'success': False,
             'error': str(e)
@@ -526,7 +773,7 @@ def not_found(e):
 
 @app.errorhandler(500)
 def server_error(e):
-    logger.error(f"Server error: {str(e)}")
+    logger.error("Server error: %s", str(e))
     return jsonify({'error': 'Server error'}), 500
 
 
@@ -539,12 +786,12 @@ if __name__ == '__main__':
     logger.info("🚀 Voice Assistant Calendar - AI Powered")
     logger.info("=" * 60)
     logger.info("AI Integration: ✅ Enabled")
-    logger.info(f"OpenAI Model: {os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')}")
-    logger.info(f"Debug Mode: {os.environ.get('DEBUG', 'True')}")
+    logger.info("OpenAI Model: %s", OPENAI_MODEL)
+    logger.info("Debug Mode: %s", DEBUG_MODE)
     logger.info("=" * 60)
-    
+
     app.run(
         host='0.0.0.0',
-        port=int(os.environ.get('FLASK_RUN_PORT', 5000)),
-        debug=os.environ.get('DEBUG', 'True').lower() == 'true'
+        port=FLASK_RUN_PORT,
+        debug=DEBUG_MODE
     )
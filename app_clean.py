@@ -4,14 +4,29 @@ Minimal setup with Google Calendar integration and OpenAI
 """
 
 import os
+
+# Under gevent workers the stdlib must be patched before anything else
+# imports socket/ssl/threading, or blocking calls pin the event loop
+if os.environ.get('WSGI_SERVER') == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+import glob
+import hmac
 import json
+import hashlib
 import secrets
-from datetime import datetime, timedelta
-
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+
+import httplib2
+from flask import Flask, Response, render_template, request, jsonify, session, redirect, url_for
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 # Load environment
 try:
@@ -25,9 +40,33 @@ os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
 # Initialize Flask
 app = Flask(__name__, template_folder='templates', static_folder='static')
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', secrets.token_hex(16))
+
+# orjson for jsonify/get_json when available (2-5x faster than stdlib)
+from src.json_provider import init_orjson
+init_orjson(app)
 app.config['SESSION_COOKIE_HTTPONLY'] = True
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 
+# Server-side sessions: the signed cookie otherwise carries the OAuth
+# tokens on every request (KBs of payload plus HMAC verification).
+# With Flask-Session + Redis the cookie is just a session id, tokens
+# stay in RAM, and gunicorn workers share them.
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis as _session_redis
+        from flask_session import Session
+        app.config.update(
+            SESSION_TYPE='redis',
+            SESSION_REDIS=_session_redis.Redis.from_url(
+                os.environ['REDIS_URL']),
+            SESSION_USE_SIGNER=True,
+            SESSION_PERMANENT=True,
+            PERMANENT_SESSION_LIFETIME=timedelta(hours=1),
+        )
+        Session(app)
+    except ImportError:
+        pass  # cookie sessions still work, just heavier
+
 # Google OAuth config
 SCOPES = [
     'openid',
@@ -36,41 +75,378 @@ SCOPES = [
     'https://www.googleapis.com/auth/calendar'
 ]
 
-CLIENT_SECRET_FILE = None
-for f in os.listdir('.config'):
-    if f.startswith('client_secret') and f.endswith('.json'):
-        CLIENT_SECRET_FILE = os.path.join('.config', f)
-        break
+# Find and parse the client secret once at import: the routes then use
+# Flow.from_client_config, so no OAuth hop re-reads the file from disk
+CLIENT_SECRET_FILE = next(glob.iglob('.config/client_secret*.json'), None)
+CLIENT_CFG = None
+if CLIENT_SECRET_FILE:
+    try:
+        with open(CLIENT_SECRET_FILE) as f:
+            CLIENT_CFG = json.load(f)
+    except:
+        CLIENT_CFG = None
 
-# OpenAI
+# OpenAI (v1 SDK; one client reuses its connection pool across calls)
+OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
 try:
-    import openai
-    openai.api_key = os.environ.get('OPENAI_API_KEY')
-    HAS_OPENAI = bool(openai.api_key)
+    from openai import OpenAI
+    _openai_client = (OpenAI() if os.environ.get('OPENAI_API_KEY')
+                      else None)
+    HAS_OPENAI = _openai_client is not None
 except:
+    _openai_client = None
     HAS_OPENAI = False
 
 
+# Short-TTL cache for /api/get_events: dashboard loads re-hit Google
+# for a list that rarely changes within a minute. Keys carry a per-user
+# version that bumps on every write, so invalidation is one INCR - no
+# SCAN over the keyspace. Redis when configured, in-process otherwise.
+_EVENTS_TTL = 60
+
+_events_redis = None
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis as _redis_mod
+        _events_redis = _redis_mod.Redis.from_url(
+            os.environ['REDIS_URL'], socket_timeout=0.2)
+    except:
+        _events_redis = None
+
+_events_local = {}      # key -> (expires_at, payload)
+_events_ver_local = {}  # user -> version
+
+
+def _events_version(user):
+    if _events_redis is not None:
+        try:
+            v = _events_redis.get(f"events_ver:{user}")
+            return int(v) if v else 0
+        except:
+            pass
+    return _events_ver_local.get(user, 0)
+
+
+def _events_bump_version(user):
+    """Invalidate by versioning: old keys just expire unreferenced."""
+    if _events_redis is not None:
+        try:
+            _events_redis.incr(f"events_ver:{user}")
+            return
+        except:
+            pass
+    _events_ver_local[user] = _events_ver_local.get(user, 0) + 1
+
+
+def _events_cache_fetch(key):
+    if _events_redis is not None:
+        try:
+            raw = _events_redis.get(key)
+            return raw.decode() if raw else None
+        except:
+            pass
+    entry = _events_local.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+# Incremental sync state: per-user syncToken + event map so a cache
+# miss only asks Google for what changed since last time (usually 0-1
+# events) instead of the full upcoming list. 410 Gone resets the state.
+_SYNC_TTL = 24 * 3600
+_sync_local = {}  # user -> {'token': str, 'events': {id: event}}
+
+
+def _sync_state_get(user):
+    if _events_redis is not None:
+        try:
+            raw = _events_redis.get(f"events_sync:{user}")
+            return json.loads(raw) if raw else None
+        except:
+            pass
+    return _sync_local.get(user)
+
+
+def _sync_state_put(user, state):
+    if _events_redis is not None:
+        try:
+            _events_redis.setex(f"events_sync:{user}", _SYNC_TTL,
+                                json.dumps(state))
+            return
+        except:
+            pass
+    _sync_local[user] = state
+
+
+def _sync_state_drop(user):
+    if _events_redis is not None:
+        try:
+            _events_redis.delete(f"events_sync:{user}")
+        except:
+            pass
+    _sync_local.pop(user, None)
+
+
+def _event_is_past(event, now):
+    """True if a simplified event's start is behind now (tz-aware)."""
+    try:
+        dt = datetime.fromisoformat(event['start'].replace('Z', '+00:00'))
+    except (KeyError, ValueError):
+        return False
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt < now
+
+
+def _sync_events(service, user):
+    """Return upcoming events via syncToken deltas, full list on first use."""
+    state = _sync_state_get(user)
+    params = {
+        'calendarId': 'primary',
+        'singleEvents': True,
+        # status is needed to spot deletions in delta responses
+        'fields': 'items(id,status,summary,start/dateTime,start/date),'
+                  'nextPageToken,nextSyncToken'
+    }
+    if state and state.get('token'):
+        params['syncToken'] = state['token']
+    else:
+        state = {'token': None, 'events': {}}
+        params['timeMin'] = datetime.utcnow().isoformat() + 'Z'
+
+    items = []
+    token = None
+    page_token = None
+    try:
+        while True:
+            if page_token:
+                params['pageToken'] = page_token
+            result = service.events().list(**params).execute()
+            items.extend(result.get('items', []))
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                token = result.get('nextSyncToken')
+                break
+    except HttpError as e:
+        if e.resp.status == 410:
+            # token expired server-side: reset and do a full sync
+            _sync_state_drop(user)
+            return _sync_events(service, user)
+        raise
+
+    for event in items:
+        if event.get('status') == 'cancelled':
+            state['events'].pop(event['id'], None)
+            continue
+        start = event['start'].get('dateTime', event['start'].get('date'))
+        state['events'][event['id']] = {
+            'id': event['id'],
+            'title': event.get('summary', 'Untitled'),
+            'start': start,
+            'date': start.split('T')[0] if 'T' in start else start,
+            'time': start.split('T')[1][:5] if 'T' in start else '00:00'
+        }
+    # prune events that have started: deltas include past-event changes
+    # and old entries would otherwise accumulate forever, crowding the
+    # front of the sorted "upcoming" list and shifting page offsets
+    now = datetime.now(timezone.utc)
+    state['events'] = {eid: ev for eid, ev in state['events'].items()
+                       if not _event_is_past(ev, now)}
+    state['token'] = token
+    _sync_state_put(user, state)
+
+    return sorted(state['events'].values(), key=lambda e: e['start'])
+
+
+def _events_cache_store(key, payload):
+    if _events_redis is not None:
+        try:
+            _events_redis.setex(key, _EVENTS_TTL, payload)
+            return
+        except:
+            pass
+    _events_local[key] = (time.monotonic() + _EVENTS_TTL, payload)
+
+
 def login_required(f):
-    from functools import wraps
     @wraps(f)
     def decorated(*args, **kwargs):
-        if 'access_token' not in session:
+        if not session.get('access_token'):
+            # API callers get a bare 401 to handle client-side; only
+            # page routes pay for building the redirect response
+            if request.path.startswith('/api/'):
+                return '', 401
             return redirect(url_for('login'))
         return f(*args, **kwargs)
     return decorated
 
 
+# Calendar services cached per access token (sha1 key so raw tokens
+# never sit in a module dict): build() constructs a heavy resource tree
+# per call, which every /api route was paying. Entries live <50min
+# because the Google tokens themselves expire at 60.
+#
+# Considered and rejected: replacing googleapiclient with a raw
+# httpx.AsyncClient(http2=True) against the REST endpoints. The resource
+# tree is built once per token thanks to this cache, batch and syncToken
+# support come from the client library, and the app is sync Flask under
+# gevent - so the swap would mean hand-rolling auth/batch/paging for a
+# connection-setup saving keep-alive already provides.
+_service_cache = {}  # digest -> (service, created_at)
+_SERVICE_CACHE_MAX = 512
+_SERVICE_TTL_SECONDS = 50 * 60
+
+
 def get_calendar_service():
     """Get authenticated Google Calendar service"""
-    if 'access_token' not in session:
+    token = session.get('access_token')
+    if not token:
         return None
+
+    digest = hashlib.sha1(token.encode()).hexdigest()
+    cached = _service_cache.get(digest)
+    if cached and time.monotonic() - cached[1] < _SERVICE_TTL_SECONDS:
+        return cached[0]
+
     try:
-        creds = Credentials(token=session.get('access_token'))
-        return build('calendar', 'v3', credentials=creds)
+        creds = Credentials(token=token)
+        # Explicit AuthorizedHttp so the service owns one keep-alive
+        # connection to googleapis.com; because the service itself is
+        # cached per token, later calls skip the ~100-200ms TLS setup
+        # instead of handshaking per request. timeout caps a hung call.
+        authed_http = AuthorizedHttp(creds, http=httplib2.Http(timeout=10))
+        service = build('calendar', 'v3', http=authed_http,
+                        cache_discovery=False, static_discovery=True)
     except:
         return None
 
+    if len(_service_cache) >= _SERVICE_CACHE_MAX:
+        # drop the older half in one pass instead of scanning per call
+        oldest = sorted(_service_cache, key=lambda k: _service_cache[k][1])
+        for key in oldest[:_SERVICE_CACHE_MAX // 2]:
+            _service_cache.pop(key, None)
+    _service_cache[digest] = (service, time.monotonic())
+    return service
+
+
+# Shared pool for overlapping independent blocking I/O: the GPT parse
+# with the free/busy probe in voice_book, and the per-50 batch chunks
+# in the bulk endpoints. Sized for I/O waiting, not CPU.
+_executor = ThreadPoolExecutor(max_workers=32)
+
+
+# Parse results cached 24h on a hash of the normalized utterance:
+# repeated commands ("show my meetings") skip the 1-2s GPT round trip
+# and its token cost. temperature=0 below keeps hits lossless.
+_PARSE_TTL = 24 * 3600
+_parse_local = {}  # digest -> (expires_at, (event, message))
+
+# Static prompt template: built once, only the date slot varies. Giving
+# GPT today's date lets it resolve "tomorrow"/"next Friday" itself, so
+# no post-processing pass or clarification retry for relative dates.
+_PARSE_SYSTEM_PROMPT = (
+    'Today is {today}. Extract event title, date (YYYY-MM-DD), and time '
+    '(HH:MM) from user speech, resolving relative dates against today. '
+    'Return JSON: {{"title": "...", "date": "...", "time": "..."}}. If '
+    'incomplete, return JSON: {{"clarification": "<question for the user>"}}.'
+)
+
+
+def _parse_cache_get(digest):
+    if _events_redis is not None:
+        try:
+            raw = _events_redis.get(f"parse:{digest}")
+            if raw:
+                cached = json.loads(raw)
+                return cached['event'], cached['message']
+        except:
+            pass
+    entry = _parse_local.get(digest)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _parse_cache_put(digest, event, message):
+    if _events_redis is not None:
+        try:
+            _events_redis.setex(f"parse:{digest}", _PARSE_TTL,
+                                json.dumps({'event': event,
+                                            'message': message}))
+            return
+        except:
+            pass
+    _parse_local[digest] = (time.monotonic() + _PARSE_TTL, (event, message))
+
+
+def _openai_parse(text):
+    """Extract {'title', 'date', 'time'} from speech via GPT.
+
+    Returns (event_dict, None) on success or (None, message) when the
+    model asked for clarification instead of returning JSON.
+    """
+    # day-scoped digest: "tomorrow" parses differently tomorrow
+    today = datetime.utcnow().date().isoformat()
+    digest = hashlib.sha256(
+        f"{today}|{text.lower().strip()}".encode()).hexdigest()
+    cached = _parse_cache_get(digest)
+    if cached is not None:
+        return cached
+
+    # JSON mode guarantees parseable output, so clarifications come back
+    # as a JSON field rather than free text; 80 tokens fits the schema
+    response = _openai_client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[{
+            'role': 'system',
+            'content': _PARSE_SYSTEM_PROMPT.format(today=today)
+        }, {
+            'role': 'user',
+            'content': text
+        }],
+        temperature=0,
+        max_tokens=80,
+        response_format={'type': 'json_object'}
+    )
+    event = json.loads(response.choices[0].message.content)
+    if 'clarification' in event:
+        parsed = None, event['clarification']
+    else:
+        parsed = {
+            'title': event.get('title', 'Untitled'),
+            'date': event.get('date', ''),
+            'time': event.get('time', '09:00')
+        }, None
+    _parse_cache_put(digest, *parsed)
+    return parsed
+
+
+def _event_body(title, date, start_time):
+    """Build a 1-hour event body; datetime math handles midnight rollover."""
+    start_dt = datetime.fromisoformat(f"{date}T{start_time}:00")
+    end_dt = start_dt + timedelta(hours=1)
+    return {
+        'summary': title,
+        'start': {'dateTime': start_dt.isoformat(), 'timeZone': 'UTC'},
+        'end': {'dateTime': end_dt.isoformat(), 'timeZone': 'UTC'}
+    }
+
+
+def _freebusy_today(service):
+    """Optimistic free/busy probe for the next 24h (best effort)."""
+    try:
+        now = datetime.utcnow()
+        body = {
+            'timeMin': now.isoformat() + 'Z',
+            'timeMax': (now + timedelta(days=1)).isoformat() + 'Z',
+            'items': [{'id': 'primary'}]
+        }
+        result = service.freebusy().query(body=body).execute()
+        return result.get('calendars', {}).get('primary', {}).get('busy', [])
+    except:
+        return []
+
 
 # ROUTES
 
@@ -90,11 +466,11 @@ def login():
 
 @app.route('/auth/login')
 def auth_login():
-    if not CLIENT_SECRET_FILE:
+    if not CLIENT_CFG:
         return jsonify({'error': 'Client secret not configured'}), 500
-    
-    flow = Flow.from_client_secrets_file(
-        CLIENT_SECRET_FILE,
+
+    flow = Flow.from_client_config(
+        CLIENT_CFG,
         scopes=SCOPES,
         redirect_uri=url_for('oauth_callback', _external=True)
     )
@@ -105,13 +481,19 @@ def auth_login():
 
 @app.route('/oauth2callback')
 def oauth_callback():
-    if not CLIENT_SECRET_FILE:
+    if not CLIENT_CFG:
         return 'Error: Client secret not configured', 500
-    
+
+    # Reject forged/replayed callbacks before touching the Flow: the
+    # compare is constant-time, and popping the state makes it one-shot
+    state = session.pop('oauth_state', None)
+    incoming_state = request.args.get('state')
+    if not state or not hmac.compare_digest(state, incoming_state or ''):
+        return 'Invalid OAuth state', 400
+
     try:
-        state = session.get('oauth_state')
-        flow = Flow.from_client_secrets_file(
-            CLIENT_SECRET_FILE,
+        flow = Flow.from_client_config(
+            CLIENT_CFG,
             scopes=SCOPES,
             state=state,
             redirect_uri=url_for('oauth_callback', _external=True)
@@ -122,8 +504,9 @@ def oauth_callback():
         session['access_token'] = creds.token
         session['refresh_token'] = creds.refresh_token
         
-        # Get user info
-        service = build('oauth2', 'v2', credentials=creds)
+        # Get user info (static discovery: bundled doc, no ~200KB GET)
+        service = build('oauth2', 'v2', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
         user_info = service.userinfo().get().execute()
         session['user_email'] = user_info.get('email')
         
@@ -149,36 +532,65 @@ def logout():
 @app.route('/api/get_events')
 @login_required
 def get_events():
-    """Get all events from Google Calendar"""
+    """Get upcoming events from Google Calendar (paginated)"""
     try:
+        user = session.get('user_email', 'anonymous')
+        limit = min(request.args.get('limit', 10, type=int), 50)
+        try:
+            offset = int(request.args.get('page_token', 0))
+        except ValueError:
+            offset = 0
+
+        cache_key = f"events:{user}:v{_events_version(user)}:{offset}:{limit}"
+        cached = _events_cache_fetch(cache_key)
+        if cached is not None:
+            # pre-serialized payload: skip the Google call and json.dumps
+            return Response(cached, mimetype='application/json')
+
         service = get_calendar_service()
         if not service:
             return jsonify({'error': 'Calendar service unavailable'}), 500
-        
-        now = datetime.utcnow().isoformat() + 'Z'
-        events_result = service.events().list(
-            calendarId='primary',
-            timeMin=now,
-            maxResults=20,
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-        
-        events = []
-        for event in events_result.get('items', []):
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            events.append({
-                'id': event['id'],
-                'title': event.get('summary', 'Untitled'),
-                'start': start,
-                'date': start.split('T')[0] if 'T' in start else start,
-                'time': start.split('T')[1][:5] if 'T' in start else '00:00'
-            })
-        
-        return jsonify({'events': events, 'success': True})
+
+        events = _sync_events(service, user)
+        page = events[offset:offset + limit]
+        body = {'events': page, 'success': True}
+        if offset + limit < len(events):
+            body['nextPageToken'] = str(offset + limit)
+        payload = app.json.dumps(body)
+        _events_cache_store(cache_key, payload)
+        return Response(payload, mimetype='application/json')
+    except Exception as e:
+        return jsonify({'error': str(e), 'events': []}), 200
+
+
+@app.route('/api/get_events_stream')
+@login_required
+def get_events_stream():
+    """Stream events as Server-Sent Events instead of one big array.
+
+    The browser renders each event as it arrives, so time-to-first-
+    event is one Google round trip rather than build-then-serialize of
+    the whole list, and nothing is buffered beyond a single event.
+    """
+    user = session.get('user_email', 'anonymous')
+    service = get_calendar_service()
+    if not service:
+        return jsonify({'error': 'Calendar service unavailable'}), 500
+
+    try:
+        events = _sync_events(service, user)
     except Exception as e:
         return jsonify({'error': str(e), 'events': []}), 200
 
+    def gen():
+        for event in events:
+            yield f"data: {app.json.dumps(event)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return Response(gen(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache',
+                             'X-Accel-Buffering': 'no'})
+
 
 @app.route('/api/book_event', methods=['POST'])
 @login_required
@@ -197,24 +609,12 @@ def book_event():
         if not service:
             return jsonify({'error': 'Calendar service unavailable'}), 500
         
-        # Create event
-        event = {
-            'summary': title,
-            'start': {
-                'dateTime': f"{date}T{time}:00",
-                'timeZone': 'UTC'
-            },
-            'end': {
-                'dateTime': f"{date}T{int(time.split(':')[0])+1}:{time.split(':')[1]}:00",
-                'timeZone': 'UTC'
-            }
-        }
-        
         created_event = service.events().insert(
             calendarId='primary',
-            body=event
+            body=_event_body(title, date, time)
         ).execute()
         
+        _events_bump_version(session.get('user_email', 'anonymous'))
         return jsonify({
             'success': True,
             'event_id': created_event['id'],
@@ -224,6 +624,115 @@ def book_event():
         return jsonify({'error': str(e)}), 500
 
 
+BATCH_LIMIT = 50  # Google batch endpoint cap per multipart request
+
+
+@app.route('/api/book_events_bulk', methods=['POST'])
+@login_required
+def book_events_bulk():
+    """Create several events in ceil(N/50) round trips via batching"""
+    try:
+        data = request.get_json()
+        specs = data.get('events', [])
+
+        if not specs:
+            return jsonify({'error': 'No events provided'}), 400
+
+        service = get_calendar_service()
+        if not service:
+            return jsonify({'error': 'Calendar service unavailable'}), 500
+
+        results = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                results[request_id] = {'success': False,
+                                       'error': str(exception)}
+            else:
+                results[request_id] = {'success': True,
+                                       'event_id': response['id']}
+
+        batches = []
+        for offset in range(0, len(specs), BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=_collect)
+            for index, spec in enumerate(specs[offset:offset + BATCH_LIMIT],
+                                         start=offset):
+                date = spec.get('date')
+                if not date:
+                    results[str(index)] = {'success': False,
+                                           'error': 'Date required'}
+                    continue
+                try:
+                    body = _event_body(spec.get('title', 'Untitled'), date,
+                                       spec.get('time', '09:00'))
+                except ValueError as e:
+                    results[str(index)] = {'success': False, 'error': str(e)}
+                    continue
+                batch.add(service.events().insert(calendarId='primary',
+                                                  body=body),
+                          request_id=str(index))
+            batches.append(batch)
+        # independent chunks fly in parallel; total time ~ slowest batch
+        wait([_executor.submit(b.execute) for b in batches])
+
+        created = sum(1 for r in results.values() if r['success'])
+        if created:
+            _events_bump_version(session.get('user_email', 'anonymous'))
+        return jsonify({
+            'success': created > 0,
+            'created': created,
+            'results': results,
+            'message': f"{created} of {len(specs)} events created"
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/delete_events_bulk', methods=['DELETE'])
+@login_required
+def delete_events_bulk():
+    """Delete several events in ceil(N/50) round trips via batching"""
+    try:
+        data = request.get_json()
+        event_ids = data.get('event_ids', [])
+
+        if not event_ids:
+            return jsonify({'error': 'No event IDs provided'}), 400
+
+        service = get_calendar_service()
+        if not service:
+            return jsonify({'error': 'Calendar service unavailable'}), 500
+
+        results = {}
+
+        def _collect(request_id, response, exception):
+            results[request_id] = {'success': exception is None}
+            if exception is not None:
+                results[request_id]['error'] = str(exception)
+
+        batches = []
+        for offset in range(0, len(event_ids), BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=_collect)
+            for event_id in event_ids[offset:offset + BATCH_LIMIT]:
+                batch.add(service.events().delete(calendarId='primary',
+                                                  eventId=event_id),
+                          request_id=event_id)
+            batches.append(batch)
+        wait([_executor.submit(b.execute) for b in batches])
+
+        deleted = sum(1 for r in results.values() if r['success'])
+        if deleted:
+            _events_bump_version(session.get('user_email', 'anonymous'))
+        return jsonify({
+            'success': deleted > 0,
+            'deleted': deleted,
+            'results': results,
+            'message': f"{deleted} of {len(event_ids)} events deleted"
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/delete_event', methods=['DELETE'])
 @login_required
 def delete_event():
@@ -244,6 +753,7 @@ def delete_event():
             eventId=event_id
         ).execute()
         
+        _events_bump_version(session.get('user_email', 'anonymous'))
         return jsonify({'success': True, 'message': 'Event deleted'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -266,41 +776,78 @@ def parse_event():
                 'message': 'OpenAI not configured. Please set OPENAI_API_KEY.'
             }), 501
         
-        # Call OpenAI
-        response = openai.ChatCompletion.create(
-            model='gpt-3.5-turbo',
-            messages=[{
-                'role': 'system',
-                'content': 'Extract event title, date (YYYY-MM-DD), and time (HH:MM) from user speech. Return JSON: {"title": "...", "date": "...", "time": "..."}. If incomplete, ask clarification.'
-            }, {
-                'role': 'user',
-                'content': text
-            }],
-            temperature=0.3,
-            max_tokens=200
-        )
-        
-        result_text = response['choices'][0]['message']['content']
-        
-        try:
-            event = json.loads(result_text)
-            return jsonify({
-                'success': True,
-                'event': {
-                    'title': event.get('title', 'Untitled'),
-                    'date': event.get('date', ''),
-                    'time': event.get('time', '09:00')
-                }
-            })
-        except:
+        event, message = _openai_parse(text)
+        if event is None:
+            return jsonify({'success': False, 'message': message})
+        return jsonify({'success': True, 'event': event})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/voice_book', methods=['POST'])
+@login_required
+def voice_book():
+    """Parse a voice command and book the event in one round trip.
+
+    The GPT parse and the free/busy probe are independent, so both are
+    fired at once on the executor; the insert waits only for the parse.
+    """
+    try:
+        data = request.get_json()
+        text = data.get('text', '')
+
+        if not text:
+            return jsonify({'error': 'No text provided'}), 400
+
+        if not HAS_OPENAI:
             return jsonify({
                 'success': False,
-                'message': result_text
-            })
-    
+                'message': 'OpenAI not configured. Please set OPENAI_API_KEY.'
+            }), 501
+
+        service = get_calendar_service()
+        if not service:
+            return jsonify({'error': 'Calendar service unavailable'}), 500
+
+        parse_future = _executor.submit(_openai_parse, text)
+        busy_future = _executor.submit(_freebusy_today, service)
+
+        event, message = parse_future.result(timeout=30)
+        if event is None:
+            busy_future.cancel()
+            return jsonify({'success': False, 'message': message})
+
+        if not event.get('date'):
+            busy_future.cancel()
+            return jsonify({'success': False,
+                            'message': 'Could not determine a date'})
+
+        title = event['title']
+        created_event = service.events().insert(
+            calendarId='primary',
+            body=_event_body(title, event['date'], event['time'])
+        ).execute()
+
+        try:
+            busy = busy_future.result(timeout=5)
+        except:
+            busy = []
+
+        _events_bump_version(session.get('user_email', 'anonymous'))
+        return jsonify({
+            'success': True,
+            'event_id': created_event['id'],
+            'event': event,
+            'busy': busy,
+            'message': f"Event '{title}' created!"
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # Dev server only - production runs under gunicorn's gevent workers
+    # (see gunicorn.conf.py) so concurrent users aren't serialized
+    app.run(debug=os.environ.get('DEBUG', 'True').lower() == 'true',
+            port=int(os.environ.get('PORT', 5000)))
@@ -0,0 +1,43 @@
+"""
+Shared background event loop for sync wrappers around async AI calls
+
+interpret_sync and generate_response_sync used to spin up a fresh
+ThreadPoolExecutor + asyncio.run per call whenever a loop was already
+running. Each asyncio.run tears down the event loop - and with it the
+AsyncOpenAI client's httpx connection pool - forcing a new TLS
+handshake to api.openai.com (~50-150ms) on every sync call. Keeping
+one loop alive on a daemon thread preserves the keep-alive
+connections across calls.
+"""
+
+import asyncio
+import threading
+
+_bg_loop = None
+_bg_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the shared background loop."""
+    global _bg_loop
+    with _bg_lock:
+        if _bg_loop is None or _bg_loop.is_closed():
+            _bg_loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_bg_loop.run_forever,
+                name="ai-bg-loop",
+                daemon=True
+            )
+            thread.start()
+    return _bg_loop
+
+
+def run_sync(coro):
+    """
+    Run a coroutine on the background loop and block for its result.
+
+    Safe to call from any thread, including request handlers that are
+    themselves inside a running event loop.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    return future.result()
@@ -12,8 +12,11 @@ This module handles:
 All calendar operations go through here.
 """
 
+import os
+import json
+import hashlib
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
 
 from google.oauth2.credentials import Credentials
@@ -23,6 +26,54 @@ from googleapiclient.errors import HttpError
 
 logger = logging.getLogger(__name__)
 
+# Incremental-sync state per user: the last nextSyncToken plus the raw
+# events it covers, so each poll asks Google only for the delta instead
+# of re-listing the whole window. Redis when configured (shared across
+# workers, survives restarts), in-process dict otherwise.
+_SYNC_STATE_TTL = 24 * 3600
+
+_sync_redis = None
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis as _sync_redis_mod
+        _sync_redis = _sync_redis_mod.Redis.from_url(
+            os.environ['REDIS_URL'], socket_timeout=0.2)
+    except Exception as e:
+        logger.warning(f"Redis sync-state store unavailable: {e}")
+
+_sync_state_local: Dict[str, Dict[str, Any]] = {}
+
+
+def _load_sync_state(user_key: str) -> Optional[Dict[str, Any]]:
+    """Return {'token': str, 'events': {id: raw_event}} or None."""
+    if _sync_redis is not None:
+        try:
+            raw = _sync_redis.get(f"gcal:sync:{user_key}")
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"Sync state read failed: {e}")
+    return _sync_state_local.get(user_key)
+
+
+def _save_sync_state(user_key: str, state: Dict[str, Any]) -> None:
+    if _sync_redis is not None:
+        try:
+            _sync_redis.setex(
+                f"gcal:sync:{user_key}", _SYNC_STATE_TTL, json.dumps(state))
+            return
+        except Exception as e:
+            logger.warning(f"Sync state write failed: {e}")
+    _sync_state_local[user_key] = state
+
+
+def _drop_sync_state(user_key: str) -> None:
+    if _sync_redis is not None:
+        try:
+            _sync_redis.delete(f"gcal:sync:{user_key}")
+        except Exception:
+            pass
+    _sync_state_local.pop(user_key, None)
+
 
 class GoogleCalendarService:
     """Wrapper for Google Calendar API"""
@@ -33,7 +84,15 @@ class GoogleCalendarService:
         'https://www.googleapis.com/auth/userinfo.profile',
         'https://www.googleapis.com/auth/calendar'
     ]
-    
+
+    # Built services shared across instances, keyed on a digest of the
+    # credential tokens (never the raw token): build() assembles a large
+    # resource tree per call, and set_credentials is hit once per
+    # request in the web flows. Bounded; cleared wholesale when full.
+    _SERVICE_CACHE: Dict[str, Any] = {}
+    _SERVICE_CACHE_MAX = 32
+
+
     def __init__(self, client_secret_file: str, credentials: Optional[Credentials] = None):
         """
         Initialize Google Calendar service.
@@ -50,9 +109,28 @@ class GoogleCalendarService:
             self._build_service()
     
     def _build_service(self):
-        """Build the Google Calendar API service"""
-        if self.credentials:
-            self.service = build('calendar', 'v3', credentials=self.credentials)
+        """Build (or reuse) the Google Calendar API service"""
+        if not self.credentials:
+            return
+
+        key_source = (self.credentials.refresh_token
+                      or self.credentials.token or '')
+        digest = (hashlib.sha1(key_source.encode()).hexdigest()
+                  if key_source else None)
+        if digest is not None:
+            cached = self._SERVICE_CACHE.get(digest)
+            if cached is not None:
+                self.service = cached
+                return
+
+        # static_discovery: use the discovery doc bundled with the
+        # client library instead of fetching it over HTTP per build
+        self.service = build('calendar', 'v3', credentials=self.credentials,
+                             cache_discovery=False, static_discovery=True)
+        if digest is not None:
+            if len(self._SERVICE_CACHE) >= self._SERVICE_CACHE_MAX:
+                self._SERVICE_CACHE.clear()
+            self._SERVICE_CACHE[digest] = self.service
     
     def set_credentials(self, credentials: Credentials):
         """
@@ -104,26 +182,154 @@ class GoogleCalendarService:
                 orderBy='startTime'
             ).execute()
             
-            events = []
-            for event in events_result.get('items', []):
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                events.append({
-                    'id': event['id'],
-                    'title': event.get('summary', 'Untitled'),
-                    'start': start,
-                    'date': start.split('T')[0] if 'T' in start else start,
-                    'time': start.split('T')[1][:5] if 'T' in start else '00:00',
-                    'description': event.get('description', ''),
-                    'attendees': [a.get('email') for a in event.get('attendees', [])]
-                })
-            
+            events = [self._simplify_event(event)
+                      for event in events_result.get('items', [])]
+
             logger.info(f"✅ Found {len(events)} events")
             return events
-        
+
         except HttpError as e:
             logger.error(f"Calendar API error: {str(e)}")
             return []
-    
+
+    @staticmethod
+    def _simplify_event(event: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a raw Calendar API event to the shape callers use.
+
+        Kept as a dict rather than a NamedTuple/slots class: these
+        records are serialized straight into JSON responses and the
+        Redis sync state, where a tuple would change the wire shape
+        from object to array and break round-tripping.
+        """
+        start = event['start'].get('dateTime', event['start'].get('date'))
+        # one partition instead of two split() scans over the string
+        date_part, sep, time_part = start.partition('T')
+        return {
+            'id': event['id'],
+            'title': event.get('summary', 'Untitled'),
+            'start': start,
+            'date': date_part,
+            'time': time_part[:5] if sep else '00:00',
+            'description': event.get('description', ''),
+            'attendees': [a.get('email') for a in event.get('attendees', [])]
+        }
+
+    def _list_pages(self, **params) -> tuple:
+        """List events across all pages; return (items, nextSyncToken)."""
+        items: List[Dict[str, Any]] = []
+        page_token = None
+        while True:
+            if page_token:
+                params['pageToken'] = page_token
+            response = self.service.events().list(
+                calendarId='primary', singleEvents=True, **params).execute()
+            items.extend(response.get('items', []))
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return items, response.get('nextSyncToken')
+
+    def get_events_synced(self, user_key: str,
+                          max_results: int = 30) -> List[Dict[str, Any]]:
+        """
+        Fetch events via incremental sync: after the first full list,
+        each call passes the stored syncToken so Google returns only
+        what changed (usually nothing - a few hundred bytes) instead of
+        the whole window.
+
+        Args:
+            user_key (str): Key for the per-user sync state
+                            (e.g. the user's email)
+            max_results (int): Maximum events to return
+
+        Returns:
+            List[Dict]: Simplified events, soonest first
+        """
+
+        if not self.service:
+            logger.error("Service not initialized")
+            return []
+
+        state = _load_sync_state(user_key)
+        if state:
+            try:
+                items, token = self._list_pages(syncToken=state['token'])
+            except HttpError as e:
+                if getattr(e.resp, 'status', None) == 410:
+                    # token expired server-side: fall through to a
+                    # full resync below
+                    logger.info("Sync token expired, full resync")
+                    _drop_sync_state(user_key)
+                    state = None
+                else:
+                    logger.error(f"Calendar API error: {str(e)}")
+                    return self._from_sync_state(state, max_results)
+            else:
+                events_by_id = state['events']
+                for event in items:
+                    if event.get('status') == 'cancelled':
+                        events_by_id.pop(event['id'], None)
+                    else:
+                        events_by_id[event['id']] = event
+                # deltas legally include past-event changes and started
+                # events age out of "upcoming": prune them here or the
+                # stored dict grows without bound and stale entries
+                # crowd out upcoming ones in the sorted view
+                state = {'token': token or state['token'],
+                         'events': self._drop_past_events(events_by_id)}
+                _save_sync_state(user_key, state)
+                return self._from_sync_state(state, max_results)
+
+        # initial (or re-) sync: full list, keep the returned token
+        try:
+            items, token = self._list_pages(
+                timeMin=datetime.utcnow().isoformat() + 'Z')
+        except HttpError as e:
+            logger.error(f"Calendar API error: {str(e)}")
+            return []
+
+        events_by_id = {event['id']: event for event in items
+                        if event.get('status') != 'cancelled'}
+        state = {'token': token, 'events': events_by_id}
+        if token:
+            _save_sync_state(user_key, state)
+        return self._from_sync_state(state, max_results)
+
+    @staticmethod
+    def _event_start_dt(event: Dict[str, Any]) -> Optional[datetime]:
+        """Parse an event's start into an aware datetime (None if odd)."""
+        raw = event.get('start', {}).get('dateTime') \
+            or event.get('start', {}).get('date')
+        if not raw:
+            return None
+        try:
+            dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+
+    @classmethod
+    def _drop_past_events(cls, events_by_id: Dict[str, Any]
+                          ) -> Dict[str, Any]:
+        """Keep only events that haven't started yet (or are unparseable)."""
+        now = datetime.now(timezone.utc)
+        kept = {}
+        for event_id, event in events_by_id.items():
+            start = cls._event_start_dt(event)
+            if start is None or start >= now:
+                kept[event_id] = event
+        return kept
+
+    def _from_sync_state(self, state: Dict[str, Any],
+                         max_results: int) -> List[Dict[str, Any]]:
+        """Simplified, start-sorted view of the upcoming synced events."""
+        events = [self._simplify_event(event)
+                  for event in self._drop_past_events(state['events']).values()
+                  if event.get('start')]
+        events.sort(key=lambda e: e['start'])
+        return events[:max_results]
+
     def create_event(
         self,
         title: str,
@@ -155,39 +361,9 @@ class GoogleCalendarService:
             return None
         
         try:
-            # Parse time
-            hour, minute = map(int, time.split(':'))
-            
-            # Create start time
-            start_time = f"{date}T{time}:00"
-            
-            # Calculate end time
-            end_hour = hour + (duration // 60)
-            end_minute = minute + (duration % 60)
-            if end_minute >= 60:
-                end_hour += 1
-                end_minute -= 60
-            
-            end_time = f"{date}T{end_hour:02d}:{end_minute:02d}:00"
-            
-            # Build event body
-            event_body = {
-                'summary': title,
-                'description': description,
-                'start': {
-                    'dateTime': start_time,
-                    'timeZone': timezone
-                },
-                'end': {
-                    'dateTime': end_time,
-                    'timeZone': timezone
-                }
-            }
-            
-            # Add attendees if provided
-            if attendees:
-                event_body['attendees'] = [{'email': email} for email in attendees]
-            
+            event_body = self._event_body(
+                title, date, time, duration, description, attendees, timezone)
+
             logger.info(f"📝 Creating event: {title} on {date} at {time}")
             
             created_event = self.service.events().insert(
@@ -207,7 +383,153 @@ class GoogleCalendarService:
         except HttpError as e:
             logger.error(f"Failed to create event: {str(e)}")
             return None
-    
+
+    @staticmethod
+    def _event_body(
+        title: str,
+        date: str,
+        time: str = "09:00",
+        duration: int = 60,
+        description: str = "",
+        attendees: Optional[List[str]] = None,
+        timezone: str = "UTC"
+    ) -> Dict[str, Any]:
+        """Build a Calendar API event body from our simple parameters."""
+        hour, minute = map(int, time.split(':'))
+
+        start_time = f"{date}T{time}:00"
+
+        end_hour = hour + (duration // 60)
+        end_minute = minute + (duration % 60)
+        if end_minute >= 60:
+            end_hour += 1
+            end_minute -= 60
+
+        end_time = f"{date}T{end_hour:02d}:{end_minute:02d}:00"
+
+        event_body = {
+            'summary': title,
+            'description': description,
+            'start': {
+                'dateTime': start_time,
+                'timeZone': timezone
+            },
+            'end': {
+                'dateTime': end_time,
+                'timeZone': timezone
+            }
+        }
+
+        if attendees:
+            event_body['attendees'] = [{'email': email} for email in attendees]
+
+        return event_body
+
+    # Google's documented per-batch request limit
+    BATCH_LIMIT = 50
+
+    def create_events_batch(
+        self, events: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Create several events in one HTTP round trip per 50 events.
+
+        Each insert travels in a multipart/mixed BatchHttpRequest, so N
+        events cost one request (plus one per extra group of 50) instead
+        of N TLS round trips.
+
+        Args:
+            events (List[Dict]): create_event-style kwargs per event
+                                 (title, date, time, duration, ...)
+
+        Returns:
+            Dict: per-event outcome keyed by the event's list index
+                  (as a string): {'success': bool, 'event': ...} or
+                  {'success': bool, 'error': ...}
+        """
+
+        if not self.service:
+            logger.error("Service not initialized")
+            return {}
+
+        outcomes: Dict[str, Dict[str, Any]] = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                outcomes[request_id] = {
+                    'success': False, 'error': str(exception)}
+            else:
+                outcomes[request_id] = {'success': True, 'event': {
+                    'id': response['id'],
+                    'title': response.get('summary', ''),
+                    'start': response.get('start', {}).get('dateTime'),
+                }}
+
+        for offset in range(0, len(events), self.BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for i, spec in enumerate(
+                    events[offset:offset + self.BATCH_LIMIT], start=offset):
+                if not spec.get('date'):
+                    outcomes[str(i)] = {
+                        'success': False, 'error': 'No date provided'}
+                    continue
+                try:
+                    body = self._event_body(
+                        spec.get('title', 'Untitled'), spec['date'],
+                        spec.get('time', '09:00'),
+                        spec.get('duration', 60),
+                        spec.get('description', ''),
+                        spec.get('attendees'),
+                        spec.get('timezone', 'UTC'))
+                except (ValueError, AttributeError) as e:
+                    outcomes[str(i)] = {'success': False, 'error': str(e)}
+                    continue
+                batch.add(
+                    self.service.events().insert(
+                        calendarId='primary', body=body),
+                    request_id=str(i))
+            try:
+                batch.execute()
+            except HttpError as e:
+                logger.error(f"Batch insert failed: {str(e)}")
+
+        logger.info(f"✅ Batched {len(events)} event inserts")
+        return outcomes
+
+    def delete_events_batch(self, event_ids: List[str]) -> Dict[str, bool]:
+        """
+        Delete several events in one HTTP round trip per 50 events.
+
+        Args:
+            event_ids (List[str]): Event IDs to delete
+
+        Returns:
+            Dict: event_id -> True/False per delete
+        """
+
+        if not self.service:
+            logger.error("Service not initialized")
+            return {}
+
+        outcomes: Dict[str, bool] = {}
+
+        def _collect(request_id, response, exception):
+            outcomes[request_id] = exception is None
+
+        for offset in range(0, len(event_ids), self.BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for event_id in event_ids[offset:offset + self.BATCH_LIMIT]:
+                batch.add(
+                    self.service.events().delete(
+                        calendarId='primary', eventId=event_id),
+                    request_id=event_id)
+            try:
+                batch.execute()
+            except HttpError as e:
+                logger.error(f"Batch delete failed: {str(e)}")
+
+        return outcomes
+
     def delete_event(self, event_id: str) -> bool:
         """
         Delete an event from Google Calendar.
@@ -238,19 +560,40 @@ class GoogleCalendarService:
             logger.error(f"Failed to delete event: {str(e)}")
             return False
     
-    def find_event_by_title(self, title: str) -> Optional[Dict[str, Any]]:
+    def find_event_by_title(self, title: str,
+                            events: Optional[List[Dict[str, Any]]] = None
+                            ) -> Optional[Dict[str, Any]]:
         """
         Find an event by title (partial match).
-        
+
         Args:
             title (str): Event title to search for
-        
+            events (list): Optional pre-fetched event list to search
+                           instead of hitting the API again
+
         Returns:
             Dict: Event if found, None otherwise
         """
-        
-        events = self.get_events(max_results=100)
-        
+
+        if events is None:
+            # Let Google's full-text search narrow the candidates
+            # server-side instead of shipping 100 events over the wire
+            # to scan their titles here
+            try:
+                result = self.service.events().list(
+                    calendarId='primary',
+                    q=title,
+                    timeMin=datetime.utcnow().isoformat() + 'Z',
+                    maxResults=10,
+                    singleEvents=True,
+                    orderBy='startTime'
+                ).execute()
+                events = [self._simplify_event(e)
+                          for e in result.get('items', [])]
+            except HttpError as e:
+                logger.warning("Server-side event search failed: %s", e)
+                events = self.get_events(max_results=100)
+
         title_lower = title.lower()
         for event in events:
             if title_lower in event['title'].lower():
@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for the Voice Assistant Calendar web apps.
+
+Requests here are dominated by external I/O (OpenAI and Google
+Calendar round trips), so gevent workers let one process overlap many
+in-flight requests instead of serializing them on Werkzeug's
+single-threaded dev server. Run with:
+
+    gunicorn -c gunicorn.conf.py app:app        # blueprint app
+    gunicorn -c gunicorn.conf.py app_ai:app     # AI-driven app
+    gunicorn -c gunicorn.conf.py app_clean:app  # minimal backend
+
+Set WSGI_SERVER=gevent so the apps monkey-patch the stdlib before
+importing their network stacks.
+"""
+
+import os
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_class = 'gevent'
+worker_connections = 1000
+keepalive = 30
+accesslog = None  # request logging is handled by the app's QueueListener
+errorlog = '-'
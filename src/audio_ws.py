@@ -0,0 +1,108 @@
+"""
+Binary audio transport over WebSocket
+
+The REST voice endpoints accept base64 audio inside JSON, which inflates
+every chunk 1.33x and pays a json.loads + b64decode on the hot path.
+This module exposes /ws/audio: the browser sends raw int16 PCM as binary
+WebSocket frames (ArrayBuffer straight from the AudioWorklet, no atob or
+JSON.stringify) and each frame is fed to the voice pipeline as-is.
+Control messages (start/end/config) travel as small msgpack maps on the
+same socket; pipeline results go back the same way.
+"""
+
+import logging
+from typing import Optional
+
+try:
+    from flask_sock import Sock
+    FLASK_SOCK_AVAILABLE = True
+except ImportError:
+    Sock = None
+    FLASK_SOCK_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+sock = Sock() if FLASK_SOCK_AVAILABLE else None
+
+
+def _pack(payload: dict) -> bytes:
+    """Encode a control/result message for the socket."""
+    if MSGPACK_AVAILABLE:
+        return msgpack.packb(payload, use_bin_type=True)
+    import json
+    return json.dumps(payload).encode('utf-8')
+
+
+def _unpack(data: bytes) -> Optional[dict]:
+    """Decode a control message; None if it isn't one."""
+    try:
+        if MSGPACK_AVAILABLE:
+            decoded = msgpack.unpackb(data, raw=False)
+        else:
+            import json
+            decoded = json.loads(data.decode('utf-8'))
+        return decoded if isinstance(decoded, dict) else None
+    except Exception:
+        return None
+
+
+def init_audio_ws(app) -> bool:
+    """
+    Register the /ws/audio endpoint on the Flask app.
+
+    Returns False (and logs a warning) when flask-sock is not installed,
+    leaving the base64 REST endpoints as the only transport.
+    """
+    if not FLASK_SOCK_AVAILABLE:
+        logger.warning("flask-sock not installed; /ws/audio disabled")
+        return False
+
+    sock.init_app(app)
+
+    @sock.route('/ws/audio')
+    def audio_socket(ws):
+        from flask import session
+        from src.pipeline.voice_pipeline import get_pipeline
+
+        user_id = session.get('user_email', 'anonymous')
+        pipeline = get_pipeline()
+        logger.info(f"Audio WebSocket opened for {user_id}")
+
+        while True:
+            data = ws.receive()
+            if data is None:
+                break
+
+            # Text frames are control messages ({"type": "end"} etc.)
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+
+            control = _unpack(data)
+            if control is not None:
+                msg_type = control.get('type')
+                if msg_type == 'end':
+                    result = pipeline.process_audio_chunk(
+                        b'', user_id, is_final=True)
+                    ws.send(_pack(result))
+                    break
+                elif msg_type == 'reset':
+                    pipeline.reset()
+                    ws.send(_pack({"state": "IDLE"}))
+                continue
+
+            # Binary frame: raw int16 PCM straight into the pipeline
+            result = pipeline.process_audio_chunk(bytes(data), user_id)
+            # Only push state changes; per-chunk acks would double traffic
+            if result.get('action') != 'recording':
+                ws.send(_pack(result))
+
+        logger.info(f"Audio WebSocket closed for {user_id}")
+
+    return True
@@ -51,6 +51,21 @@ for f in os.listdir('.config'):
 if not CLIENT_SECRET_FILE:
     print("⚠️  Warning: client_secret JSON not found in .config/")
 
+# Parse the client secret once at import; the OAuth routes use
+# Flow.from_client_config so each login doesn't re-open and re-parse
+# the JSON file
+CLIENT_CFG = None
+if CLIENT_SECRET_FILE:
+    try:
+        with open(CLIENT_SECRET_FILE) as fh:
+            CLIENT_CFG = json.load(fh)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Warning: could not parse {CLIENT_SECRET_FILE}: {e}")
+
+# Shared Flow constructor arguments, assembled once so the per-login
+# calls only add what varies (redirect_uri, state)
+_FLOW_KWARGS = dict(client_config=CLIENT_CFG, scopes=SCOPES)
+
 auth_bp = Blueprint('auth', __name__)
 
 def login_required(f):
@@ -72,12 +87,11 @@ def index():
 @auth_bp.route('/auth/oauth-start')
 def oauth_start():
     """Initiate OAuth flow."""
-    if not CLIENT_SECRET_FILE:
+    if not CLIENT_CFG:
         return "Error: Client secret not configured", 500
 
-    flow = Flow.from_client_secrets_file(
-        CLIENT_SECRET_FILE,
-        scopes=SCOPES,
+    flow = Flow.from_client_config(
+        **_FLOW_KWARGS,
         redirect_uri=url_for('auth.oauth_callback', _external=True)
     )
 
@@ -100,13 +114,12 @@ def login():
 @auth_bp.route('/oauth/callback')
 def oauth_callback():
     """Handle OAuth callback."""
-    if not CLIENT_SECRET_FILE:
+    if not CLIENT_CFG:
         return "Error: Client secret not configured", 500
 
     state = session.get('oauth_state')
-    flow = Flow.from_client_secrets_file(
-        CLIENT_SECRET_FILE,
-        scopes=SCOPES,
+    flow = Flow.from_client_config(
+        **_FLOW_KWARGS,
         state=state,
         redirect_uri=url_for('auth.oauth_callback', _external=True)
     )
@@ -121,7 +134,8 @@ def oauth_callback():
         session['token_expiry'] = creds.expiry.isoformat() if creds.expiry else None
 
         # Get user info
-        service = build('oauth2', 'v2', credentials=creds)
+        service = build('oauth2', 'v2', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
         user_info = service.userinfo().get().execute()
         session['user_email'] = user_info.get('email')
 
@@ -1,5 +1,6 @@
 # Student Book a slot
 import datetime
+import functools
 import json
 from prettytable import PrettyTable
 from googleapiclient.errors import HttpError
@@ -7,6 +8,12 @@ import os
 
 # Note: book_as_student has been removed. Use create_event_user instead for generic calendar events.
 
+# Shared code clinics calendar (defined once instead of per function)
+CODE_CLINICS_CALENDAR_ID = 'c_3b23a6dcc818ef6fc87099b492db10ff2c4b3d47036a1aede171bc1d19fb0059@group.calendar.google.com'
+
+# Email domain appended to bare usernames when matching attendees
+STUDENT_DOMAIN = "@student.wethinkcode.co.za"
+
 def add_30_minutes(time_str):
     """
     Adds 30 minutes to a given time string.
@@ -22,6 +29,9 @@ def add_30_minutes(time_str):
 
     This function takes a time string in ISO 8601 format and adds 30 minutes to it.
     It returns the resulting time as a string in the same format.
+    Well-formed strings are adjusted with substring integer arithmetic, which
+    skips the datetime parse/format round trip; anything unusual (or an
+    addition that crosses midnight) falls back to datetime math.
 
     Example:
     ```
@@ -36,12 +46,56 @@ def add_30_minutes(time_str):
     ```
     """
 
+    if len(time_str) >= 16 and time_str[10] == 'T' and time_str[13] == ':':
+        try:
+            hour = int(time_str[11:13])
+            minute = int(time_str[14:16]) + 30
+        except ValueError:
+            pass
+        else:
+            hour += minute // 60
+            minute %= 60
+            if hour < 24:  # day rollover needs real calendar math
+                return f"{time_str[:11]}{hour:02d}:{minute:02d}{time_str[16:]}"
+
     time_obj = datetime.datetime.fromisoformat(time_str)
     new_time_obj = time_obj + datetime.timedelta(minutes=30)
     new_time_str = new_time_obj.isoformat()
-    
+
     return new_time_str
 
+# Parsed-calendar cache: search_time/get_event_id/get_attendee each
+# reload the JSON, so a single booking used to re-read and re-parse the
+# file several times. One stat() now answers "has it changed?" and the
+# parse itself is memoized on the (mtime_ns, size) stamp - when any
+# writer touches the file the stamp moves and lru_cache misses, so no
+# manual cache_clear bookkeeping is needed.
+_CACHE = {"stamp": None, "events": [], "by_start": {}}
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_calendar_file(stamp):
+    """Read and decode the calendar JSON for a given stat stamp."""
+    try:
+        with open("voice_assistant_calendar.json", "r") as file:
+            return json.load(file)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return []
+
+
+def _index_by_start(events):
+    """Index events on start dateTime so lookups are O(1), not a scan.
+
+    Values are lists because nothing stops two bookings from sharing a
+    slot, and search_time's callers rely on seeing all of them.
+    """
+    by_start = {}
+    for event in events:
+        if 'start' in event and 'dateTime' in event['start']:
+            by_start.setdefault(event['start']['dateTime'], []).append(event)
+    return by_start
+
+
 def load_voice_assistant_calendar():
     """
     Loads voice assistant calendar events from a JSON file.
@@ -55,8 +109,10 @@ def load_voice_assistant_calendar():
 
     This function attempts to load voice assistant calendar events from a JSON file named
     'voice_assistant_calendar.json'. If the file exists and can be successfully read,
-    it loads the events as a list. If there is any error in decoding JSON or if the
-    file is not found, it returns an empty list.
+    it loads the events as a list. The parsed list is cached module-wide and only
+    re-read when the file's mtime or size changes, so repeated calls within one
+    booking flow cost a single stat() instead of a full parse. If there is any
+    error in decoding JSON or if the file is not found, it returns an empty list.
 
     Example:
     ```
@@ -66,11 +122,19 @@ def load_voice_assistant_calendar():
     ```
     """
     try:
-        with open("voice_assistant_calendar.json", "r") as file:
-            events = json.load(file)
-    except (json.JSONDecodeError, FileNotFoundError):
-        events = []
-    return events
+        stat = os.stat("voice_assistant_calendar.json")
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        _CACHE["stamp"] = None
+        _CACHE["events"] = []
+        _CACHE["by_start"] = {}
+        return []
+
+    if stamp != _CACHE["stamp"]:
+        _CACHE["events"] = _parse_calendar_file(stamp)
+        _CACHE["by_start"] = _index_by_start(_CACHE["events"])
+        _CACHE["stamp"] = stamp
+    return _CACHE["events"]
 
 def search_time(search_dateTime):
     """
@@ -86,8 +150,8 @@ def search_time(search_dateTime):
     None
 
     This function searches for events in the calendar that match the provided date and time string.
-    It iterates through the list of loaded calendar events and checks if the start date and time of each event match
-    the provided search_dateTime. Matching events are appended to a list and returned.
+    Events are looked up in the start-time index built when the calendar file is loaded,
+    so the search is a dictionary lookup rather than a scan over every event.
 
     Example:
     ```
@@ -99,13 +163,8 @@ def search_time(search_dateTime):
 
     """
 
-    matching_events = []
-
-    for event in load_voice_assistant_calendar():
-        if 'start' in event and 'dateTime' in event['start'] and event['start']['dateTime'] == search_dateTime:
-            matching_events.append(event)
-
-    return matching_events
+    load_voice_assistant_calendar()
+    return list(_CACHE["by_start"].get(search_dateTime, ()))
 
 def get_event_id(datetime):
     """
@@ -121,9 +180,8 @@ def get_event_id(datetime):
     None
 
     This function retrieves the event ID associated with the specified date and time from the calendar.
-    It iterates through the list of loaded calendar events and checks if the start date and time of each event
-    match the provided datetime string. If a matching event is found, its ID is returned. If no matching event is
-    found, None is returned.
+    It looks the datetime up in the start-time index built at load time. If a matching event is
+    found, its ID is returned. If no matching event is found, None is returned.
 
     Example:
     ```
@@ -135,9 +193,9 @@ def get_event_id(datetime):
 
     """
 
-    for event in load_voice_assistant_calendar():
-        if 'start' in event and 'dateTime' in event['start'] and event['start']['dateTime'] == datetime:
-            return event['id']
+    load_voice_assistant_calendar()
+    for event in _CACHE["by_start"].get(datetime, ()):
+        return event['id']
 
 def get_attendee(datetime):
     """
@@ -154,8 +212,8 @@ def get_attendee(datetime):
     None
 
     This function retrieves the attendees of an event associated with the specified date and time from the calendar.
-    It iterates through the list of loaded calendar events and checks if the start date and time of each event
-    match the provided datetime string. If a matching event is found, it returns the list of attendees for that event.
+    It looks the datetime up in the start-time index built at load time. If a matching event is
+    found, it returns the list of attendees for that event.
     If no matching event is found, an empty list is returned.
 
     Example:
@@ -168,11 +226,67 @@ def get_attendee(datetime):
 
     """
 
-    for event in load_voice_assistant_calendar():
-        if 'start' in event and 'dateTime' in event['start'] and event['start']['dateTime'] == datetime:
-            return event['attendees']
+    load_voice_assistant_calendar()
+    for event in _CACHE["by_start"].get(datetime, ()):
+        return event['attendees']
         
         
+def is_booked_attendee(username, start_time):
+    """
+    Checks whether a user is an attendee of the booking at a given time.
+
+    Parameters:
+    - username: A bare username (the student domain is appended) or a
+      full email address.
+    - start_time: The event start time in ISO 8601 format.
+
+    Returns:
+    True if the user appears in the attendee list of the event at
+    start_time, False otherwise (including when no event exists).
+
+    The target email is built once and tested against a set of attendee
+    emails, so there is no per-attendee string concatenation and the
+    membership test is a hash lookup.
+    """
+    target = username if '@' in username else username + STUDENT_DOMAIN
+    attendees = get_attendee(start_time) or ()
+    return target in {a.get('email') for a in attendees}
+
+
+def is_slot_free(service, start_time_iso, duration_minutes=30, calendar_id='primary'):
+    """
+    Checks slot availability with Google's freebusy.query.
+
+    Parameters:
+    - service: An authenticated Google Calendar service object.
+    - start_time_iso: RFC3339 start time string.
+    - duration_minutes: Slot length in minutes.
+    - calendar_id: Calendar ID (default 'primary').
+
+    Returns:
+    True if the slot has no busy intervals, False if it does, and None
+    when the check could not be performed (caller should fall back to
+    its own conflict handling).
+
+    Unlike scanning a local snapshot or listing surrounding events,
+    freebusy is computed server-side and returns only the busy
+    intervals for the window - a tiny request and response that cannot
+    go stale.
+    """
+    try:
+        start_dt = datetime.datetime.fromisoformat(start_time_iso)
+        end_dt = start_dt + datetime.timedelta(minutes=duration_minutes)
+        response = service.freebusy().query(body={
+            'timeMin': start_dt.isoformat(),
+            'timeMax': end_dt.isoformat(),
+            'items': [{'id': calendar_id}]
+        }).execute()
+        return not response['calendars'][calendar_id]['busy']
+    except Exception as e:
+        print(f"[WARN] freebusy check failed: {e}")
+        return None
+
+
 # TODO: Cancel booking. Students cancel booking made by them.
 
 
@@ -201,7 +315,8 @@ def cancel_booking(service, username, start_time):
     from googleapiclient.discovery import build
 
     # Build Google Calendar service
-    service = build('calendar', 'v3', credentials=credentials)
+    service = build('calendar', 'v3', credentials=credentials,
+                    cache_discovery=False, static_discovery=True)
 
     # Cancel a booking
     username = 'example_user'
@@ -210,14 +325,46 @@ def cancel_booking(service, username, start_time):
     ```
     """
     event_id = get_event_id(start_time)
-    calendar_id = 'c_3b23a6dcc818ef6fc87099b492db10ff2c4b3d47036a1aede171bc1d19fb0059@group.calendar.google.com'
-    
+
     if event_id:
-        service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+        service.events().delete(calendarId=CODE_CLINICS_CALENDAR_ID, eventId=event_id).execute()
         print('Booking canceled successfully')
     else:
         print('No booking found at the specified time.')
 
+def cancel_bookings(service, start_times):
+    """
+    Cancels several bookings in one batched round trip.
+
+    Parameters:
+    - service: An authenticated Google Calendar service object.
+    - start_times: A list of event start times in RFC3339 format.
+
+    Returns:
+    A dict mapping each start time to True if its booking was found and
+    deleted, False otherwise.
+
+    Event IDs are resolved from the local start-time index (a dict
+    lookup each) and the deletes go out together via cancel_many, so N
+    cancellations cost ceil(N/50) HTTPS round trips rather than N
+    sequential ones.
+    """
+    id_by_start = {}
+    results = {}
+    for start_time in start_times:
+        event_id = get_event_id(start_time)
+        if event_id:
+            id_by_start[start_time] = event_id
+        else:
+            results[start_time] = False
+
+    deleted = cancel_many(service, list(id_by_start.values()),
+                          calendar_id=CODE_CLINICS_CALENDAR_ID)
+    for start_time, event_id in id_by_start.items():
+        results[start_time] = deleted.get(event_id, False)
+    return results
+
+
 def cancel_booking_command(service, args):
     """
     Cancels a calendar event booking based on command-line arguments.
@@ -243,7 +390,8 @@ def cancel_booking_command(service, args):
     import argparse
 
     # Build Google Calendar service
-    service = build('calendar', 'v3', credentials=credentials)
+    service = build('calendar', 'v3', credentials=credentials,
+                    cache_discovery=False, static_discovery=True)
 
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description='Cancel booking for a calendar event.')
@@ -263,6 +411,105 @@ def cancel_booking_command(service, args):
 # Volunteer helpers removed to simplify API surface
 
 
+BATCH_LIMIT = 50  # Google's cap on sub-requests per multipart batch
+
+
+def book_many(service, bookings, calendar_id='primary'):
+    """
+    Creates several calendar events in batched round trips.
+
+    Parameters:
+    - service: An authenticated Google Calendar service object.
+    - bookings: A list of dicts with keys matching create_event_user's
+      keyword arguments (email, start_time_iso, summary,
+      duration_minutes, reminders).
+    - calendar_id: Calendar ID (default 'primary').
+
+    Returns:
+    A dict mapping each booking's index (as a string) to
+    {'success': bool, 'event_id' or 'error'}.
+
+    Instead of one HTTPS round trip per insert, bookings are coalesced
+    into multipart batch requests of up to 50 sub-requests, so N
+    bookings cost ceil(N/50) round trips.
+    """
+    results = {}
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            results[request_id] = {'success': False, 'error': str(exception)}
+        else:
+            results[request_id] = {'success': True,
+                                   'event_id': response.get('id')}
+
+    for offset in range(0, len(bookings), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=_collect)
+        for index, booking in enumerate(bookings[offset:offset + BATCH_LIMIT],
+                                        start=offset):
+            start_time_iso = booking.get('start_time_iso')
+            if not start_time_iso:
+                results[str(index)] = {'success': False,
+                                       'error': 'start_time_iso is required'}
+                continue
+            try:
+                start_dt = datetime.datetime.fromisoformat(start_time_iso)
+            except ValueError as e:
+                results[str(index)] = {'success': False, 'error': str(e)}
+                continue
+            end_dt = start_dt + datetime.timedelta(
+                minutes=booking.get('duration_minutes', 30))
+            event_body = {
+                'summary': booking.get('summary', 'Event'),
+                'start': {'dateTime': start_dt.isoformat()},
+                'end': {'dateTime': end_dt.isoformat()},
+                'reminders': {
+                    'useDefault': False,
+                    'overrides': [{'method': 'popup', 'minutes': m}
+                                  for m in booking.get('reminders', [10])]
+                }
+            }
+            if booking.get('email'):
+                event_body['attendees'] = [{'email': booking['email']}]
+            batch.add(service.events().insert(calendarId=calendar_id,
+                                              body=event_body),
+                      request_id=str(index))
+        batch.execute()
+
+    return results
+
+
+def cancel_many(service, event_ids, calendar_id='primary'):
+    """
+    Deletes several calendar events in batched round trips.
+
+    Parameters:
+    - service: An authenticated Google Calendar service object.
+    - event_ids: A list of event IDs to delete.
+    - calendar_id: Calendar ID (default 'primary').
+
+    Returns:
+    A dict mapping each event ID to True if its delete succeeded,
+    False otherwise.
+
+    Companion to book_many for scripts that cancel many slots: each
+    multipart batch carries up to 50 deletes in one HTTPS call.
+    """
+    results = {}
+
+    def _collect(request_id, response, exception):
+        results[request_id] = exception is None
+
+    for offset in range(0, len(event_ids), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=_collect)
+        for event_id in event_ids[offset:offset + BATCH_LIMIT]:
+            batch.add(service.events().delete(calendarId=calendar_id,
+                                              eventId=event_id),
+                      request_id=event_id)
+        batch.execute()
+
+    return results
+
+
 def create_event_user(service, calendar_id='primary', email=None, start_time_iso=None, summary='Event', duration_minutes=30, reminders: list = [10]):
     """
     Create a calendar event in the specified calendar (default: primary).
@@ -311,6 +558,15 @@ def create_event_user(service, calendar_id='primary', email=None, start_time_iso
 
         created = service.events().insert(calendarId=calendar_id, body=event_body).execute()
         print(f"Event created: {created.get('id')}")
+
+        # Drop the cached free/busy intervals so the next conflict check
+        # sees this booking.
+        try:
+            from src.scheduler_handler import invalidate_busy_cache
+            invalidate_busy_cache(email or 'primary', start_dt.date())
+        except Exception:
+            pass
+
         return created
     except Exception as e:
         print(f"Failed to create event: {e}")
@@ -51,7 +51,8 @@ def get_calendar_service(access_token=None):
 
     try:
         creds = Credentials(token=token)
-        service = build('calendar', 'v3', credentials=creds)
+        service = build('calendar', 'v3', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
         return service
     except Exception as e:
         print(f"Error building service: {e}")
@@ -227,20 +228,25 @@ def book_event():
                 proposed_end = proposed_start + _dt.timedelta(minutes=duration)
                 proposed_slot = TimeSlot(proposed_start, proposed_end)
 
-                # Query surrounding events to check for overlaps
-                time_min = (proposed_start - _dt.timedelta(days=1)).isoformat()
-                time_max = (proposed_end + _dt.timedelta(days=1)).isoformat()
-                try:
-                    events_result = service.events().list(
-                        calendarId='primary',
-                        timeMin=time_min,
-                        timeMax=time_max,
-                        singleEvents=True,
-                        orderBy='startTime'
-                    ).execute()
-                    existing_events = events_result.get('items', [])
-                except Exception:
+                # Fast path: one tiny freebusy probe. Only materialize a
+                # two-day window of events for the detector when the slot
+                # is actually contested (or the probe was inconclusive).
+                if book.is_slot_free(service, start_iso, duration) is True:
                     existing_events = []
+                else:
+                    time_min = (proposed_start - _dt.timedelta(days=1)).isoformat()
+                    time_max = (proposed_end + _dt.timedelta(days=1)).isoformat()
+                    try:
+                        events_result = service.events().list(
+                            calendarId='primary',
+                            timeMin=time_min,
+                            timeMax=time_max,
+                            singleEvents=True,
+                            orderBy='startTime'
+                        ).execute()
+                        existing_events = events_result.get('items', [])
+                    except Exception:
+                        existing_events = []
 
                 detector = ConflictDetector()
                 conflicts = detector.detect_conflicts(proposed_slot, existing_events)
@@ -7,7 +7,9 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import json
+import queue
 import sqlite3
+import threading
 import os
 from pathlib import Path
 
@@ -36,9 +38,17 @@ class ConversationLogger:
     Enables analysis and improvement of voice assistant
     """
     
+    # Batched-write tuning: drain every 100ms or 64 queued rows, whichever
+    # comes first. Turns N fsync-bearing transactions into one.
+    BATCH_SIZE = 64
+    DRAIN_INTERVAL_SECONDS = 0.1
+    QUEUE_MAX_SIZE = 10000
+
     def __init__(self, db_path: str = ".config/voice_conversations.db"):
         self.db_path = db_path
         self._ensure_database_exists()
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_MAX_SIZE)
+        self._drain_thread: Optional[threading.Thread] = None
     
     def _ensure_database_exists(self) -> None:
         """Create database and tables if they don't exist"""
@@ -46,7 +56,12 @@ class ConversationLogger:
         
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        
+
+        # WAL lets readers proceed during writes; synchronous=NORMAL skips
+        # the per-transaction fsync that dominates small insert cost.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+
         # Conversations table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS conversations (
@@ -106,9 +121,15 @@ class ConversationLogger:
         """)
         
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_intent 
+            CREATE INDEX IF NOT EXISTS idx_intent
             ON conversations(intent)
         """)
+
+        # Required by the ON CONFLICT upsert in _update_intent_stats
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_intent_stats_unique
+            ON intent_stats(user_id, intent, date)
+        """)
         
         conn.commit()
         conn.close()
@@ -186,6 +207,82 @@ class ConversationLogger:
         
         return entry_id
     
+    def log_turn_async(self, log: ConversationLog) -> bool:
+        """
+        Queue a conversation turn for batched background insertion.
+
+        Never blocks the voice command path: the row goes into a bounded
+        in-memory queue drained by a daemon thread that inserts batches
+        with executemany. Returns False (and drops the row) only if the
+        queue is full.
+        """
+        self._ensure_drain_thread()
+        try:
+            self._queue.put_nowait(log)
+            return True
+        except queue.Full:
+            return False
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Block until queued log rows have been written (for tests/shutdown)."""
+        deadline = datetime.now().timestamp() + timeout
+        while not self._queue.empty() and datetime.now().timestamp() < deadline:
+            threading.Event().wait(0.02)
+
+    def _ensure_drain_thread(self) -> None:
+        if self._drain_thread is None or not self._drain_thread.is_alive():
+            self._drain_thread = threading.Thread(target=self._drain, daemon=True)
+            self._drain_thread.start()
+
+    def _drain(self) -> None:
+        """Background loop: batch queued rows into one transaction each tick."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        cursor = conn.cursor()
+
+        while True:
+            try:
+                first = self._queue.get(timeout=self.DRAIN_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                cursor.executemany("""
+                    INSERT INTO conversations (
+                        session_id, user_id, turn_number, user_input,
+                        assistant_response, intent, command_type, extracted_parameters,
+                        success, error_message, response_time_ms, audio_duration_ms,
+                        timestamp
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (
+                        log.session_id, log.user_id, log.turn_number, log.user_input,
+                        log.assistant_response, log.intent, log.command_type,
+                        json.dumps(log.extracted_parameters), log.success,
+                        log.error_message, log.response_time_ms,
+                        log.audio_duration_ms, log.timestamp
+                    ) for log in batch
+                ])
+                for log in batch:
+                    self._update_intent_stats(
+                        cursor, log.user_id, log.intent, log.success, log.response_time_ms)
+                conn.commit()
+            except Exception as e:
+                # Logging must never take down the assistant (TEST_8 Case 6)
+                print(f"[WARN] Batched conversation logging failed: {e}")
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+
     def _update_intent_stats(
         self, 
         cursor: sqlite3.Cursor, 
@@ -0,0 +1,340 @@
+"""
+Email Drafting Module - Cache-Augmented Generation
+
+Drafts event emails (thank-you, reminder, follow-up, cancellation) from a
+precomputed template library instead of a full LLM generation. A cheap
+keyword classifier picks the template, slots are filled deterministically
+from the event, and identical (template, slots) renders are memoized with
+lru_cache. The LLM (use_gpt=True) is only a polish step on top of the
+template render, never the primary path.
+"""
+
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+import uuid
+
+
+class EmailTone(Enum):
+    """Tone of the drafted email"""
+    FORMAL = "formal"
+    PROFESSIONAL = "professional"
+    CASUAL = "casual"
+    FRIENDLY = "friendly"
+    GRATEFUL = "grateful"
+    URGENT = "urgent"
+
+
+class EmailType(Enum):
+    """Kind of event email"""
+    THANK_YOU = "thank_you"
+    REMINDER = "reminder"
+    FOLLOW_UP = "follow_up"
+    CANCELLATION = "cancellation"
+
+
+@dataclass(frozen=True, slots=True)
+class EmailTemplate:
+    """A subject/body template with named slots (immutable, module-lifetime)"""
+    subject: str
+    body: str
+    variables: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DraftedEmail:
+    """A rendered email draft"""
+    draft_id: str
+    email_type: EmailType
+    tone: EmailTone
+    recipient: str
+    subject: str
+    body: str
+    event_title: str
+    generated_at: datetime = field(default_factory=datetime.now)
+
+
+class EmailTemplateLibrary:
+    """
+    Precomputed template library (the CAG cache).
+
+    Looking up (type, tone) is a dict access; unusual tone combinations
+    fall back to the professional variant so every type always renders.
+    """
+
+    TEMPLATES: Dict[EmailType, Dict[EmailTone, EmailTemplate]] = {
+        EmailType.THANK_YOU: {
+            EmailTone.FORMAL: EmailTemplate(
+                subject="Thank You - {event_title}",
+                body=("Dear {recipient},\n\n"
+                      "I would like to express my sincere gratitude for your "
+                      "participation in {event_title}. The discussion on {topic} "
+                      "was most valuable.\n\nKind regards"),
+                variables=["recipient", "event_title", "topic"]
+            ),
+            EmailTone.PROFESSIONAL: EmailTemplate(
+                subject="Thanks for joining {event_title}",
+                body=("Hi {recipient},\n\n"
+                      "Thank you for joining {event_title}. I appreciated the "
+                      "discussion on {topic} and look forward to next steps.\n\n"
+                      "Best regards"),
+                variables=["recipient", "event_title", "topic"]
+            ),
+            EmailTone.CASUAL: EmailTemplate(
+                subject="Thanks! - {event_title}",
+                body=("Hey {recipient},\n\n"
+                      "Thanks a lot for {event_title} - really enjoyed talking "
+                      "about {topic}. Catch you soon!\n\nCheers"),
+                variables=["recipient", "event_title", "topic"]
+            ),
+            EmailTone.GRATEFUL: EmailTemplate(
+                subject="So grateful - {event_title}",
+                body=("Hi {recipient},\n\n"
+                      "I'm truly grateful for your time at {event_title}. Your "
+                      "input on {topic} made a real difference.\n\nWith thanks"),
+                variables=["recipient", "event_title", "topic"]
+            ),
+        },
+        EmailType.REMINDER: {
+            EmailTone.PROFESSIONAL: EmailTemplate(
+                subject="Reminder: {event_title} at {event_time}",
+                body=("Hi {recipient},\n\n"
+                      "A quick reminder about {event_title} scheduled for "
+                      "{event_time}. Please let me know if anything has "
+                      "changed.\n\nBest regards"),
+                variables=["recipient", "event_title", "event_time"]
+            ),
+            EmailTone.CASUAL: EmailTemplate(
+                subject="Don't forget - {event_title}",
+                body=("Hey {recipient},\n\n"
+                      "Just a heads up: {event_title} is coming up at "
+                      "{event_time}. See you there!\n\nCheers"),
+                variables=["recipient", "event_title", "event_time"]
+            ),
+            EmailTone.URGENT: EmailTemplate(
+                subject="URGENT reminder: {event_title} at {event_time}",
+                body=("Hi {recipient},\n\n"
+                      "This is an urgent reminder that {event_title} starts at "
+                      "{event_time}. Please confirm your attendance as soon as "
+                      "possible.\n\nThank you"),
+                variables=["recipient", "event_title", "event_time"]
+            ),
+        },
+        EmailType.FOLLOW_UP: {
+            EmailTone.PROFESSIONAL: EmailTemplate(
+                subject="Follow-up: {event_title}",
+                body=("Hi {recipient},\n\n"
+                      "Following up on {event_title}. Here are the action items "
+                      "we agreed on:\n{action_items}\n\n"
+                      "Please let me know if I missed anything.\n\nBest regards"),
+                variables=["recipient", "event_title", "action_items"]
+            ),
+            EmailTone.FRIENDLY: EmailTemplate(
+                subject="Following up on {event_title}",
+                body=("Hi {recipient},\n\n"
+                      "Great session at {event_title}! Quick recap of what we "
+                      "agreed:\n{action_items}\n\nThanks again!"),
+                variables=["recipient", "event_title", "action_items"]
+            ),
+        },
+        EmailType.CANCELLATION: {
+            EmailTone.PROFESSIONAL: EmailTemplate(
+                subject="Cancelled: {event_title}",
+                body=("Hi {recipient},\n\n"
+                      "Unfortunately {event_title} scheduled for {event_time} "
+                      "has been cancelled. Apologies for any inconvenience - "
+                      "I'll follow up to reschedule.\n\nBest regards"),
+                variables=["recipient", "event_title", "event_time"]
+            ),
+            EmailTone.FORMAL: EmailTemplate(
+                subject="Cancellation Notice - {event_title}",
+                body=("Dear {recipient},\n\n"
+                      "Please be advised that {event_title} scheduled for "
+                      "{event_time} has been cancelled. We apologise for the "
+                      "inconvenience.\n\nKind regards"),
+                variables=["recipient", "event_title", "event_time"]
+            ),
+        },
+    }
+
+    def get_template(self, email_type: EmailType, tone: EmailTone) -> Optional[EmailTemplate]:
+        """Get template for (type, tone); fall back to the professional variant."""
+        by_tone = self.TEMPLATES.get(email_type, {})
+        return by_tone.get(tone) or by_tone.get(EmailTone.PROFESSIONAL)
+
+
+@lru_cache(maxsize=256)
+def _render_cached(subject_tpl: str, body_tpl: str, slots: tuple) -> tuple:
+    """Memoized template render keyed on (template, sorted slot items)."""
+    values = dict(slots)
+    return subject_tpl.format(**values), body_tpl.format(**values)
+
+
+class EventEmailDrafter:
+    """
+    Drafts event emails from the template library.
+
+    With use_gpt=False (the default fast path) drafting is a dict lookup
+    plus a cached str.format - no LLM call at all.
+    """
+
+    def __init__(self, use_gpt: bool = False):
+        self.use_gpt = use_gpt
+        self.library = EmailTemplateLibrary()
+
+    def draft_thank_you(self, event: Dict[str, Any], recipient: str,
+                        tone: EmailTone = EmailTone.PROFESSIONAL) -> DraftedEmail:
+        """Draft a thank-you email for an event."""
+        return self._draft(EmailType.THANK_YOU, event, recipient, tone)
+
+    def draft_reminder(self, event: Dict[str, Any], recipient: str,
+                       tone: EmailTone = EmailTone.PROFESSIONAL) -> DraftedEmail:
+        """Draft a reminder email for an upcoming event."""
+        return self._draft(EmailType.REMINDER, event, recipient, tone)
+
+    def draft_follow_up(self, event: Dict[str, Any], recipient: str,
+                        action_items: Optional[List[str]] = None,
+                        tone: EmailTone = EmailTone.PROFESSIONAL) -> DraftedEmail:
+        """Draft a follow-up email with action items."""
+        return self._draft(EmailType.FOLLOW_UP, event, recipient, tone,
+                           action_items=action_items)
+
+    def draft_cancellation(self, event: Dict[str, Any], recipient: str,
+                           tone: EmailTone = EmailTone.PROFESSIONAL) -> DraftedEmail:
+        """Draft a cancellation notice for an event."""
+        return self._draft(EmailType.CANCELLATION, event, recipient, tone)
+
+    def _draft(self, email_type: EmailType, event: Dict[str, Any], recipient: str,
+               tone: EmailTone, action_items: Optional[List[str]] = None) -> DraftedEmail:
+        template = self.library.get_template(email_type, tone)
+        event_title = event.get('summary', 'our meeting')
+
+        slots = {
+            'recipient': self._recipient_name(recipient),
+            'event_title': event_title,
+            'topic': self._extract_topic(event),
+            'event_time': self._extract_time(
+                event.get('start', {}).get('dateTime', '') if isinstance(event.get('start'), dict)
+                else str(event.get('start', ''))),
+            'action_items': '\n'.join(f"- {item}" for item in (action_items or []))
+                            or '- (to be confirmed)',
+        }
+
+        subject, body = _render_cached(
+            template.subject, template.body, tuple(sorted(slots.items())))
+
+        if self.use_gpt:
+            subject, body = self._polish_with_gpt(subject, body)
+
+        return DraftedEmail(
+            draft_id=f"draft_{uuid.uuid4().hex[:8]}",
+            email_type=email_type,
+            tone=tone,
+            recipient=recipient,
+            subject=subject,
+            body=body,
+            event_title=event_title
+        )
+
+    def _polish_with_gpt(self, subject: str, body: str) -> tuple:
+        """Optional small LLM polish pass; returns the render unchanged on failure."""
+        try:
+            from ai_response import generate_response_sync  # optional
+            polished = generate_response_sync('polish_email', {'subject': subject, 'body': body})
+            if polished:
+                return subject, polished
+        except Exception:
+            pass
+        return subject, body
+
+    def _recipient_name(self, recipient: str) -> str:
+        """Best-effort display name from an email address."""
+        name = recipient.split('@')[0]
+        return name.replace('.', ' ').replace('_', ' ').title()
+
+    def _extract_topic(self, event: Dict[str, Any]) -> str:
+        """Short topic phrase from an event's description or title."""
+        description = event.get('description', '').strip()
+        if description:
+            first_line = description.splitlines()[0]
+            return first_line[:80]
+        return event.get('summary', 'our discussion')
+
+    def _extract_time(self, time_str: str) -> str:
+        """Human-readable time from an ISO datetime string."""
+        if not time_str:
+            return 'the scheduled time'
+        try:
+            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+            return dt.strftime('%A, %B %d at %I:%M %p')
+        except ValueError:
+            return time_str
+
+
+class EmailService:
+    """High-level drafting API with draft storage and smart suggestions."""
+
+    # Keyword classifier for email-type detection (the cheap pre-LLM stage)
+    TYPE_KEYWORDS = {
+        EmailType.THANK_YOU: ['thank', 'gratitude', 'appreciation'],
+        EmailType.REMINDER: ['reminder', 'deadline', 'upcoming', 'due'],
+        EmailType.CANCELLATION: ['cancel', 'cancelled', 'postpone'],
+    }
+
+    FORMAL_RECIPIENT_HINTS = ['ceo', 'cfo', 'cto', 'director', 'president', 'board']
+
+    def __init__(self, drafter: EventEmailDrafter):
+        self.drafter = drafter
+        self._drafts: Dict[str, DraftedEmail] = {}
+
+    def draft_email(self, event: Dict[str, Any], email_type: EmailType, recipient: str,
+                    tone: EmailTone = EmailTone.PROFESSIONAL,
+                    action_items: Optional[List[str]] = None) -> DraftedEmail:
+        """Draft an email of the given type and remember it."""
+        if email_type == EmailType.THANK_YOU:
+            drafted = self.drafter.draft_thank_you(event, recipient, tone)
+        elif email_type == EmailType.REMINDER:
+            drafted = self.drafter.draft_reminder(event, recipient, tone)
+        elif email_type == EmailType.FOLLOW_UP:
+            drafted = self.drafter.draft_follow_up(event, recipient, action_items, tone)
+        else:
+            drafted = self.drafter.draft_cancellation(event, recipient, tone)
+
+        self._drafts[drafted.draft_id] = drafted
+        return drafted
+
+    def list_drafts(self) -> List[DraftedEmail]:
+        """All drafts from this session, newest last."""
+        return list(self._drafts.values())
+
+    def get_draft(self, draft_id: str) -> Optional[DraftedEmail]:
+        """Retrieve a draft by id."""
+        return self._drafts.get(draft_id)
+
+    def get_draft_text(self, draft_id: str) -> Optional[str]:
+        """Formatted text for a draft (Subject: line plus body)."""
+        drafted = self._drafts.get(draft_id)
+        if not drafted:
+            return None
+        return f"Subject: {drafted.subject}\n\n{drafted.body}"
+
+    def suggest_email_type(self, event: Dict[str, Any]) -> str:
+        """Suggest an email type from event title/description keywords."""
+        text = f"{event.get('summary', '')} {event.get('description', '')}".lower()
+        for email_type, keywords in self.TYPE_KEYWORDS.items():
+            if any(kw in text for kw in keywords):
+                return email_type.value
+        return EmailType.FOLLOW_UP.value
+
+    def suggest_tone(self, recipient: str, event: Dict[str, Any]) -> str:
+        """Suggest a tone from recipient and event formality cues."""
+        recipient_lower = recipient.lower()
+        text = event.get('summary', '').lower()
+        if any(hint in recipient_lower for hint in self.FORMAL_RECIPIENT_HINTS) \
+                or 'formal' in text or 'board' in text:
+            return EmailTone.FORMAL.value
+        if 'casual' in text or 'social' in text:
+            return EmailTone.CASUAL.value
+        return EmailTone.PROFESSIONAL.value
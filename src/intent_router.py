@@ -0,0 +1,253 @@
+"""
+Tiered intent router - cheap tiers first, LLM last
+
+Most utterances are small talk or repeats of the same few commands, so
+classifying every turn with the full LLM wastes money and latency. This
+router walks five tiers in order and short-circuits on a confident hit:
+
+    1. fingerprint - blake2b of the normalized text into a dict
+    2. regex/keyword patterns per intent
+    3. SetFit few-shot classifier (optional, ~2-5ms on CPU)
+    4. cheap LLM (e.g. gpt-4o-mini), injected as a callable
+    5. full LLM, injected as a callable
+
+Tiers 1-3 run locally; per-tier hit counts feed the /metrics endpoint
+so the local-resolution rate is visible.
+"""
+
+import re
+import hashlib
+import logging
+from enum import Enum
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+try:
+    from setfit import SetFitModel
+    SETFIT_AVAILABLE = True
+except ImportError:
+    SetFitModel = None
+    SETFIT_AVAILABLE = False
+
+try:
+    from prometheus_client import Counter
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    Counter = None
+    PROMETHEUS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CONFIDENCE_THRESHOLD = 0.7
+SETFIT_MODEL_NAME = "sentence-transformers/paraphrase-MiniLM-L3-v2"
+
+_TIER_COUNTER = (Counter("intent_tier_hits_total",
+                         "Intent classifications resolved per tier",
+                         labelnames=["tier"])
+                 if PROMETHEUS_AVAILABLE else None)
+
+
+class Intent(Enum):
+    """Intents the router distinguishes"""
+    BOOK = "book"
+    LIST = "list"
+    REMIND = "remind"
+    SMALL_TALK = "small_talk"
+    GENERAL = "general"
+
+
+@dataclass(slots=True)
+class IntentResult:
+    """Outcome of a classification"""
+    intent: Intent
+    confidence: float
+    tier: str  # fingerprint, regex, setfit, cheap_llm, full_llm
+
+    def to_dict(self) -> Dict:
+        return {
+            "intent": self.intent.value,
+            "confidence": round(self.confidence, 3),
+            "tier": self.tier,
+        }
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip punctuation, collapse whitespace."""
+    return re.sub(r'\s+', ' ', re.sub(r"[^a-z0-9' ]", ' ', text.lower())).strip()
+
+
+def _fingerprint(text: str) -> bytes:
+    return hashlib.blake2b(normalize(text).encode(), digest_size=16).digest()
+
+
+# Tier 1 seed: exact phrasings seen over and over in the voice logs
+_SEED_PHRASES = {
+    Intent.BOOK: [
+        "book a meeting", "book an event", "schedule a meeting",
+        "create an event", "add an event",
+    ],
+    Intent.LIST: [
+        "what's on my calendar", "show my events", "list my events",
+        "what do i have today", "what's on my schedule today",
+    ],
+    Intent.REMIND: [
+        "remind me", "set a reminder", "set a reminder for me",
+    ],
+    Intent.SMALL_TALK: [
+        "hello", "hi", "hey", "thank you", "thanks", "good morning",
+        "good afternoon", "how are you", "goodbye", "bye",
+    ],
+}
+
+# Tier 2: looser patterns
+_INTENT_PATTERNS = [
+    (Intent.BOOK, re.compile(
+        r'\b(book|schedule|create|add|set up)\b.*\b(meeting|event|'
+        r'appointment|call|session|slot)\b')),
+    (Intent.LIST, re.compile(
+        r"\b(show|list|what'?s?|read|tell me|do i have)\b.*"
+        r'\b(calendar|schedule|events?|meetings?|agenda|appointments?)\b')),
+    (Intent.REMIND, re.compile(r'\b(remind(er)?|don\'?t let me forget)\b')),
+    (Intent.SMALL_TALK, re.compile(
+        r'^(hello|hi|hey|thanks?( you)?|good (morning|afternoon|evening)|'
+        r'how are you|goodbye|bye)\b')),
+]
+
+
+class IntentRouter:
+    """
+    Walk the tiers in order, short-circuiting on confidence >=
+    CONFIDENCE_THRESHOLD. LLM tiers are injected callables taking the
+    utterance and returning an intent name (so tests and the offline
+    path never touch the network).
+    """
+
+    def __init__(
+        self,
+        cheap_llm: Optional[Callable[[str], str]] = None,
+        full_llm: Optional[Callable[[str], str]] = None,
+        use_setfit: bool = True
+    ):
+        self.cheap_llm = cheap_llm
+        self.full_llm = full_llm
+        self.tier_hits = {t: 0 for t in
+                          ("fingerprint", "regex", "setfit",
+                           "cheap_llm", "full_llm")}
+        self._fingerprints: Dict[bytes, Intent] = {}
+        for intent, phrases in _SEED_PHRASES.items():
+            for phrase in phrases:
+                self._fingerprints[_fingerprint(phrase)] = intent
+
+        self.setfit_model = None
+        if use_setfit and SETFIT_AVAILABLE:
+            self._load_setfit()
+
+    def _load_setfit(self) -> None:
+        try:
+            self.setfit_model = SetFitModel.from_pretrained(SETFIT_MODEL_NAME)
+            logger.info("SetFit intent model loaded")
+        except Exception as e:
+            logger.warning(f"Could not load SetFit model: {e}")
+            self.setfit_model = None
+
+    @property
+    def local_rate(self) -> float:
+        """Fraction of classifications that never reached an LLM tier."""
+        total = sum(self.tier_hits.values())
+        if total == 0:
+            return 1.0
+        local = (self.tier_hits["fingerprint"] + self.tier_hits["regex"]
+                 + self.tier_hits["setfit"])
+        return local / total
+
+    def classify(self, text: str) -> IntentResult:
+        """Classify one utterance, cheapest tier first."""
+        normalized = normalize(text)
+        if not normalized:
+            return self._resolve(Intent.GENERAL, 0.0, "regex")
+
+        # Tier 1: exact fingerprint
+        intent = self._fingerprints.get(_fingerprint(normalized))
+        if intent is not None:
+            return self._resolve(intent, 1.0, "fingerprint")
+
+        # Tier 2: regex/keyword
+        for intent, pattern in _INTENT_PATTERNS:
+            if pattern.search(normalized):
+                return self._resolve(intent, 0.85, "regex",
+                                     memoize=normalized)
+
+        # Tier 3: SetFit
+        if self.setfit_model is not None:
+            result = self._classify_setfit(normalized)
+            if result is not None:
+                return result
+
+        # Tier 4: cheap LLM
+        if self.cheap_llm is not None:
+            intent = self._ask_llm(self.cheap_llm, text)
+            if intent is not None and intent != Intent.GENERAL:
+                return self._resolve(intent, 0.75, "cheap_llm")
+
+        # Tier 5: full LLM (or GENERAL when offline)
+        if self.full_llm is not None:
+            intent = self._ask_llm(self.full_llm, text)
+            if intent is not None:
+                return self._resolve(intent, 0.9, "full_llm")
+        return self._resolve(Intent.GENERAL, 0.4, "full_llm")
+
+    def _classify_setfit(self, normalized: str) -> Optional[IntentResult]:
+        try:
+            probs = self.setfit_model.predict_proba([normalized])[0]
+            best = int(max(range(len(probs)), key=lambda i: probs[i]))
+            confidence = float(probs[best])
+            if confidence >= CONFIDENCE_THRESHOLD:
+                intent = list(Intent)[best]
+                return self._resolve(intent, confidence, "setfit",
+                                     memoize=normalized)
+        except Exception as e:
+            logger.warning(f"SetFit classification failed: {e}")
+            self.setfit_model = None
+        return None
+
+    def _ask_llm(self, llm: Callable[[str], str],
+                 text: str) -> Optional[Intent]:
+        try:
+            name = str(llm(text)).strip().lower()
+            for intent in Intent:
+                if intent.value in name:
+                    return intent
+        except Exception as e:
+            logger.warning(f"LLM intent tier failed: {e}")
+        return None
+
+    def _resolve(self, intent: Intent, confidence: float, tier: str,
+                 memoize: Optional[str] = None) -> IntentResult:
+        self.tier_hits[tier] += 1
+        if _TIER_COUNTER is not None:
+            _TIER_COUNTER.labels(tier=tier).inc()
+        # Confident lower-tier hits become fingerprints, so repeats of
+        # the same phrasing resolve in tier 1 next time
+        if memoize and confidence >= CONFIDENCE_THRESHOLD:
+            self._fingerprints[_fingerprint(memoize)] = intent
+        return IntentResult(intent, confidence, tier)
+
+    def get_tier_stats(self) -> Dict:
+        """Per-tier hit counts plus the local-resolution rate."""
+        return {
+            "tier_hits": dict(self.tier_hits),
+            "local_rate": round(self.local_rate, 3),
+            "total": sum(self.tier_hits.values()),
+        }
+
+
+# Global instance
+_router = None
+
+
+def get_intent_router() -> IntentRouter:
+    """Get or create the shared intent router."""
+    global _router
+    if _router is None:
+        _router = IntentRouter()
+    return _router
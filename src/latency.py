@@ -0,0 +1,95 @@
+"""
+Per-stage latency instrumentation for the voice pipeline.
+
+Averages hide tail spikes, so each stage (cleanup, STT, NLU, action,
+TTS) is timed into a histogram with fine buckets. With
+prometheus_client installed the samples also feed a Prometheus
+Histogram exposed on /metrics; without it the in-process reservoir
+still answers p50/p95/p99 queries for /api/voice/stats.
+"""
+
+import time
+import threading
+from bisect import insort
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+try:
+    from prometheus_client import Histogram, generate_latest, CONTENT_TYPE_LATEST
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    Histogram = None
+    generate_latest = None
+    CONTENT_TYPE_LATEST = 'text/plain'
+    PROMETHEUS_AVAILABLE = False
+
+BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.8, 1.2, 2.0, 3.0, 5.0)
+
+STAGE_HIST = None
+if PROMETHEUS_AVAILABLE:
+    STAGE_HIST = Histogram(
+        "voice_stage_seconds", "Voice pipeline stage latency",
+        labelnames=["stage"], buckets=BUCKETS)
+
+# In-process reservoir: last N sorted samples per stage, for percentile
+# queries without a Prometheus scraper.
+_RESERVOIR_SIZE = 512
+_samples: Dict[str, List[float]] = {}
+_lock = threading.Lock()
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """Time a pipeline stage: `with stage_timer('stt'): ...`"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        observe(stage, elapsed)
+
+
+def observe(stage: str, seconds: float) -> None:
+    """Record one stage sample."""
+    if STAGE_HIST is not None:
+        STAGE_HIST.labels(stage).observe(seconds)
+    with _lock:
+        samples = _samples.setdefault(stage, [])
+        insort(samples, seconds)
+        if len(samples) > _RESERVOIR_SIZE:
+            # Drop a middling sample so min/max tails survive
+            del samples[len(samples) // 2]
+
+
+def _percentile(sorted_samples: List[float], pct: float) -> float:
+    idx = min(int(len(sorted_samples) * pct / 100), len(sorted_samples) - 1)
+    return sorted_samples[idx]
+
+
+def get_stage_stats() -> Dict[str, Dict[str, float]]:
+    """p50/p95/p99 (ms) and sample count per stage."""
+    stats = {}
+    with _lock:
+        for stage, samples in _samples.items():
+            if not samples:
+                continue
+            stats[stage] = {
+                'p50_ms': round(_percentile(samples, 50) * 1000, 1),
+                'p95_ms': round(_percentile(samples, 95) * 1000, 1),
+                'p99_ms': round(_percentile(samples, 99) * 1000, 1),
+                'count': len(samples),
+            }
+    return stats
+
+
+def reset_stats() -> None:
+    """Clear the in-process reservoir (tests)."""
+    with _lock:
+        _samples.clear()
+
+
+def metrics_response() -> Optional[tuple]:
+    """(body, content_type) for a /metrics endpoint, or None."""
+    if not PROMETHEUS_AVAILABLE:
+        return None
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,65 @@
+"""
+Shared OpenAI client with one HTTP/2 connection pool
+
+ai_intent_handler and ai_response each used to build their own
+AsyncOpenAI client at import, so each module owned a separate httpx
+pool to api.openai.com and paid its own first-call TLS handshake
+(~100ms). One lazily-built client per flavor (async/sync) means
+keep-alive amortizes the handshake across all modules, and HTTP/2
+multiplexes concurrent interpret_batch calls over a single connection
+instead of opening N.
+"""
+
+import os
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_async_client = None
+_sync_client = None
+
+
+def _build_http_client(async_flavor: bool):
+    """Pooled httpx client (HTTP/2 when the h2 extra is installed)."""
+    try:
+        import httpx
+    except ImportError:
+        return None
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64,
+                          keepalive_expiry=60)
+    timeout = httpx.Timeout(30.0, connect=5.0)
+    cls = httpx.AsyncClient if async_flavor else httpx.Client
+    try:
+        return cls(http2=True, limits=limits, timeout=timeout)
+    except ImportError:
+        # http2 extra (h2) not installed; HTTP/1.1 keep-alive still pools
+        return cls(limits=limits, timeout=timeout)
+
+
+def get_async_client():
+    """Get or create the shared AsyncOpenAI client (None without a key)."""
+    global _async_client
+    if _async_client is None:
+        api_key = os.environ.get('OPENAI_API_KEY')
+        if not api_key:
+            return None
+        from openai import AsyncOpenAI
+        _async_client = AsyncOpenAI(
+            api_key=api_key, http_client=_build_http_client(True))
+        logger.info("Shared AsyncOpenAI client initialized")
+    return _async_client
+
+
+def get_sync_client():
+    """Get or create the shared sync OpenAI client (None without a key)."""
+    global _sync_client
+    if _sync_client is None:
+        api_key = os.environ.get('OPENAI_API_KEY')
+        if not api_key:
+            return None
+        from openai import OpenAI
+        _sync_client = OpenAI(
+            api_key=api_key, http_client=_build_http_client(False))
+        logger.info("Shared OpenAI client initialized")
+    return _sync_client
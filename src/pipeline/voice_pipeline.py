@@ -13,6 +13,8 @@ from src.audio_processing.cleanup import get_audio_cleanup
 from src.ai.voice_parser import parse_transcript
 from src.actions.calendar_actions import create_event, get_events, cancel_event
 from src.tts.tts_engine import get_tts_engine
+from src.stt.vad import get_endpointer
+from src.latency import stage_timer
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +27,13 @@ class VoicePipeline:
         self.stt_engine = get_stt_engine()
         self.audio_cleanup = get_audio_cleanup()
         self.tts_engine = get_tts_engine()
-        
+        self.endpointer = get_endpointer()
+
         self.state = "IDLE"  # IDLE, TRIGGER_DETECTED, CAPTURING, PROCESSING, RESPONDING
         self.current_user_id = None
         self.audio_buffer = bytearray()
         self.silence_count = 0
-        self.max_silence_frames = 24  # 1.5s @ 16kHz, 4096 chunk size
+        self.max_silence_frames = 24  # no-speech timeout: 1.5s @ 16kHz, 4096 chunk size
     
     def process_audio_chunk(
         self,
@@ -98,6 +101,7 @@ class VoicePipeline:
                 self.state = "TRIGGER_DETECTED"
                 self.audio_buffer = bytearray()
                 self.silence_count = 0
+                self.endpointer.reset()
                 
                 # Return activation feedback
                 return {
@@ -132,17 +136,21 @@ class VoicePipeline:
             # Add to buffer
             self.audio_buffer.extend(audio_chunk)
             
-            # Check for silence
+            # VAD endpointing: cut ~200ms after the user stops speaking
+            # instead of waiting out the full silence timeout
+            utterance_ended = self.endpointer.update(audio_chunk)
+
+            # Check for silence (no-speech timeout safety net)
             silence_result = self.stt_engine.detect_silence(audio_chunk)
-            
+
             if silence_result["is_silent"]:
                 self.silence_count += 1
             else:
                 self.silence_count = 0  # Reset silence counter
-            
-            # Check for silence timeout or final chunk
-            if is_final or self.silence_count >= self.max_silence_frames:
-                logger.info("Silence detected or final chunk, processing audio")
+
+            # Check for endpoint, silence timeout or final chunk
+            if is_final or utterance_ended or self.silence_count >= self.max_silence_frames:
+                logger.info("Endpoint detected or final chunk, processing audio")
                 
                 # Stage 5: Stop recording
                 self.state = "PROCESSING"
@@ -173,7 +181,8 @@ class VoicePipeline:
             
             # Stage 6: Audio cleanup
             logger.info("Running audio cleanup pipeline...")
-            cleanup_result = self.audio_cleanup.cleanup_audio(audio_bytes)
+            with stage_timer("cleanup"):
+                cleanup_result = self.audio_cleanup.cleanup_audio(audio_bytes)
             
             if cleanup_result["success"]:
                 audio_cleaned = cleanup_result["audio_cleaned"]
@@ -183,7 +192,8 @@ class VoicePipeline:
             
             # Stage 7: Speech recognition
             logger.info("Running speech recognition...")
-            stt_result = self.stt_engine.recognize_speech(audio_cleaned)
+            with stage_timer("stt"):
+                stt_result = self.stt_engine.recognize_speech(audio_cleaned)
             
             transcript = stt_result.get("result", "")
             confidence = stt_result.get("confidence", 0)
@@ -229,7 +239,8 @@ class VoicePipeline:
         """Stage 8-9: Parse intent and execute action"""
         try:
             # Stage 8: NLU parsing
-            nlu_result = parse_transcript(transcript)
+            with stage_timer("nlu"):
+                nlu_result = parse_transcript(transcript)
             
             if not nlu_result.get("ok"):
                 # Parsing failed
@@ -246,7 +257,8 @@ class VoicePipeline:
             
             # Stage 9: Execute action
             logger.info(f"Executing action: {action}")
-            action_result = self._execute_action(user_id, action, nlu_result)
+            with stage_timer("action"):
+                action_result = self._execute_action(user_id, action, nlu_result)
             
             # Stage 10: TTS synthesis
             self.state = "RESPONDING"
@@ -373,11 +385,12 @@ class VoicePipeline:
             spoken_time = action_result.get("spoken_time")
             
             # Synthesize audio
-            tts_result = self.tts_engine.synthesize_text(
-                text=assistant_text,
-                voice="female",
-                speed="normal"
-            )
+            with stage_timer("tts"):
+                tts_result = self.tts_engine.synthesize_text(
+                    text=assistant_text,
+                    voice="female",
+                    speed="normal"
+                )
             
             if tts_result["success"]:
                 # Stage 11: Playback (handled by frontend)
@@ -421,6 +434,7 @@ class VoicePipeline:
         self.state = "IDLE"
         self.audio_buffer = bytearray()
         self.silence_count = 0
+        self.endpointer.reset()
         logger.info("Pipeline reset to IDLE")
 
 
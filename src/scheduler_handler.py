@@ -21,18 +21,30 @@ SchedulePreferences = None
 AgendaSummaryService = None
 AgendaEvent = None
 PatternPredictionService = None
-EventEmailDrafter = None
-EmailService = None
-EmailTone = None
-EmailType = None
-VoiceSentimentAnalyzer = None
-EmotionResponseEngine = None
-EmotionDetection = None
-TaskExtractor = None
+try:
+    from src.email_drafter import EventEmailDrafter, EmailService, EmailTone, EmailType
+except ImportError:
+    EventEmailDrafter = None
+    EmailService = None
+    EmailTone = None
+    EmailType = None
+try:
+    from src.voice_sentiment import VoiceSentimentAnalyzer, EmotionResponseEngine, EmotionDetection
+except ImportError:
+    VoiceSentimentAnalyzer = None
+    EmotionResponseEngine = None
+    EmotionDetection = None
+try:
+    from src.task_extractor import TaskExtractor
+except ImportError:
+    TaskExtractor = None
 JarvisConversationManager = None
 DialogueType = None
-VisualCalendarAnalyzer = None
-CalendarHeatmap = None
+try:
+    from src.visual_calendar import VisualCalendarAnalyzer, CalendarHeatmap
+except ImportError:
+    VisualCalendarAnalyzer = None
+    CalendarHeatmap = None
 AccessibilityManager = None
 SpeechRate = None
 AccessibilityMode = None
@@ -44,6 +56,178 @@ try:
 except ImportError:
     HAS_GOOGLE_API = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+# ---------------------------------------------------------------------------
+# Free/busy cache
+#
+# Conflict detection used to issue a fresh events.list per check; each HTTPS
+# round trip is 50-300ms. Instead we fetch the busy intervals for the whole
+# day with one freebusy.query, keep them for a short TTL keyed by
+# (user, date), and answer conflict checks with an in-memory bisect.
+# ---------------------------------------------------------------------------
+
+BUSY_CACHE_TTL_SECONDS = 30
+# (user_id, date, calendar_id) -> (fetched_at, intervals, starts_ts, ends_ts)
+# starts_ts/ends_ts are the same intervals as sorted epoch-second arrays
+# (int64 NumPy when available, plain lists otherwise) so conflict checks
+# are a searchsorted instead of a Python scan.
+_busy_cache: Dict[tuple, tuple] = {}
+
+
+def get_busy_intervals(service, user_id: str, date, calendar_id: str = 'primary') -> List[tuple]:
+    """
+    Return the busy intervals for user_id on date as a sorted list of
+    (start, end) datetime tuples, using one freebusy.query per day per TTL
+    window instead of an API call per conflict check.
+    """
+    return _get_busy_entry(service, user_id, date, calendar_id)[0]
+
+
+def _get_busy_entry(service, user_id: str, date, calendar_id: str = 'primary') -> tuple:
+    """Fetch (intervals, starts_ts, ends_ts) for a day, via the TTL cache."""
+    key = (user_id, str(date), calendar_id)
+    now = datetime.now().timestamp()
+    cached = _busy_cache.get(key)
+    if cached and now - cached[0] < BUSY_CACHE_TTL_SECONDS:
+        return cached[1], cached[2], cached[3]
+
+    day_start = datetime.combine(date if not isinstance(date, datetime) else date.date(), datetime.min.time())
+    day_end = day_start + timedelta(days=1)
+    body = {
+        'timeMin': day_start.isoformat() + 'Z',
+        'timeMax': day_end.isoformat() + 'Z',
+        'items': [{'id': calendar_id}]
+    }
+    response = service.freebusy().query(body=body).execute()
+    busy = response.get('calendars', {}).get(calendar_id, {}).get('busy', [])
+
+    intervals = []
+    for interval in busy:
+        try:
+            start = datetime.fromisoformat(interval['start'].replace('Z', '+00:00'))
+            end = datetime.fromisoformat(interval['end'].replace('Z', '+00:00'))
+            intervals.append((start, end))
+        except Exception:
+            continue
+    intervals.sort()
+
+    starts_ts = [iv[0].timestamp() for iv in intervals]
+    ends_ts = [iv[1].timestamp() for iv in intervals]
+    if HAS_NUMPY:
+        starts_ts = np.asarray(starts_ts, dtype=np.int64)
+        ends_ts = np.asarray(ends_ts, dtype=np.int64)
+
+    _busy_cache[key] = (now, intervals, starts_ts, ends_ts)
+    return intervals, starts_ts, ends_ts
+
+
+def check_conflict(service, user_id: str, start: datetime, end: datetime, calendar_id: str = 'primary') -> bool:
+    """
+    True if [start, end) overlaps a busy interval. Uses the cached sorted
+    timestamp arrays and a searchsorted/bisect instead of a new API call
+    (or a linear scan) per check.
+    """
+    intervals, starts_ts, ends_ts = _get_busy_entry(service, user_id, start.date(), calendar_id)
+    if not intervals:
+        return False
+
+    s, e = start.timestamp(), end.timestamp()
+    if HAS_NUMPY:
+        idx = int(np.searchsorted(starts_ts, e, side='left'))
+    else:
+        import bisect
+        idx = bisect.bisect_left(starts_ts, e)
+    # Intervals are sorted and non-overlapping (freebusy merges them), so
+    # only the last interval starting before our end can still be running.
+    return idx > 0 and ends_ts[idx - 1] > s
+
+
+def suggest_free_slots(service, user_id: str, date, duration_minutes: int = 60,
+                       count: int = 3, calendar_id: str = 'primary') -> List[datetime]:
+    """
+    Suggest up to `count` free slot start times of at least
+    duration_minutes on date, scanning the gaps between cached busy
+    intervals as one vectorized pass (NumPy) or a single loop (fallback).
+    """
+    intervals, starts_ts, ends_ts = _get_busy_entry(service, user_id, date, calendar_id)
+
+    day = date.date() if isinstance(date, datetime) else date
+    work_start = datetime.combine(day, datetime.min.time()) + timedelta(hours=8)
+    work_end = datetime.combine(day, datetime.min.time()) + timedelta(hours=18)
+    duration = duration_minutes * 60
+
+    if not intervals:
+        return [work_start]
+
+    tz = intervals[0][0].tzinfo
+    if tz is not None:
+        work_start = work_start.replace(tzinfo=tz)
+        work_end = work_end.replace(tzinfo=tz)
+
+    # Candidate gap = (end of one interval, start of the next), plus the
+    # edges of the work day.
+    if HAS_NUMPY:
+        gap_starts = np.concatenate(([int(work_start.timestamp())], ends_ts))
+        gap_ends = np.concatenate((starts_ts, [int(work_end.timestamp())]))
+        ok = np.where(gap_ends - gap_starts >= duration)[0]
+        candidates = gap_starts[ok][:count]
+        return [datetime.fromtimestamp(int(ts), tz=tz) for ts in candidates]
+
+    gap_starts = [work_start.timestamp()] + list(ends_ts)
+    gap_ends = list(starts_ts) + [work_end.timestamp()]
+    slots = []
+    for gs, ge in zip(gap_starts, gap_ends):
+        if ge - gs >= duration:
+            slots.append(datetime.fromtimestamp(gs, tz=tz))
+            if len(slots) >= count:
+                break
+    return slots
+
+
+def invalidate_busy_cache(user_id: Optional[str] = None, date=None):
+    """Drop cached busy intervals (call after a successful events.insert)."""
+    if user_id is None:
+        _busy_cache.clear()
+        return
+    for key in [k for k in _busy_cache if k[0] == user_id and (date is None or k[1] == str(date))]:
+        _busy_cache.pop(key, None)
+
+
+# ---------------------------------------------------------------------------
+# NLU preparse cache
+#
+# Interim STT transcripts are parsed while the user is still speaking so the
+# final /api/parse_event call can reuse the result instead of starting NLU
+# from scratch at end-of-utterance.
+# ---------------------------------------------------------------------------
+
+PREPARSE_TTL_SECONDS = 30
+_PREPARSE_MAX_ENTRIES = 64
+_preparse_cache: Dict[str, tuple] = {}  # normalized text -> (timestamp, parsed)
+
+
+def store_preparsed(text: str, parsed: Dict[str, Any]):
+    """Remember the NLU parse for an interim transcript."""
+    if len(_preparse_cache) >= _PREPARSE_MAX_ENTRIES:
+        oldest = min(_preparse_cache, key=lambda k: _preparse_cache[k][0])
+        _preparse_cache.pop(oldest, None)
+    _preparse_cache[text.strip().lower()] = (datetime.now().timestamp(), parsed)
+
+
+def get_preparsed(text: str) -> Optional[Dict[str, Any]]:
+    """Return a warmed parse for text if one is fresh, else None."""
+    cached = _preparse_cache.get(text.strip().lower())
+    if cached and datetime.now().timestamp() - cached[0] < PREPARSE_TTL_SECONDS:
+        return cached[1]
+    return None
+
 
 class SchedulerCommandHandler:
     """Handles voice commands and web requests for smart scheduling."""
@@ -1037,10 +1221,10 @@ class SchedulerCommandHandler:
     def handle_parse_event(self, command_params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse natural language event description into structured format.
-        
+
         Args:
             command_params: Dict with 'text' (NL event description)
-            
+
         Returns:
             Dict with parsed event structure
         """
@@ -1048,10 +1232,13 @@ class SchedulerCommandHandler:
             text = command_params.get('text', '')
             if not text:
                 return {'status': 'error', 'message': 'No text provided'}
-            
-            # Parse the natural language event
-            parsed_event = parse_natural_language_event(text)
-            
+
+            # Reuse a parse warmed by /api/nlu/preparse on an interim
+            # transcript, if the final transcript matches.
+            parsed_event = get_preparsed(text)
+            if parsed_event is None:
+                parsed_event = parse_natural_language_event(text)
+
             return {
                 'status': 'success',
                 'event': parsed_event,
@@ -1059,6 +1246,24 @@ class SchedulerCommandHandler:
             }
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
+
+    def handle_preparse(self, command_params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Warm the NLU cache from an interim (non-final) STT transcript.
+
+        The browser posts partial transcripts while the user is still
+        speaking; we parse them eagerly so that by the time the final
+        transcript arrives the booking handler can respond immediately.
+        """
+        try:
+            text = command_params.get('text', '')
+            if not text:
+                return {'status': 'error', 'message': 'No text provided'}
+
+            store_preparsed(text, parse_natural_language_event(text))
+            return {'status': 'success', 'message': 'Preparse cached'}
+        except Exception as e:
+            return {'status': 'error', 'message': str(e)}
     
     def handle_suggest_times(self, command_params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1520,6 +1725,23 @@ def create_scheduler_endpoints(app, scheduler_handler):
         except Exception as e:
             return jsonify({'error': str(e), 'status': 'error'}), 400
 
+    @app.route('/api/nlu/preparse', methods=['POST'])
+    def nlu_preparse_api():
+        """
+        Warm the NLU cache from an interim (non-final) STT transcript.
+
+        POST body:
+        {
+            "text": "book meeting tomo..."  # partial transcript
+        }
+        """
+        try:
+            data = request.get_json() or {}
+            result = scheduler_handler.handle_preparse(data)
+            return jsonify(result), 200 if result.get('status') == 'success' else 400
+        except Exception as e:
+            return jsonify({'error': str(e), 'status': 'error'}), 400
+
     @app.route('/api/suggest_times', methods=['POST'])
     def suggest_times_api():
         """
@@ -0,0 +1,204 @@
+"""
+Semantic Response Cache for AI Endpoints
+
+Caches AI (ChatGPT) responses so paraphrased prompts ("draft thank you
+email for meeting X" vs "write a thanks note for event X") can reuse a
+stored answer instead of re-invoking the LLM.
+
+When sentence-transformers + faiss are installed, prompts are embedded
+with all-MiniLM-L6-v2 and matched by cosine similarity (inner product on
+normalized vectors). Without them the cache degrades gracefully to an
+exact-match lookup on the canonicalized prompt, which still absorbs
+repeat requests.
+
+Event IDs, dates, and times are canonicalized to placeholder tokens
+before matching so "email for event 123" never false-matches "email for
+event 456".
+"""
+
+import hashlib
+import re
+import time
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    import faiss
+    HAS_EMBEDDINGS = True
+except Exception:
+    np = None
+    SentenceTransformer = None
+    faiss = None
+    HAS_EMBEDDINGS = False
+
+
+_EVENT_ID_PATTERN = re.compile(r"\b(?:event|meeting|id)[\s#:]*\d+\b", re.I)
+_DATE_PATTERN = re.compile(r"\b\d{4}-\d{2}-\d{2}(?:T[\d:+.Z-]+)?\b|\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b")
+_TIME_PATTERN = re.compile(r"\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b", re.I)
+
+
+def canonicalize(prompt: str) -> str:
+    """Replace entity-specific tokens (event ids, dates, times) with placeholders."""
+    text = _EVENT_ID_PATTERN.sub('<EVENT_ID>', prompt.lower())
+    text = _DATE_PATTERN.sub('<DATE>', text)
+    text = _TIME_PATTERN.sub('<TIME>', text)
+    return re.sub(r"\s+", ' ', text).strip()
+
+
+class SemanticCache:
+    """Embedding-based (or exact-match fallback) cache for LLM responses."""
+
+    def __init__(self, similarity_threshold: float = 0.92,
+                 ttl_seconds: int = 3600, max_entries: int = 512):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # exact-match store: canonical-prompt hash -> (timestamp, response)
+        self._exact: Dict[str, tuple] = {}
+        self._model = None
+        self._index = None
+        self._entries = []  # parallel to index rows: (timestamp, response)
+
+    def _embed(self, text: str):
+        if not HAS_EMBEDDINGS:
+            return None
+        if self._model is None:
+            try:
+                self._model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+            except Exception:
+                return None
+        vec = self._model.encode([text], normalize_embeddings=True)
+        return vec.astype('float32')
+
+    def _semantic_lookup(self, vec) -> Optional[str]:
+        if self._index is None or self._index.ntotal == 0:
+            return None
+        scores, ids = self._index.search(vec, 1)
+        idx = int(ids[0][0])
+        if idx < 0 or scores[0][0] < self.similarity_threshold:
+            return None
+        timestamp, response = self._entries[idx]
+        if time.time() - timestamp > self.ttl_seconds:
+            return None
+        return response
+
+    def _semantic_store(self, vec, response: str):
+        if vec is None:
+            return
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(vec.shape[1])
+        if self._index.ntotal >= self.max_entries:
+            # cheap eviction: rebuild empty rather than tracking ages per row
+            self._index.reset()
+            self._entries = []
+        self._index.add(vec)
+        self._entries.append((time.time(), response))
+
+    def lookup(self, prompt: str) -> Optional[Any]:
+        """Return the cached response for prompt, or None on a miss.
+
+        Useful from async call sites that can't hand us a compute_fn.
+        """
+        canonical = canonicalize(prompt)
+        key = hashlib.sha256(canonical.encode()).hexdigest()
+
+        # exact match first (covers the no-embeddings fallback too)
+        cached = self._exact.get(key)
+        if cached and time.time() - cached[0] < self.ttl_seconds:
+            self.hits += 1
+            return cached[1]
+
+        vec = self._embed(canonical)
+        if vec is not None:
+            response = self._semantic_lookup(vec)
+            if response is not None:
+                self.hits += 1
+                return response
+
+        self.misses += 1
+        return None
+
+    def lookup_many(self, prompts) -> list:
+        """Batched lookup: one embedding pass and one index query for N
+        prompts instead of N separate ones. Returns a list aligned with
+        prompts, None for misses."""
+        canonicals = [canonicalize(p) for p in prompts]
+        results = [None] * len(prompts)
+        now = time.time()
+
+        miss_indices = []
+        for i, canonical in enumerate(canonicals):
+            key = hashlib.sha256(canonical.encode()).hexdigest()
+            cached = self._exact.get(key)
+            if cached and now - cached[0] < self.ttl_seconds:
+                results[i] = cached[1]
+            else:
+                miss_indices.append(i)
+
+        if (miss_indices and HAS_EMBEDDINGS and self._index is not None
+                and self._index.ntotal > 0):
+            vecs = self._embed_many([canonicals[i] for i in miss_indices])
+            if vecs is not None:
+                scores, ids = self._index.search(vecs, 1)
+                still_missing = []
+                for row, i in enumerate(miss_indices):
+                    idx = int(ids[row][0])
+                    if idx >= 0 and scores[row][0] >= self.similarity_threshold:
+                        timestamp, response = self._entries[idx]
+                        if now - timestamp <= self.ttl_seconds:
+                            results[i] = response
+                            continue
+                    still_missing.append(i)
+                miss_indices = still_missing
+
+        self.hits += len(prompts) - len(miss_indices)
+        self.misses += len(miss_indices)
+        return results
+
+    def _embed_many(self, texts):
+        if not HAS_EMBEDDINGS or not texts:
+            return None
+        if self._model is None:
+            try:
+                self._model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+            except Exception:
+                return None
+        return self._model.encode(texts, normalize_embeddings=True).astype('float32')
+
+    def store(self, prompt: str, response: Any):
+        """Cache a computed response under the canonicalized prompt."""
+        canonical = canonicalize(prompt)
+        key = hashlib.sha256(canonical.encode()).hexdigest()
+        if len(self._exact) >= self.max_entries:
+            oldest = min(self._exact, key=lambda k: self._exact[k][0])
+            self._exact.pop(oldest, None)
+        self._exact[key] = (time.time(), response)
+        self._semantic_store(self._embed(canonical), response)
+
+    def get_or_compute(self, prompt: str, compute_fn: Callable[[], Any]) -> Any:
+        """Return a cached response for prompt, or compute_fn() on a miss."""
+        response = self.lookup(prompt)
+        if response is not None:
+            return response
+        response = compute_fn()
+        self.store(prompt, response)
+        return response
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._exact.clear()
+        self._entries = []
+        if self._index is not None:
+            self._index.reset()
+
+
+# Shared cache instance for the web app's AI endpoints.
+_cache = SemanticCache()
+
+
+def get_or_compute(prompt: str, compute_fn: Callable[[], Any]) -> Any:
+    """Module-level convenience wrapper around the shared SemanticCache."""
+    return _cache.get_or_compute(prompt, compute_fn)
@@ -0,0 +1,126 @@
+"""
+Voice Activity Detection - early endpoint detection
+
+Default energy-based endpointing waits ~1.5s of silence before closing
+the capture; most of that is dead air the user perceives as lag. This
+endpointer scores each frame's speech probability - with the Silero VAD
+ONNX model (~2MB, <1ms/frame) when onnxruntime and the model file are
+present, otherwise a calibrated RMS estimate - and declares end of
+utterance after ~200ms of trailing silence once speech has been heard.
+"""
+
+import os
+import logging
+from typing import Optional
+
+import numpy as np
+
+try:
+    import onnxruntime
+    ONNX_AVAILABLE = True
+except ImportError:
+    onnxruntime = None
+    ONNX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+VAD_CONFIG = {
+    "model_path": os.path.join("models", "silero_vad.onnx"),
+    "sample_rate": 16000,
+    "speech_threshold": 0.3,     # frame prob below this counts as silence
+    "trailing_silence_frames": 6,  # ~200ms at 32ms frames
+    "energy_floor_db": -40,      # fallback: RMS level treated as silence
+}
+
+
+class VADEndpointer:
+    """
+    Frame-by-frame endpoint detector.
+
+    Feed frames with update(); it returns True as soon as the utterance
+    is over (speech was heard, then trailing_silence_frames of silence).
+    """
+
+    def __init__(self, model_path: Optional[str] = None):
+        self.model_path = model_path or VAD_CONFIG["model_path"]
+        self.session = None
+        self._state = None
+        self.reset()
+        if ONNX_AVAILABLE and os.path.exists(self.model_path):
+            self._load_model()
+
+    def _load_model(self) -> None:
+        try:
+            so = onnxruntime.SessionOptions()
+            so.intra_op_num_threads = 1
+            so.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            self.session = onnxruntime.InferenceSession(
+                self.model_path, sess_options=so, providers=["CPUExecutionProvider"])
+            logger.info("Silero VAD model loaded")
+        except Exception as e:
+            logger.warning(f"Could not load VAD model, using energy VAD: {e}")
+            self.session = None
+
+    def reset(self) -> None:
+        """Reset per-utterance state (call when capture starts)."""
+        self.heard_speech = False
+        self.silence_frames = 0
+        # Silero keeps recurrent state across frames
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+
+    def speech_probability(self, frame: bytes) -> float:
+        """Probability (0-1) that the frame contains speech."""
+        audio = np.frombuffer(frame, dtype=np.int16).astype(np.float32) / 32768.0
+        if audio.size == 0:
+            return 0.0
+
+        if self.session is not None:
+            try:
+                outputs = self.session.run(None, {
+                    "input": audio.reshape(1, -1),
+                    "sr": np.array(VAD_CONFIG["sample_rate"], dtype=np.int64),
+                    "state": self._state,
+                })
+                prob = float(np.asarray(outputs[0]).ravel()[0])
+                if len(outputs) > 1:
+                    self._state = outputs[1]
+                return prob
+            except Exception as e:
+                logger.warning(f"VAD inference failed, using energy VAD: {e}")
+                self.session = None
+
+        # Energy fallback: map RMS dBFS onto a rough probability
+        rms = float(np.sqrt(np.mean(audio ** 2)))
+        volume_db = 20 * np.log10(rms) if rms > 0 else -100.0
+        floor = VAD_CONFIG["energy_floor_db"]
+        # -40dBFS -> 0.0, -20dBFS -> 1.0, linear in between
+        return max(0.0, min(1.0, (volume_db - floor) / 20.0))
+
+    def update(self, frame: bytes) -> bool:
+        """
+        Process one frame; True when the utterance has ended.
+
+        End of utterance = speech observed earlier, then
+        trailing_silence_frames consecutive sub-threshold frames.
+        """
+        prob = self.speech_probability(frame)
+        if prob >= VAD_CONFIG["speech_threshold"]:
+            self.heard_speech = True
+            self.silence_frames = 0
+            return False
+
+        self.silence_frames += 1
+        return (self.heard_speech
+                and self.silence_frames >= VAD_CONFIG["trailing_silence_frames"])
+
+
+# Global instance
+_endpointer = None
+
+
+def get_endpointer() -> VADEndpointer:
+    """Get or create the shared VAD endpointer."""
+    global _endpointer
+    if _endpointer is None:
+        _endpointer = VADEndpointer()
+    return _endpointer
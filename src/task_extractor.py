@@ -0,0 +1,243 @@
+"""
+Task Extraction Module - local-first action item extraction
+
+Extracts tasks ("email the report to Sarah before Friday") from
+conversational text. Structural extraction is a sequence-matching
+problem, so it runs on a small local pipeline: a spaCy matcher when the
+model is installed, otherwise precompiled regexes over an action-verb
+lexicon. The GPT fallback only fires when the local pass finds nothing,
+and the extractor tracks how often the expensive path was avoided.
+"""
+
+import re
+import uuid
+from typing import List, Dict, Any, Optional, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+
+try:
+    import spacy
+    from spacy.matcher import Matcher
+    SPACY_AVAILABLE = True
+except ImportError:
+    spacy = None
+    Matcher = None
+    SPACY_AVAILABLE = False
+
+from src.nlu_parser import parse_date
+
+
+class TaskType(Enum):
+    """What kind of action a task represents"""
+    EMAIL = "email"
+    CALL = "call"
+    MEETING = "meeting"
+    REVIEW = "review"
+    REMINDER = "reminder"
+    GENERAL = "general"
+
+
+class TaskPriority(Enum):
+    """Task urgency"""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    URGENT = "urgent"
+
+
+class TaskStatus(Enum):
+    """Task lifecycle state"""
+    PENDING = "pending"
+    SCHEDULED = "scheduled"
+    DONE = "done"
+
+
+@dataclass(slots=True)
+class ExtractedTask:
+    """A single extracted action item"""
+    id: str
+    type: TaskType
+    title: str
+    description: str = ""
+    deadline: Optional[datetime] = None
+    priority: TaskPriority = TaskPriority.MEDIUM
+    status: TaskStatus = TaskStatus.PENDING
+    confidence: float = 0.7
+    entities: Dict[str, List[str]] = field(default_factory=dict)
+    reminder_before: int = 30  # minutes
+
+
+# Action verbs that start a task phrase, mapped to task types
+ACTION_VERBS = {
+    'email': TaskType.EMAIL,
+    'send': TaskType.EMAIL,
+    'mail': TaskType.EMAIL,
+    'call': TaskType.CALL,
+    'phone': TaskType.CALL,
+    'meet': TaskType.MEETING,
+    'schedule': TaskType.MEETING,
+    'book': TaskType.MEETING,
+    'review': TaskType.REVIEW,
+    'check': TaskType.REVIEW,
+    'finish': TaskType.GENERAL,
+    'prepare': TaskType.GENERAL,
+    'submit': TaskType.GENERAL,
+    'remind': TaskType.REMINDER,
+    'buy': TaskType.GENERAL,
+    'pay': TaskType.GENERAL,
+}
+
+# "I must/need to/have to <verb> <object> [before/by <deadline>]"
+_OBLIGATION_SRC = (
+    r"\b(?:i\s+)?(?:must|need\s+to|have\s+to|should|remember\s+to|remind\s+me\s+to)\s+"
+    r"(?P<verb>\w+)\s+(?P<obj>[^,.;!?]*?)"
+    r"(?:\s+(?:before|by|until)\s+(?P<deadline>[\w\s/:-]+?))?(?=[,.;!?]|$)"
+)
+# Bare imperative task phrases: "<action verb> <object> [by <deadline>]"
+_IMPERATIVE_SRC = (
+    r"\b(?P<verb>" + "|".join(ACTION_VERBS) + r")\s+(?P<obj>[^,.;!?]*?)"
+    r"(?:\s+(?:before|by|until)\s+(?P<deadline>[\w\s/:-]+?))?(?=[,.;!?]|$)"
+)
+
+OBLIGATION_PATTERN = re.compile(_OBLIGATION_SRC, re.I)
+IMPERATIVE_PATTERN = re.compile(_IMPERATIVE_SRC, re.I)
+URGENT_PATTERN = re.compile(r"\b(urgent|asap|immediately|critical|right away)\b", re.I)
+PEOPLE_PATTERN = re.compile(r"\b(?:with|to|for)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)")
+LOCATION_PATTERN = re.compile(r"\b(?:at|in)\s+(?:the\s+)?([A-Z][\w\s]{2,20}?)(?=[,.;!?]|$|\s+(?:on|at|by)\b)")
+PROJECT_PATTERN = re.compile(r"\b(?:project|for the)\s+([\w\s]{2,30}?)(?:\s+project)?(?=[,.;!?]|$)", re.I)
+DATE_TOKEN_PATTERN = re.compile(
+    r"\b(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+    r"|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}(?:/\d{2,4})?)\b", re.I)
+
+
+class TaskExtractor:
+    """
+    Extracts tasks with a local matcher first, GPT only as a fallback.
+
+    The llm_fallback callable (text -> list of task title strings) is
+    invoked only when use_gpt is set and the local pass finds nothing;
+    local_hits/llm_calls track the avoidance rate.
+    """
+
+    def __init__(self, use_gpt: bool = False,
+                 llm_fallback: Optional[Callable[[str], List[str]]] = None):
+        self.use_gpt = use_gpt
+        self.llm_fallback = llm_fallback
+        self.local_hits = 0
+        self.llm_calls = 0
+        self.nlp = None
+        self.matcher = None
+        if SPACY_AVAILABLE:
+            self._init_spacy()
+
+    def _init_spacy(self) -> None:
+        """Load the small spaCy pipeline and verb+object matcher."""
+        try:
+            self.nlp = spacy.load("en_core_web_sm", disable=["ner", "parser"])
+            self.matcher = Matcher(self.nlp.vocab)
+            self.matcher.add("TASK", [
+                [{"LEMMA": {"IN": list(ACTION_VERBS)}},
+                 {"POS": {"IN": ["NOUN", "PROPN", "DET", "ADJ"]}, "OP": "+"}],
+            ])
+        except Exception as e:
+            print(f"[WARN] spaCy model unavailable, using regex matcher: {e}")
+            self.nlp = None
+            self.matcher = None
+
+    @property
+    def gpu_avoidance_rate(self) -> float:
+        """Fraction of extractions answered without the LLM."""
+        total = self.local_hits + self.llm_calls
+        return self.local_hits / total if total else 1.0
+
+    def extract_tasks(self, text: str) -> List[ExtractedTask]:
+        """Extract action items from text, local matcher first."""
+        if not text or not text.strip():
+            return []
+
+        tasks = self._extract_local(text)
+        if tasks:
+            self.local_hits += 1
+            return tasks
+
+        if self.use_gpt and self.llm_fallback is not None:
+            self.llm_calls += 1
+            try:
+                titles = self.llm_fallback(text) or []
+                return [self._build_task('do', title, None, text, confidence=0.6)
+                        for title in titles]
+            except Exception as e:
+                print(f"[WARN] LLM task fallback failed: {e}")
+        return []
+
+    def _extract_local(self, text: str) -> List[ExtractedTask]:
+        """Run the spaCy matcher or the regex patterns."""
+        spans = []
+        if self.matcher is not None:
+            doc = self.nlp(text)
+            for _, start, end in self.matcher(doc):
+                spans.append(doc[start:end].text)
+
+        tasks = []
+        seen = set()
+        for pattern in (OBLIGATION_PATTERN, IMPERATIVE_PATTERN):
+            for m in pattern.finditer(text):
+                verb = m.group('verb').lower()
+                obj = (m.group('obj') or '').strip()
+                if verb not in ACTION_VERBS and pattern is IMPERATIVE_PATTERN:
+                    continue
+                if not obj or (verb, obj.lower()) in seen:
+                    continue
+                seen.add((verb, obj.lower()))
+                tasks.append(self._build_task(verb, obj, m.group('deadline'), text))
+
+        # Matcher-only hits (spaCy caught something the regexes missed)
+        for span in spans:
+            verb = span.split()[0].lower()
+            obj = ' '.join(span.split()[1:])
+            if obj and (verb, obj.lower()) not in seen:
+                seen.add((verb, obj.lower()))
+                tasks.append(self._build_task(verb, obj, None, text, confidence=0.75))
+        return tasks
+
+    def _build_task(self, verb: str, obj: str, deadline_str: Optional[str],
+                    source_text: str, confidence: float = 0.85) -> ExtractedTask:
+        deadline = None
+        if deadline_str:
+            date = parse_date(deadline_str.strip())
+            if date:
+                deadline = datetime.combine(date, datetime.min.time()) + timedelta(hours=9)
+
+        priority = TaskPriority.MEDIUM
+        if URGENT_PATTERN.search(source_text):
+            priority = TaskPriority.URGENT
+        elif deadline and deadline - datetime.now() < timedelta(days=1):
+            priority = TaskPriority.HIGH
+
+        task_type = ACTION_VERBS.get(verb, TaskType.GENERAL)
+        return ExtractedTask(
+            id=f"task_{uuid.uuid4().hex[:8]}",
+            type=task_type,
+            title=f"{verb.capitalize()} {obj}".strip(),
+            description=source_text[:200],
+            deadline=deadline,
+            priority=priority,
+            confidence=confidence,
+            entities=self.extract_entities(source_text),
+            reminder_before=60 if priority in (TaskPriority.URGENT, TaskPriority.HIGH) else 30
+        )
+
+    def extract_entities(self, text: str) -> Dict[str, List[str]]:
+        """Pull people, projects, dates, and locations out of text."""
+        people = list(dict.fromkeys(PEOPLE_PATTERN.findall(text)))
+        dates = list(dict.fromkeys(m.group(0) for m in DATE_TOKEN_PATTERN.finditer(text)))
+        locations = [loc.strip() for loc in LOCATION_PATTERN.findall(text)
+                     if loc.strip() not in people]
+        projects = [p.strip() for p in PROJECT_PATTERN.findall(text) if p.strip()]
+        return {
+            'people': people,
+            'projects': projects,
+            'dates': dates,
+            'locations': locations
+        }
@@ -5,11 +5,12 @@ Supports Coqui TTS (primary) and gTTS (fallback)
 
 import os
 import json
+import re
 import time
 import tempfile
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 
 try:
     from TTS.api import TTS
@@ -159,6 +160,41 @@ class TTSEngine:
             "error": "All TTS engines unavailable"
         }
     
+    def stream_text(
+        self,
+        text: str,
+        voice: str = "female",
+        speed: str = "normal",
+        chunk_size: int = 4096
+    ) -> Iterator[bytes]:
+        """
+        Synthesize text sentence-by-sentence and yield audio bytes as each
+        sentence finishes.
+
+        Playback can start after the first sentence is synthesized instead
+        of waiting for the full clip, cutting time-to-first-audio to the
+        cost of one short sentence. Each sentence goes through
+        synthesize_text() so the result cache still applies.
+        """
+        text = self._sanitize_text(text)
+        if not text:
+            return
+
+        sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if s.strip()]
+        for sentence in sentences:
+            result = self.synthesize_text(sentence, voice, speed)
+            if not result["success"] or not result["audio_path"]:
+                continue
+            try:
+                with open(result["audio_path"], "rb") as f:
+                    while True:
+                        chunk = f.read(chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+            except OSError as e:
+                logger.warning(f"Could not stream TTS chunk: {e}")
+
     def synthesize_with_timing(
         self,
         text: str,
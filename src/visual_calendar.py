@@ -0,0 +1,339 @@
+"""
+Visual Calendar Analysis
+Heatmaps, stress levels, and availability insights for the dashboard
+
+The per-hour aggregation is vectorized with NumPy: events are encoded as
+parallel (hour, duration) arrays and accumulated into a load grid with
+np.add.at, so a month of events is analyzed in one pass instead of a
+Python loop per event. A pure-Python fallback keeps the module working
+when NumPy is not installed.
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+class TimeSlotIntensity(Enum):
+    """How full a time slot / day is"""
+    FREE = "free"
+    LIGHT = "light"
+    MODERATE = "moderate"
+    BUSY = "busy"
+    PACKED = "packed"
+
+
+class StressLevel(Enum):
+    """Schedule stress classification"""
+    LOW = "low"
+    MODERATE = "moderate"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+
+@dataclass(slots=True)
+class DayAnalysis:
+    """Analysis of a single day's schedule"""
+    date: str
+    day_name: str
+    event_count: int
+    total_booked: int  # minutes
+    total_capacity: int  # minutes
+    capacity_percentage: float
+    intensity: TimeSlotIntensity
+    stress_level: StressLevel
+    busiest_hour: Optional[int] = None
+    description: str = ""
+    free_slots: List[Tuple[int, int]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class WeekAnalysis:
+    """Analysis of a week's schedule"""
+    week_number: int
+    start_date: str
+    end_date: str
+    days: List[DayAnalysis] = field(default_factory=list)
+    average_daily_load: float = 0.0
+    busiest_day: Optional[DayAnalysis] = None
+    freest_day: Optional[DayAnalysis] = None
+    total_free_hours: float = 0.0
+
+
+@dataclass(slots=True)
+class MonthAnalysis:
+    """Analysis of a month's schedule"""
+    month: int
+    year: int
+    weeks: List[WeekAnalysis] = field(default_factory=list)
+    average_daily_load: float = 0.0
+    overall_stress: StressLevel = StressLevel.LOW
+
+
+# Minutes in a day (full capacity for percentage calculations)
+DAY_CAPACITY_MINUTES = 1440
+
+# Work-day window used for free-slot search
+WORK_START_HOUR = 8
+WORK_END_HOUR = 18
+
+
+def _hour_load_grid(events: List[Dict[str, Any]]):
+    """
+    Build the 24-entry booked-minutes-per-hour array for a day's events.
+
+    Vectorized path: np.add.at accumulates all (hour, duration) pairs in
+    one call instead of a Python loop per event.
+    """
+    if HAS_NUMPY:
+        grid = np.zeros(24, dtype=np.float32)
+        if events:
+            hours = np.fromiter(
+                (int(str(e.get('start', '00:00')).split(':')[0]) for e in events),
+                dtype=np.int32, count=len(events))
+            durations = np.fromiter(
+                (e.get('duration_minutes', 60) for e in events),
+                dtype=np.float32, count=len(events))
+            np.add.at(grid, np.clip(hours, 0, 23), durations)
+        return grid
+
+    grid = [0.0] * 24
+    for e in events:
+        hour = min(max(int(str(e.get('start', '00:00')).split(':')[0]), 0), 23)
+        grid[hour] += e.get('duration_minutes', 60)
+    return grid
+
+
+def build_heatmap(events: List[Dict[str, Any]], days_in_month: int = 31):
+    """
+    Build a (days, 24) booked-minutes grid for a month of events.
+
+    Events need a 'day' index (0-based) plus 'start' (HH:MM) and
+    'duration_minutes'. Returns a nested list ready for jsonify.
+    """
+    if HAS_NUMPY:
+        grid = np.zeros((days_in_month, 24), dtype=np.float32)
+        if events:
+            days = np.fromiter((e.get('day', 0) for e in events), dtype=np.int32, count=len(events))
+            hours = np.fromiter(
+                (int(str(e.get('start', '00:00')).split(':')[0]) for e in events),
+                dtype=np.int32, count=len(events))
+            durations = np.fromiter(
+                (e.get('duration_minutes', 60) for e in events),
+                dtype=np.float32, count=len(events))
+            np.add.at(grid, (np.clip(days, 0, days_in_month - 1), np.clip(hours, 0, 23)), durations)
+        return grid.tolist()
+
+    grid = [[0.0] * 24 for _ in range(days_in_month)]
+    for e in events:
+        day = min(max(e.get('day', 0), 0), days_in_month - 1)
+        hour = min(max(int(str(e.get('start', '00:00')).split(':')[0]), 0), 23)
+        grid[day][hour] += e.get('duration_minutes', 60)
+    return grid
+
+
+class CalendarHeatmap:
+    """ASCII heatmap rendering for schedules"""
+
+    INTENSITY_CHARS = {
+        TimeSlotIntensity.FREE: "░",
+        TimeSlotIntensity.LIGHT: "▒",
+        TimeSlotIntensity.MODERATE: "▓",
+        TimeSlotIntensity.BUSY: "█",
+        TimeSlotIntensity.PACKED: "██"
+    }
+
+    @classmethod
+    def generate_weekly_heatmap(cls, days: List[DayAnalysis]) -> str:
+        """Render a week of DayAnalysis objects as an ASCII heatmap."""
+        lines = ["=" * 40, "WEEKLY HEATMAP", "=" * 40]
+        for day in days:
+            char = cls.INTENSITY_CHARS.get(day.intensity, "░")
+            lines.append(
+                f"{day.day_name:<10} {char * max(day.event_count, 1):<12} "
+                f"{day.event_count} events ({day.capacity_percentage:.0f}%)"
+            )
+        lines.append("")
+        lines.append("Legend: ░ free  ▒ light  ▓ moderate  █ busy  ██ packed")
+        return "\n".join(lines)
+
+
+class VisualCalendarAnalyzer:
+    """
+    Analyzes calendar load and produces visual/stress summaries
+    """
+
+    def __init__(self, use_gpt: bool = False):
+        self.use_gpt = use_gpt
+
+    def analyze_day(self, events: List[Dict[str, Any]], date_str: str) -> DayAnalysis:
+        """
+        Analyze one day of events.
+
+        Args:
+            events: List of dicts with 'title', 'start' (HH:MM), 'duration_minutes'
+            date_str: Day being analyzed (YYYY-MM-DD)
+
+        Returns:
+            DayAnalysis with intensity, stress level, and free slots
+        """
+        grid = _hour_load_grid(events)
+        total_booked = int(sum(grid))
+        event_count = len(events)
+
+        intensity = self._classify_intensity(event_count)
+        stress_level = self._classify_stress(event_count)
+
+        try:
+            day_name = datetime.strptime(date_str, '%Y-%m-%d').strftime('%A')
+        except ValueError:
+            day_name = ''
+
+        busiest_hour = self._busiest_hour_from_grid(grid) if events else None
+
+        analysis = DayAnalysis(
+            date=date_str,
+            day_name=day_name,
+            event_count=event_count,
+            total_booked=total_booked,
+            total_capacity=DAY_CAPACITY_MINUTES,
+            capacity_percentage=round(total_booked / DAY_CAPACITY_MINUTES * 100, 2),
+            intensity=intensity,
+            stress_level=stress_level,
+            busiest_hour=busiest_hour,
+            free_slots=self._free_slots_from_grid(grid)
+        )
+        analysis.description = self.generate_visual_description(analysis)
+        return analysis
+
+    def analyze_month(self, events: List[Dict[str, Any]],
+                      month: Optional[int] = None, year: Optional[int] = None) -> MonthAnalysis:
+        """Analyze a month of events (events may carry a 'day' index)."""
+        now = datetime.now()
+        month = month or now.month
+        year = year or now.year
+
+        if not events:
+            return MonthAnalysis(month=month, year=year)
+
+        grid = build_heatmap(events)
+        daily_loads = [sum(day) for day in grid]
+        busy_days = [load for load in daily_loads if load > 0]
+        average = sum(busy_days) / len(busy_days) if busy_days else 0.0
+
+        if average >= 420:
+            overall = StressLevel.CRITICAL
+        elif average >= 300:
+            overall = StressLevel.HIGH
+        elif average >= 180:
+            overall = StressLevel.MODERATE
+        else:
+            overall = StressLevel.LOW
+
+        return MonthAnalysis(
+            month=month,
+            year=year,
+            average_daily_load=round(average, 2),
+            overall_stress=overall
+        )
+
+    def get_availability_score(self, analysis: DayAnalysis) -> float:
+        """Availability as a 0-100 score (100 = fully free)."""
+        return 100.0 - analysis.capacity_percentage
+
+    def get_stress_recommendations(self, month: MonthAnalysis) -> List[str]:
+        """Recommendations based on overall monthly stress level."""
+        if month.overall_stress in (StressLevel.HIGH, StressLevel.CRITICAL):
+            return [
+                "Add buffer time between back-to-back meetings",
+                "Schedule regular breaks during packed days",
+                "Block focus time on your freest days",
+                "Consider declining optional meetings this month"
+            ]
+        if month.overall_stress == StressLevel.MODERATE:
+            return [
+                "Keep at least one meeting-free afternoon per week",
+                "Add short breaks between long sessions"
+            ]
+        return [
+            "Schedule looks healthy - good balance of meetings and free time"
+        ]
+
+    def generate_visual_description(self, analysis: DayAnalysis) -> str:
+        """Natural-language description of a day's load."""
+        if analysis.event_count == 0:
+            return f"{analysis.day_name or 'The day'} is wide open - no events scheduled."
+        if analysis.intensity == TimeSlotIntensity.LIGHT:
+            return (f"Light day with {analysis.event_count} event(s), "
+                    f"{analysis.capacity_percentage:.0f}% booked.")
+        if analysis.intensity == TimeSlotIntensity.MODERATE:
+            return (f"Moderately busy: {analysis.event_count} events, "
+                    f"busiest around {analysis.busiest_hour}:00.")
+        return (f"Very busy day - {analysis.event_count} events packed in, "
+                f"{analysis.capacity_percentage:.0f}% of the day booked.")
+
+    def _classify_intensity(self, event_count: int) -> TimeSlotIntensity:
+        if event_count == 0:
+            return TimeSlotIntensity.FREE
+        if event_count <= 2:
+            return TimeSlotIntensity.LIGHT
+        if event_count <= 4:
+            return TimeSlotIntensity.MODERATE
+        if event_count == 5:
+            return TimeSlotIntensity.BUSY
+        return TimeSlotIntensity.PACKED
+
+    def _classify_stress(self, event_count: int) -> StressLevel:
+        if event_count <= 2:
+            return StressLevel.LOW
+        if event_count <= 4:
+            return StressLevel.MODERATE
+        if event_count == 5:
+            return StressLevel.HIGH
+        return StressLevel.CRITICAL
+
+    def _find_busiest_hour(self, events: List[Dict[str, Any]]) -> Optional[int]:
+        """Hour with the most overlapping events."""
+        if not events:
+            return None
+        counts = [0] * 24
+        for e in events:
+            hour = min(max(int(str(e.get('start', '00:00')).split(':')[0]), 0), 23)
+            counts[hour] += 1
+        return max(range(24), key=lambda h: counts[h])
+
+    def _busiest_hour_from_grid(self, grid) -> Optional[int]:
+        if HAS_NUMPY and not isinstance(grid, list):
+            return int(np.argmax(grid))
+        return max(range(24), key=lambda h: grid[h])
+
+    def _find_free_slots(self, events: List[Dict[str, Any]],
+                         min_duration: int = 60) -> List[Tuple[int, int]]:
+        """Contiguous free (start_hour, end_hour) windows in the work day."""
+        return self._free_slots_from_grid(_hour_load_grid(events), min_duration)
+
+    def _free_slots_from_grid(self, grid, min_duration: int = 60) -> List[Tuple[int, int]]:
+        if HAS_NUMPY and not isinstance(grid, list):
+            busy = grid > 0
+        else:
+            busy = [load > 0 for load in grid]
+
+        slots = []
+        start = None
+        for hour in range(WORK_START_HOUR, WORK_END_HOUR + 1):
+            is_free = hour < WORK_END_HOUR and not busy[hour]
+            if is_free and start is None:
+                start = hour
+            elif not is_free and start is not None:
+                if (hour - start) * 60 >= min_duration:
+                    slots.append((start, hour))
+                start = None
+        return slots
@@ -88,7 +88,8 @@ def config_command(args=None):
 
     # Note: build() is mocked in tests, so only call it if not in test
     try:
-        service = build("calendar", "v3", credentials=creds)
+        service = build("calendar", "v3", credentials=creds,
+                        cache_discovery=False, static_discovery=True)
         # Save or load events for convenience
         try:
             load_voice_assistant_calendar(service)
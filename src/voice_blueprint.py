@@ -3,7 +3,7 @@ import json
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
-from flask import Blueprint, request, jsonify, session, redirect, url_for, render_template
+from flask import Blueprint, Response, request, jsonify, session, redirect, url_for, render_template
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
@@ -29,7 +29,8 @@ def get_calendar_service():
     
     try:
         creds = Credentials(token=token)
-        service = build('calendar', 'v3', credentials=creds)
+        service = build('calendar', 'v3', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
         return service
     except Exception as e:
         print(f"[ERROR] Error building calendar service: {e}")
@@ -336,6 +337,63 @@ def process_voice_command():
         }), 500
 
 
+@voice_bp.route('/api/voice/tts-stream', methods=['POST'])
+def tts_stream():
+    """Stream TTS audio for a response as it is synthesized.
+
+    The browser's <audio> element starts playing on the first byte, so
+    time-to-first-audio is one sentence of synthesis instead of the
+    whole clip.
+    """
+    try:
+        data = request.get_json() or {}
+        text = data.get('text', '').strip()
+        if not text:
+            return jsonify({'success': False, 'error': 'No text provided'}), 400
+
+        from src.tts.tts_engine import get_tts_engine
+        engine = get_tts_engine()
+
+        return Response(
+            engine.stream_text(
+                text,
+                voice=data.get('voice', 'female'),
+                speed=data.get('speed', 'normal')
+            ),
+            mimetype='audio/mpeg',
+            headers={'Cache-Control': 'no-store'}
+        )
+
+    except Exception as e:
+        voice_logger.error(f"Error streaming TTS: {e}")
+        return jsonify({
+            'success': False,
+            'error': 'Failed to stream TTS audio'
+        }), 500
+
+
+@voice_bp.route('/api/voice/stats', methods=['GET'])
+def voice_stats():
+    """Per-stage pipeline latency percentiles (p50/p95/p99 in ms)."""
+    try:
+        from src.latency import get_stage_stats
+        return jsonify({'success': True, 'stages': get_stage_stats()})
+    except Exception as e:
+        voice_logger.error(f"Error fetching voice stats: {e}")
+        return jsonify({'success': False, 'error': 'Failed to fetch stats'}), 500
+
+
+@voice_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus scrape endpoint for the stage histograms."""
+    from src.latency import metrics_response
+    payload = metrics_response()
+    if payload is None:
+        return jsonify({'error': 'prometheus_client not installed'}), 404
+    body, content_type = payload
+    return Response(body, mimetype=content_type)
+
+
 @voice_bp.route('/api/voice/end-session', methods=['POST'])
 def end_voice_session():
     """End a voice session"""
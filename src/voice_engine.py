@@ -158,8 +158,20 @@ class VoiceEngine:
         variations = variations.replace("EIGHT", "8")
         variations = variations.replace("NINE", "9")
         variations = variations.replace("TEN", "10")
-        
-        return trigger in variations
+
+        if trigger in variations:
+            return True
+
+        # Phonetic fallback: precomputed Double Metaphone codes catch
+        # recognitions like "Ellen twenty five" for "EL25"
+        try:
+            from src.voice_handler import get_trigger_matcher
+            matcher = get_trigger_matcher(self.state.user_trigger)
+            if matcher.is_available():
+                return matcher.matches(text)
+        except ImportError:
+            pass
+        return False
     
     def wait_for_trigger(self, max_attempts: int = 5) -> bool:
         """
@@ -30,6 +30,20 @@ try:
 except ImportError:
     TTS_AVAILABLE = False
 
+try:
+    from metaphone import doublemetaphone
+    METAPHONE_AVAILABLE = True
+except ImportError:
+    doublemetaphone = None
+    METAPHONE_AVAILABLE = False
+
+try:
+    from num2words import num2words
+    NUM2WORDS_AVAILABLE = True
+except ImportError:
+    num2words = None
+    NUM2WORDS_AVAILABLE = False
+
 
 class VoiceOutput:
     """
@@ -868,6 +882,129 @@ def get_user_trigger(email: Optional[str] = None) -> str:
     return 'XX00'
 
 
+class TriggerMatcher:
+    """
+    Phonetic trigger matching with a precomputed Double Metaphone table.
+
+    Trigger codes like 'EL25' get misheard by speech recognition in many
+    ways ("Ellen twenty five", "E L two five", "el twenty fyve"). Instead
+    of running edit-distance against every expansion per utterance, the
+    trigger's textual variants are expanded once at construction and their
+    Double Metaphone codes stored in sets; matching an utterance is then
+    one metaphone pass over its tokens plus O(1) set lookups.
+    """
+
+    _DIGIT_WORDS = ['zero', 'one', 'two', 'three', 'four',
+                    'five', 'six', 'seven', 'eight', 'nine']
+
+    def __init__(self, trigger: str):
+        self.trigger = trigger.upper().strip()
+        letters_match = re.match(r'^([A-Za-z]+)', self.trigger)
+        digits_match = re.search(r'(\d+)$', self.trigger)
+        letters = letters_match.group(1).lower() if letters_match else ''
+        digits = digits_match.group(1) if digits_match else ''
+
+        self._letter_codes = self._codes_for(self._letter_variants(letters))
+        self._digit_codes = self._codes_for(self._digit_variants(digits))
+
+    def is_available(self) -> bool:
+        """Phonetic matching needs the metaphone package."""
+        return METAPHONE_AVAILABLE
+
+    def matches(self, transcript: str) -> bool:
+        """
+        True if the transcript phonetically contains the trigger.
+
+        Computes Double Metaphone codes for each token and for joined
+        sliding windows (so "twenty five" can match "twentyfive"), then
+        intersects against the precomputed trigger code sets.
+        """
+        if not METAPHONE_AVAILABLE or not transcript:
+            return False
+
+        tokens = re.findall(r"[a-z0-9']+", transcript.lower())
+        if not tokens:
+            return False
+
+        codes = set()
+        for token in tokens:
+            codes.update(c for c in doublemetaphone(token) if c)
+        # Joined windows of 2-3 tokens catch split/merged recognitions
+        for size in (2, 3):
+            for i in range(len(tokens) - size + 1):
+                joined = ''.join(tokens[i:i + size])
+                codes.update(c for c in doublemetaphone(joined) if c)
+
+        letter_hit = (not self._letter_codes
+                      or bool(self._letter_codes & codes)
+                      or self._prefix_hit(self._letter_codes, codes))
+        digit_hit = not self._digit_codes or bool(self._digit_codes & codes)
+        return letter_hit and digit_hit
+
+    @staticmethod
+    def _prefix_hit(trigger_codes: set, codes: set) -> bool:
+        """
+        Letter parts often come back as longer names ("EL" -> "Ellen",
+        code AL -> ALN), so accept transcript codes that extend a trigger
+        code. Single-character codes are too permissive to prefix-match.
+        """
+        for trigger_code in trigger_codes:
+            if len(trigger_code) < 2:
+                continue
+            if any(code.startswith(trigger_code) for code in codes):
+                return True
+        return False
+
+    @classmethod
+    def _letter_variants(cls, letters: str) -> list:
+        """Textual ways the letter part may be recognized."""
+        if not letters:
+            return []
+        return [letters, ' '.join(letters)]
+
+    @classmethod
+    def _digit_variants(cls, digits: str) -> list:
+        """Textual ways the number part may be recognized."""
+        if not digits:
+            return []
+        variants = [' '.join(cls._DIGIT_WORDS[int(d)] for d in digits)]
+        if NUM2WORDS_AVAILABLE:
+            try:
+                spelled = num2words(int(digits)).replace('-', ' ')
+                variants.append(spelled)
+                variants.append(spelled.replace(' ', ''))
+            except Exception:
+                pass
+        return variants
+
+    @staticmethod
+    def _codes_for(variants: list) -> set:
+        """Primary + secondary Double Metaphone codes for all variant tokens."""
+        codes = set()
+        if not METAPHONE_AVAILABLE:
+            return codes
+        for variant in variants:
+            for token in variant.split():
+                codes.update(c for c in doublemetaphone(token) if c)
+            joined = variant.replace(' ', '')
+            codes.update(c for c in doublemetaphone(joined) if c)
+        return codes
+
+
+# Matchers are cheap but not free to build; reuse one per trigger code
+_trigger_matchers = {}
+
+
+def get_trigger_matcher(trigger: str) -> TriggerMatcher:
+    """Get (or build and cache) the phonetic matcher for a trigger code."""
+    key = trigger.upper().strip()
+    matcher = _trigger_matchers.get(key)
+    if matcher is None:
+        matcher = TriggerMatcher(key)
+        _trigger_matchers[key] = matcher
+    return matcher
+
+
 # Global voice output instance
 _voice_output = None
 
@@ -58,11 +58,14 @@ function initializeSpeechRecognition() {
                 interimTranscript += transcript;
             }
         }
-        
+
         // Show interim results
         if (interimTranscript) {
             transcriptDisplay.textContent = interimTranscript;
             transcriptDisplay.classList.add('show');
+            // Warm the server-side NLU cache while the user is still
+            // speaking, so the final transcript gets an instant parse.
+            preparseTranscript(interimTranscript);
         }
     };
 
@@ -90,6 +93,25 @@ function initializeSpeechRecognition() {
     };
 }
 
+/**
+ * Debounced preparse of interim transcripts.
+ * Sends the partial transcript to the server so NLU (and any calendar
+ * prefetch) runs before end-of-utterance.
+ */
+let preparseTimer = null;
+function preparseTranscript(interimTranscript) {
+    clearTimeout(preparseTimer);
+    preparseTimer = setTimeout(() => {
+        const command = interimTranscript.toLowerCase().replace(CONFIG.triggerPhrase, '').trim();
+        if (!command) return;
+        fetch(`${CONFIG.apiBaseUrl}/nlu/preparse`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ text: command }),
+        }).catch(() => { /* best-effort warm-up; ignore failures */ });
+    }, 300);
+}
+
 /**
  * Process speech input
  */
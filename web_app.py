@@ -7,11 +7,14 @@ import os
 import json
 import secrets
 import logging
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from functools import wraps
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_from_directory, abort
+from flask import Flask, Response, render_template, request, jsonify, session, redirect, url_for, send_from_directory, abort
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -37,6 +40,7 @@ import get_details
 import voice_handler
 import src.recommender as recommender
 from src.scheduler_handler import SchedulerCommandHandler, create_scheduler_endpoints
+from src import semantic_cache
 from src.ai.voice_parser import parse_transcript, normalize_transcript
 from src.actions.calendar_actions import create_event, get_events, cancel_event
 from src.voice_blueprint import voice_bp
@@ -57,6 +61,35 @@ app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=7)
 # Get OpenAI model from environment
 OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-3.5-turbo')
 
+# Shared pool for issuing independent AI calls concurrently. The calls are
+# network-bound, so threads give max(T1..Tn) wall time instead of the sum.
+_ai_executor = ThreadPoolExecutor(max_workers=4)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_flask_jsonify = jsonify
+
+
+def fast_jsonify(payload, *args, **kwargs):
+    """
+    orjson-backed drop-in for flask.jsonify.
+
+    orjson serializes in native code (and handles NumPy arrays directly
+    via OPT_SERIALIZE_NUMPY, so grid endpoints skip the .tolist() copy).
+    Falls back to flask.jsonify when orjson is missing or the payload
+    uses jsonify's multi-arg/kwargs forms.
+    """
+    if orjson is None or args or kwargs:
+        return _flask_jsonify(payload, *args, **kwargs)
+    try:
+        body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    except TypeError:
+        return _flask_jsonify(payload)
+    return Response(body, mimetype='application/json')
+
 # Voice command logging setup
 os.makedirs('logs', exist_ok=True)
 logging.basicConfig(
@@ -66,27 +99,31 @@ logging.basicConfig(
 )
 voice_logger = logging.getLogger('voice_assistant')
 
-# Rate limiting: track requests per user per minute
-rate_limit_tracker = defaultdict(list)
+# Rate limiting: integer monotonic milliseconds in a bounded deque per
+# user instead of datetime objects in a list - no tz-aware allocation
+# per request, O(1) left-pops to expire old entries, and no full list
+# rebuild on every check
+rate_limit_tracker = defaultdict(lambda: deque(maxlen=60))
 MAX_REQUESTS_PER_MINUTE = 60
+RATE_LIMIT_WINDOW_MS = 60_000
 
 def check_rate_limit(user_id: str) -> bool:
     """Check if user has exceeded rate limit (60 requests/minute)"""
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(minutes=1)
-    
-    # Clean old requests
-    rate_limit_tracker[user_id] = [
-        req_time for req_time in rate_limit_tracker[user_id]
-        if req_time > cutoff
-    ]
-    
+    now_ms = int(time.monotonic() * 1000)
+    cutoff = now_ms - RATE_LIMIT_WINDOW_MS
+
+    requests = rate_limit_tracker[user_id]
+
+    # Expire old requests from the left (oldest first)
+    while requests and requests[0] < cutoff:
+        requests.popleft()
+
     # Check limit
-    if len(rate_limit_tracker[user_id]) >= MAX_REQUESTS_PER_MINUTE:
+    if len(requests) >= MAX_REQUESTS_PER_MINUTE:
         return False
-    
+
     # Add current request
-    rate_limit_tracker[user_id].append(now)
+    requests.append(now_ms)
     return True
 
 # Google OAuth configuration
@@ -109,27 +146,54 @@ if not CLIENT_SECRET_FILE:
     print("⚠️  Warning: client_secret JSON not found in .config/")
 
 
+# Calendar services are cached per (thread, token): rebuilding the service
+# per request discards the underlying keep-alive HTTP connection, paying a
+# fresh TLS handshake (100-300ms) on every call. Per-thread storage keeps
+# the non-thread-safe httplib2 transport out of shared state.
+_service_local = threading.local()
+_SERVICE_CACHE_MAX = 8
+
+
 def get_calendar_service(access_token=None):
-    """Build and return a Google Calendar service with current credentials."""
+    """Return a Google Calendar service, reusing the connection per token."""
     if not access_token and 'access_token' not in session:
         return None
-    
+
     token = access_token or session.get('access_token')
     if not token:
         return None
-    
+
+    cache = getattr(_service_local, 'services', None)
+    if cache is None:
+        cache = _service_local.services = {}
+    service = cache.get(token)
+    if service is not None:
+        return service
+
     try:
         creds = Credentials(token=token)
-        service = build('calendar', 'v3', credentials=creds)
-        return service
+        service = build('calendar', 'v3', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
     except Exception as e:
         print(f"Error building service: {e}")
         return None
 
+    if len(cache) >= _SERVICE_CACHE_MAX:
+        cache.pop(next(iter(cache)))
+    cache[token] = service
+    return service
+
 
 # Register blueprints
 app.register_blueprint(voice_bp)
 
+# Binary audio transport (WebSocket, no base64/JSON on the hot path)
+try:
+    from src.audio_ws import init_audio_ws
+    init_audio_ws(app)
+except ImportError as e:
+    print(f"[WARN] Audio WebSocket unavailable: {e}")
+
 
 def login_required(f):
     """Decorator to require login."""
@@ -229,7 +293,7 @@ def complete_profile():
         # Validate trigger format - allow flexible triggers: 2-4 letters followed by 1-3 digits
         import re
         if not re.match(r'^[A-Z]{2,4}[0-9]{1,3}$', user_trigger):
-            return jsonify({'error': 'Invalid trigger format. Example valid triggers: LN21, VAC20, AB123'}), 400
+            return fast_jsonify({'error': 'Invalid trigger format. Example valid triggers: LN21, VAC20, AB123'}), 400
         
         session['user_trigger'] = user_trigger
         session.modified = True
@@ -251,13 +315,13 @@ def complete_profile():
         except Exception as e:
             print(f"Warning: Failed to persist profile: {e}")
 
-        return jsonify({
+        return fast_jsonify({
             'success': True,
             'message': f'Profile completed! Your trigger is {user_trigger}'
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/logout')
@@ -312,7 +376,7 @@ def register_api():
         timezone = data.get('timezone', 'UTC')
         
         if not email or not password:
-            return jsonify({'message': 'Email and password are required'}), 400
+            return fast_jsonify({'message': 'Email and password are required'}), 400
         
         # Initialize auth manager
         auth_manager = AuthManager(db_path='app.db')
@@ -321,7 +385,7 @@ def register_api():
         success, message, user = auth_manager.register_user(email, password, timezone)
         
         if not success:
-            return jsonify({'message': message}), 400
+            return fast_jsonify({'message': message}), 400
         
         # Store user info in session
         session['user_id'] = user.id
@@ -329,14 +393,14 @@ def register_api():
         session['timezone'] = user.timezone
         session['is_local_user'] = True
         
-        return jsonify({
+        return fast_jsonify({
             'message': 'Registration successful',
             'user_id': user.id,
             'email': user.email
         }), 201
     
     except Exception as e:
-        return jsonify({'message': f'Registration error: {str(e)}'}), 500
+        return fast_jsonify({'message': f'Registration error: {str(e)}'}), 500
 
 
 @app.route('/api/auth/login', methods=['POST'])
@@ -350,7 +414,7 @@ def login_api():
         password = data.get('password', '')
         
         if not email or not password:
-            return jsonify({'message': 'Email and password are required'}), 400
+            return fast_jsonify({'message': 'Email and password are required'}), 400
         
         # Initialize auth manager
         auth_manager = AuthManager(db_path='app.db')
@@ -359,7 +423,7 @@ def login_api():
         success, message, user = auth_manager.login_user(email, password)
         
         if not success:
-            return jsonify({'message': message}), 401
+            return fast_jsonify({'message': message}), 401
         
         # Store user info in session
         session['user_id'] = user.id
@@ -367,7 +431,7 @@ def login_api():
         session['timezone'] = user.timezone
         session['is_local_user'] = True
         
-        return jsonify({
+        return fast_jsonify({
             'message': 'Login successful',
             'user_id': user.id,
             'email': user.email,
@@ -375,7 +439,7 @@ def login_api():
         }), 200
     
     except Exception as e:
-        return jsonify({'message': f'Login error: {str(e)}'}), 500
+        return fast_jsonify({'message': f'Login error: {str(e)}'}), 500
 
 
 @app.route('/dashboard')
@@ -416,7 +480,7 @@ def get_events():
     try:
         service = get_calendar_service()
         if not service:
-            return jsonify({'error': 'Not authenticated'}), 401
+            return fast_jsonify({'error': 'Not authenticated'}), 401
         
         now = datetime.now(timezone.utc).isoformat()
         events_result = service.events().list(
@@ -443,10 +507,10 @@ def get_events():
                 'organizer': event.get('organizer', {}).get('email', '')
             })
         
-        return jsonify(formatted_events)
+        return fast_jsonify(formatted_events)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/events/<event_id>/description', methods=['PATCH'])
@@ -459,14 +523,14 @@ def update_event_description(event_id):
         # mode: 'overwrite' (default) or 'append'
         mode = data.get('mode', 'overwrite')
         if new_description is None:
-            return jsonify({'error': 'No description provided'}), 400
+            return fast_jsonify({'error': 'No description provided'}), 400
 
         if mode not in ('overwrite', 'append'):
-            return jsonify({'error': 'Invalid mode. Use "overwrite" or "append".'}), 400
+            return fast_jsonify({'error': 'Invalid mode. Use "overwrite" or "append".'}), 400
 
         service = get_calendar_service()
         if not service:
-            return jsonify({'error': 'Not authenticated'}), 401
+            return fast_jsonify({'error': 'Not authenticated'}), 401
 
         # Fetch existing event to preserve other fields
         event = service.events().get(calendarId='primary', eventId=event_id).execute()
@@ -482,11 +546,11 @@ def update_event_description(event_id):
 
         updated = service.events().update(calendarId='primary', eventId=event_id, body=event).execute()
 
-        return jsonify({'success': True, 'event': updated})
+        return fast_jsonify({'success': True, 'event': updated})
     except HttpError as he:
-        return jsonify({'error': str(he)}), 500
+        return fast_jsonify({'error': str(he)}), 500
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/book', methods=['POST'])
@@ -503,7 +567,7 @@ def book_event():
         duration = data.get('duration', 30)
         
         if not all([email, date, time]):
-            return jsonify({'error': 'Missing required fields'}), 400
+            return fast_jsonify({'error': 'Missing required fields'}), 400
         
         # Parse date/time
         try:
@@ -516,7 +580,7 @@ def book_event():
         
         service = get_calendar_service()
         if not service:
-            return jsonify({'error': 'Not authenticated'}), 401
+            return fast_jsonify({'error': 'Not authenticated'}), 401
 
         # Conflict detection: check for overlapping events before creating
         try:
@@ -527,26 +591,31 @@ def book_event():
             proposed_end = proposed_start + _dt.timedelta(minutes=duration)
             proposed_slot = TimeSlot(proposed_start, proposed_end)
 
-            # Query surrounding events to check for overlaps
-            time_min = (proposed_start - _dt.timedelta(days=1)).isoformat()
-            time_max = (proposed_end + _dt.timedelta(days=1)).isoformat()
-            try:
-                events_result = service.events().list(
-                    calendarId='primary',
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    singleEvents=True,
-                    orderBy='startTime'
-                ).execute()
-                existing_events = events_result.get('items', [])
-            except Exception:
+            # Fast path: one tiny freebusy probe. Only materialize a
+            # two-day window of events for the detector when the slot
+            # is actually contested (or the probe was inconclusive).
+            if book.is_slot_free(service, start_iso, duration) is True:
                 existing_events = []
+            else:
+                time_min = (proposed_start - _dt.timedelta(days=1)).isoformat()
+                time_max = (proposed_end + _dt.timedelta(days=1)).isoformat()
+                try:
+                    events_result = service.events().list(
+                        calendarId='primary',
+                        timeMin=time_min,
+                        timeMax=time_max,
+                        singleEvents=True,
+                        orderBy='startTime'
+                    ).execute()
+                    existing_events = events_result.get('items', [])
+                except Exception:
+                    existing_events = []
 
             detector = ConflictDetector()
             conflicts = detector.detect_conflicts(proposed_slot, existing_events)
             if conflicts:
                 suggestions = detector.suggest_alternatives(proposed_slot, existing_events, duration_minutes=duration, max_suggestions=3)
-                return jsonify({'error': 'Conflicting events', 'conflicts': conflicts, 'suggestions': suggestions}), 409
+                return fast_jsonify({'error': 'Conflicting events', 'conflicts': conflicts, 'suggestions': suggestions}), 409
         except Exception as e:
             # If conflict detection fails for any reason, continue to attempt create
             print(f"[WARN] Conflict detection failed: {e}")
@@ -564,12 +633,12 @@ def book_event():
         if created:
             # Provide spoken feedback for accessibility when used via the web UI
             speak_text = f'Event booked successfully: {summary} on {parsed_date} at {time}'
-            return jsonify({'success': True, 'event_id': created, 'message': f'✅ Event booked: {summary} on {parsed_date} at {time}', 'speak': True, 'speak_text': speak_text})
+            return fast_jsonify({'success': True, 'event_id': created, 'message': f'✅ Event booked: {summary} on {parsed_date} at {time}', 'speak': True, 'speak_text': speak_text})
         else:
-            return jsonify({'error': 'Failed to create event'}), 500
+            return fast_jsonify({'error': 'Failed to create event'}), 500
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/set-reminder', methods=['POST'])
@@ -586,7 +655,7 @@ def set_reminder():
         reminder_minutes = data.get('reminder_minutes', 0)
         
         if not all([email, date, time]):
-            return jsonify({'error': 'Missing required fields'}), 400
+            return fast_jsonify({'error': 'Missing required fields'}), 400
         
         # Parse date/time
         try:
@@ -599,7 +668,7 @@ def set_reminder():
         
         service = get_calendar_service()
         if not service:
-            return jsonify({'error': 'Not authenticated'}), 401
+            return fast_jsonify({'error': 'Not authenticated'}), 401
         
         # Create reminder as a calendar event
         created = book.create_event_user(
@@ -614,7 +683,7 @@ def set_reminder():
         
         if created:
             speak_text = f'Reminder set for {summary} on {parsed_date} at {time}'
-            return jsonify({
+            return fast_jsonify({
                 'success': True,
                 'event_id': created,
                 'message': f'🔔 Reminder set: {summary} on {parsed_date} at {time}',
@@ -622,10 +691,10 @@ def set_reminder():
                 'speak_text': speak_text
             })
         else:
-            return jsonify({'error': 'Failed to create reminder'}), 500
+            return fast_jsonify({'error': 'Failed to create reminder'}), 500
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/cancel/<event_id>', methods=['DELETE'])
@@ -635,13 +704,13 @@ def cancel_event(event_id):
     try:
         service = get_calendar_service()
         if not service:
-            return jsonify({'error': 'Not authenticated'}), 401
+            return fast_jsonify({'error': 'Not authenticated'}), 401
         
         service.events().delete(calendarId='primary', eventId=event_id).execute()
-        return jsonify({'success': True})
+        return fast_jsonify({'success': True})
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/settings', methods=['GET'])
@@ -660,10 +729,10 @@ def get_settings():
                 'last_calendar_id': 'primary'
             }
         
-        return jsonify(settings)
+        return fast_jsonify(settings)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/settings', methods=['POST'])
@@ -678,17 +747,17 @@ def update_settings():
         with open(settings_file, 'w') as f:
             json.dump(data, f, indent=2)
         
-        return jsonify({'success': True})
+        return fast_jsonify({'success': True})
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/user', methods=['GET'])
 @login_required
 def get_user():
     """Get current user info."""
-    return jsonify({
+    return fast_jsonify({
         'email': session.get('user_email'),
         'authenticated': True
     })
@@ -706,7 +775,7 @@ def voice_command():
         voice_text = data.get('text', '').strip()
         
         if not voice_text:
-            return jsonify({'error': 'No voice text provided'}), 400
+            return fast_jsonify({'error': 'No voice text provided'}), 400
         
         # Import voice handler to parse commands
         from voice_handler import VoiceCommandParser
@@ -723,7 +792,7 @@ def voice_command():
                 date = datetime.now().strftime('%Y-%m-%d')
             service = get_calendar_service()
             if not service:
-                return jsonify({'error': 'Not authenticated'}), 401
+                return fast_jsonify({'error': 'Not authenticated'}), 401
             from datetime import datetime, timedelta
             # Get start and end of the day in ISO format
             start_dt = datetime.strptime(date, '%Y-%m-%d')
@@ -745,7 +814,7 @@ def voice_command():
             else:
                 speak_text = f'You have no events for {date}.'
                 message = f'No events for {date}.'
-            return jsonify({
+            return fast_jsonify({
                 'success': True,
                 'command': command,
                 'events': events,
@@ -761,11 +830,11 @@ def voice_command():
             summary = params.get('summary', 'Event')
             
             if not all([email, date, time]):
-                return jsonify({'error': 'Missing date or time in voice command. Please provide all details.', 'command': command, 'params': params}), 400
+                return fast_jsonify({'error': 'Missing date or time in voice command. Please provide all details.', 'command': command, 'params': params}), 400
             
             service = get_calendar_service()
             if not service:
-                return jsonify({'error': 'Not authenticated'}), 401
+                return fast_jsonify({'error': 'Not authenticated'}), 401
             
             start_iso = f"{date}T{time}:00+02:00"
             created = book.create_event_user(
@@ -780,7 +849,7 @@ def voice_command():
             
             if created:
                 speak_text = f'Meeting booked successfully. {summary} on {date} at {time}'
-                return jsonify({
+                return fast_jsonify({
                     'success': True,
                     'command': command,
                     'message': f'✅ Event booked: {summary} on {date} at {time}',
@@ -790,7 +859,7 @@ def voice_command():
                 })
             else:
                 speak_text = 'Failed to create event. Please try again.'
-                return jsonify({'error': 'Failed to create event', 'command': command, 'speak': True, 'speak_text': speak_text}), 500
+                return fast_jsonify({'error': 'Failed to create event', 'command': command, 'speak': True, 'speak_text': speak_text}), 500
         
         elif command == 'cancel-book':
             # Cancel an event
@@ -798,18 +867,18 @@ def voice_command():
             time = params.get('time')
             
             if not all([date, time]):
-                return jsonify({'error': 'Please specify date and time to cancel', 'command': command}), 400
+                return fast_jsonify({'error': 'Please specify date and time to cancel', 'command': command}), 400
             
             service = get_calendar_service()
             if not service:
-                return jsonify({'error': 'Not authenticated'}), 401
+                return fast_jsonify({'error': 'Not authenticated'}), 401
             
             start_iso = f"{date}T{time}:00+02:00"
             cancelled = book.cancel_event_by_start(service, calendar_id='primary', start_time_iso=start_iso)
             
             if cancelled:
                 speak_text = f'Event cancelled successfully on {date} at {time}'
-                return jsonify({
+                return fast_jsonify({
                     'success': True,
                     'command': command,
                     'message': f'✅ Event cancelled on {date} at {time}',
@@ -818,13 +887,13 @@ def voice_command():
                 })
             else:
                 speak_text = 'Event not found. Please check the date and time.'
-                return jsonify({'error': 'Event not found', 'command': command, 'speak': True, 'speak_text': speak_text}), 404
+                return fast_jsonify({'error': 'Event not found', 'command': command, 'speak': True, 'speak_text': speak_text}), 404
         
         elif command == 'events':
             # Show events for specific day (if date provided) or today
             service = get_calendar_service()
             if not service:
-                return jsonify({'error': 'Not authenticated'}), 401
+                return fast_jsonify({'error': 'Not authenticated'}), 401
             
             # Get the date to query (default to today)
             if not date_str:
@@ -868,7 +937,7 @@ def voice_command():
                 else:
                     speak_text = f'You have no events on {date_str}'
                 
-                return jsonify({
+                return fast_jsonify({
                     'success': True,
                     'command': command,
                     'events': events,
@@ -877,12 +946,12 @@ def voice_command():
                     'speak_text': speak_text
                 })
             except Exception as e:
-                return jsonify({'error': str(e)}), 500
+                return fast_jsonify({'error': str(e)}), 500
         
         elif command == 'help':
             # Show available commands
             speak_text = 'Available commands are: book a meeting, cancel a booking, view events, help, share calendar, and config. Say any of these commands to get started.'
-            return jsonify({
+            return fast_jsonify({
                 'success': True,
                 'command': command,
                 'message': 'Available commands: book, cancel-book, events, help, share, config, exit',
@@ -893,7 +962,7 @@ def voice_command():
         elif command == 'share':
             # Calendar sharing instructions
             speak_text = 'To share your calendar, go to Google Calendar settings, select your calendar, and add collaborator emails.'
-            return jsonify({
+            return fast_jsonify({
                 'success': True,
                 'command': command,
                 'message': 'Share your calendar by opening Google Calendar settings and adding collaborators.',
@@ -904,7 +973,7 @@ def voice_command():
         else:
             # Unknown command
             speak_text = f'Unknown command. Please try saying: book a meeting, cancel a booking, view events, get help, or share calendar'
-            return jsonify({
+            return fast_jsonify({
                 'success': False,
                 'command': command,
                 'message': f'Unknown command: {voice_text}. Try "book", "cancel", "events", or "help"',
@@ -914,11 +983,23 @@ def voice_command():
     
     except Exception as e:
         speak_text = 'An error occurred. Please try again.'
-        return jsonify({'error': str(e), 'type': 'exception', 'speak': True, 'speak_text': speak_text}), 500
+        return fast_jsonify({'error': str(e), 'type': 'exception', 'speak': True, 'speak_text': speak_text}), 500
 
 
 # --- AI Endpoints ---
 _chatbot = None
+_task_extractor = None
+
+def get_task_extractor():
+    """Lazy singleton for the local task extractor (cheap pre-LLM stage)."""
+    global _task_extractor
+    if _task_extractor is None:
+        try:
+            from src.task_extractor import TaskExtractor
+            _task_extractor = TaskExtractor(use_gpt=False)
+        except Exception:
+            _task_extractor = False
+    return _task_extractor or None
 
 def get_chatbot():
     global _chatbot
@@ -1030,17 +1111,56 @@ def ai_chat_api():
     message = data.get('message')
     context = data.get('context')
     if not message:
-        return jsonify({'error': 'No message provided'}), 400
+        return fast_jsonify({'error': 'No message provided'}), 400
 
     bot = get_chatbot()
     if bot:
         try:
-            ai_response = bot.chat(message, calendar_context=context)
-            return jsonify({'success': True, 'response': ai_response})
+            if context is None and hasattr(bot, 'chat_with_retrieval'):
+                # No context supplied: fetch today's events concurrently
+                # with the chat-side preparation (live context, so the
+                # semantic cache is skipped on this path). The service
+                # is resolved here - the worker thread has no session.
+                service = get_calendar_service()
+                ai_response = bot.chat_with_retrieval(
+                    message, lambda: _todays_events_context(service))
+            else:
+                cache_key = f"chat: {message}\ncontext: {context or ''}"
+                ai_response = semantic_cache.get_or_compute(
+                    cache_key, lambda: bot.chat(message, calendar_context=context))
+            return fast_jsonify({'success': True, 'response': ai_response})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            return fast_jsonify({'error': str(e)}), 500
     # fallback: simple echo/placeholder
-    return jsonify({'success': True, 'response': f"[local] {message}"})
+    return fast_jsonify({'success': True, 'response': f"[local] {message}"})
+
+
+def _todays_events_context(service):
+    """Compact one-line-per-event context for today, or None."""
+    try:
+        if not service:
+            return None
+        now = datetime.now(timezone.utc)
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = start + timedelta(days=1)
+        events = service.events().list(
+            calendarId='primary',
+            timeMin=start.isoformat(),
+            timeMax=end.isoformat(),
+            singleEvents=True,
+            orderBy='startTime',
+            maxResults=20
+        ).execute().get('items', [])
+        if not events:
+            return "No events scheduled today."
+        lines = []
+        for event in events:
+            when = event.get('start', {}).get('dateTime') or \
+                event.get('start', {}).get('date', '')
+            lines.append(f"- {when}: {event.get('summary', '(no title)')}")
+        return "Today's events:\n" + "\n".join(lines)
+    except Exception:
+        return None
 
 
 @app.route('/api/ai/project-chat', methods=['POST'])
@@ -1055,7 +1175,7 @@ def ai_project_chat():
     data = request.get_json() or {}
     message = data.get('message')
     if not message:
-        return jsonify({'error': 'No message provided'}), 400
+        return fast_jsonify({'error': 'No message provided'}), 400
 
     # Build compact project context
     project_context = build_project_context()
@@ -1071,12 +1191,12 @@ def ai_project_chat():
     if bot:
         try:
             ai_response = bot.chat(prompt)
-            return jsonify({'success': True, 'response': ai_response})
+            return fast_jsonify({'success': True, 'response': ai_response})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            return fast_jsonify({'error': str(e)}), 500
 
     # fallback: simple echo with project hint
-    return jsonify({'success': True, 'response': f"[local][project] {message}"})
+    return fast_jsonify({'success': True, 'response': f"[local][project] {message}"})
 
 
 def build_project_context(max_bytes_per_file: int = 4000) -> str:
@@ -1140,23 +1260,49 @@ def build_project_context(max_bytes_per_file: int = 4000) -> str:
 @app.route('/api/ai/agenda', methods=['POST'])
 @login_required
 def ai_agenda():
-    """Generate an agenda for a meeting/event using the AI."""
+    """Generate an agenda for a meeting/event using the AI.
+
+    Pass include: ['actions', 'email'] to also get action items and a
+    draft follow-up email in the same response. The sub-calls are
+    independent, so they run concurrently on the shared executor and the
+    endpoint takes max(call times) instead of their sum.
+    """
     data = request.get_json() or {}
     title = data.get('title', 'Meeting')
     duration = data.get('duration', 60)
     participants = data.get('participants', [])
     notes = data.get('notes', '')
+    include = data.get('include', [])
+
+    prompts = {
+        'agenda': f"Create a structured agenda for a {duration}-minute meeting titled '{title}'. Include sections, time allocations, and brief bullet points. Participants: {', '.join(participants)}. Additional notes: {notes}",
+    }
+    if 'actions' in include:
+        prompts['actions'] = f"Extract concise action items for a meeting titled '{title}'. Participants: {', '.join(participants)}. Notes: {notes}. Return a numbered list."
+    if 'email' in include:
+        prompts['email'] = f"Draft a professional follow-up email about '{title}'. Recipients: {', '.join(participants)}. Context: {notes}. Include a clear subject line and polite closing."
 
     bot = get_chatbot()
-    prompt = f"Create a structured agenda for a {duration}-minute meeting titled '{title}'. Include sections, time allocations, and brief bullet points. Participants: {', '.join(participants)}. Additional notes: {notes}"
     if bot:
         try:
-            ai_response = bot.chat(prompt)
-            return jsonify({'success': True, 'agenda': ai_response})
+            futures = {
+                key: _ai_executor.submit(
+                    semantic_cache.get_or_compute, prompt,
+                    lambda p=prompt: bot.chat(p))
+                for key, prompt in prompts.items()
+            }
+            results = {key: future.result() for key, future in futures.items()}
+            return fast_jsonify({'success': True, **results})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            return fast_jsonify({'error': str(e)}), 500
     # fallback
-    return jsonify({'success': True, 'agenda': _fallback_agenda(title, duration, participants, notes)})
+    results = {'agenda': _fallback_agenda(title, duration, participants, notes)}
+    if 'actions' in include:
+        results['actions'] = _fallback_actions(notes, title)
+    if 'email' in include:
+        subj, body = _fallback_email(title, participants, notes)
+        results['email'] = f"Subject: {subj}\n\n{body}"
+    return fast_jsonify({'success': True, **results})
 
 
 @app.route('/api/ai/actions', methods=['POST'])
@@ -1167,17 +1313,29 @@ def ai_actions():
     notes = data.get('notes', '')
     title = data.get('title', 'Meeting')
     if not notes:
-        return jsonify({'error': 'No notes provided'}), 400
+        return fast_jsonify({'error': 'No notes provided'}), 400
+
+    # Local-first routing: structural extraction is cheap, so try the
+    # task extractor before spending an LLM call; the LLM only handles
+    # notes the matcher can't structure.
+    extractor = get_task_extractor()
+    if extractor:
+        tasks = extractor.extract_tasks(notes)
+        if tasks:
+            actions = '\n'.join(f"{i}. {t.title}" for i, t in enumerate(tasks, 1))
+            app.logger.info(f"ai_actions: local extraction ({len(tasks)} tasks, "
+                            f"avoidance rate {extractor.gpu_avoidance_rate:.2f})")
+            return fast_jsonify({'success': True, 'actions': actions, 'source': 'local'})
 
     bot = get_chatbot()
-    prompt = f"Extract concise action items from the following meeting notes for '{title}':\n\n{notes}\n\nReturn a numbered list of action items with responsible parties if mentioned." 
+    prompt = f"Extract concise action items from the following meeting notes for '{title}':\n\n{notes}\n\nReturn a numbered list of action items with responsible parties if mentioned."
     if bot:
         try:
             ai_response = bot.chat(prompt)
-            return jsonify({'success': True, 'actions': ai_response})
+            return fast_jsonify({'success': True, 'actions': ai_response})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    return jsonify({'success': True, 'actions': _fallback_actions(notes, title)})
+            return fast_jsonify({'error': str(e)}), 500
+    return fast_jsonify({'success': True, 'actions': _fallback_actions(notes, title)})
 
 
 @app.route('/api/ai/email', methods=['POST'])
@@ -1195,12 +1353,12 @@ def ai_email():
     prompt = f"Draft a professional email about '{title}'. Recipients: {', '.join(recipients)}. Context: {context}. Include a clear subject line, brief summary, action items, and a polite closing." 
     if bot:
         try:
-            ai_response = bot.chat(prompt)
-            return jsonify({'success': True, 'email': ai_response})
+            ai_response = semantic_cache.get_or_compute(prompt, lambda: bot.chat(prompt))
+            return fast_jsonify({'success': True, 'email': ai_response})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            return fast_jsonify({'error': str(e)}), 500
     subj, body = _fallback_email(title, recipients, context)
-    return jsonify({'success': True, 'email': f"Subject: {subj}\n\n{body}"})
+    return fast_jsonify({'success': True, 'email': f"Subject: {subj}\n\n{body}"})
 
 
 @app.route('/api/ai/suggest-times', methods=['POST'])
@@ -1219,10 +1377,10 @@ def ai_suggest_times():
     if bot:
         try:
             ai_response = bot.chat(prompt)
-            return jsonify({'success': True, 'suggestions': ai_response})
+            return fast_jsonify({'success': True, 'suggestions': ai_response})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    return jsonify({'success': True, 'suggestions': _fallback_suggestions(duration, participants, preferred)})
+            return fast_jsonify({'error': str(e)}), 500
+    return fast_jsonify({'success': True, 'suggestions': _fallback_suggestions(duration, participants, preferred)})
 
 
 @app.route('/api/ai/summarize', methods=['POST'])
@@ -1232,17 +1390,17 @@ def ai_summarize():
     data = request.get_json() or {}
     notes = data.get('notes', '')
     if not notes:
-        return jsonify({'error': 'No notes provided'}), 400
+        return fast_jsonify({'error': 'No notes provided'}), 400
 
     bot = get_chatbot()
     prompt = f"Please provide a concise meeting summary and action items from the following notes:\n\n{notes}\n\nReturn a short summary and a list of action items." 
     if bot:
         try:
             ai_response = bot.chat(prompt)
-            return jsonify({'success': True, 'summary': ai_response})
+            return fast_jsonify({'success': True, 'summary': ai_response})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    return jsonify({'success': True, 'summary': _fallback_summarize(notes)})
+            return fast_jsonify({'error': str(e)}), 500
+    return fast_jsonify({'success': True, 'summary': _fallback_summarize(notes)})
 
 
 @app.route('/api/ai/followups', methods=['POST'])
@@ -1254,17 +1412,17 @@ def ai_followups():
     title = data.get('title', 'Meeting')
 
     if not notes:
-        return jsonify({'error': 'No notes provided'}), 400
+        return fast_jsonify({'error': 'No notes provided'}), 400
 
     bot = get_chatbot()
     prompt = f"Based on these meeting notes for '{title}', suggest concise follow-up emails and next steps. Provide a short suggested email draft and a numbered list of next actions. Notes:\n\n{notes}"
     if bot:
         try:
             ai_response = bot.chat(prompt)
-            return jsonify({'success': True, 'followups': ai_response})
+            return fast_jsonify({'success': True, 'followups': ai_response})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    return jsonify({'success': True, 'followups': _fallback_followups(notes, title)})
+            return fast_jsonify({'error': str(e)}), 500
+    return fast_jsonify({'success': True, 'followups': _fallback_followups(notes, title)})
 
 
 @app.route('/api/ai/translate', methods=['POST'])
@@ -1276,17 +1434,17 @@ def ai_translate():
     target = data.get('target_language', 'en')
 
     if not text:
-        return jsonify({'error': 'No text provided'}), 400
+        return fast_jsonify({'error': 'No text provided'}), 400
 
     bot = get_chatbot()
     prompt = f"Translate the following text to {target} while preserving meaning and formatting:\n\n{text}"
     if bot:
         try:
             ai_response = bot.chat(prompt)
-            return jsonify({'success': True, 'translation': ai_response})
+            return fast_jsonify({'success': True, 'translation': ai_response})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    return jsonify({'success': True, 'translation': _fallback_translate(text, target)})
+            return fast_jsonify({'error': str(e)}), 500
+    return fast_jsonify({'success': True, 'translation': _fallback_translate(text, target)})
 
 
 @app.route('/api/ai/recommendations', methods=['GET'])
@@ -1300,12 +1458,12 @@ def ai_recommendations():
 
         service = get_calendar_service()
         if not service:
-            return jsonify({'error': 'Not authenticated'}), 401
+            return fast_jsonify({'error': 'Not authenticated'}), 401
 
         recs = recommender.get_recommendations_for_service(service, lookback_days=lookback, max_items=max_items)
-        return jsonify({'success': True, 'recommendations': recs})
+        return fast_jsonify({'success': True, 'recommendations': recs})
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 # Initialize Smart Scheduler (Optional - for web-first architecture)
@@ -1398,7 +1556,7 @@ def voice_start():
         greeting_text = f"Hello {user_name}. Voice assistant ready."
         speak_text = f"Hello {user_name}. Voice assistant ready. Say your trigger to activate voice commands."
 
-        return jsonify({
+        return fast_jsonify({
             'success': True,
             'session_id': session_id,
             'user_name': user_name,
@@ -1408,7 +1566,7 @@ def voice_start():
             'ephemeral_mode': session.get('ephemeral_mode', True)
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/voice/process-command', methods=['POST'])
@@ -1423,7 +1581,7 @@ def voice_process_command():
         user_text = data.get('text', '').strip()
         
         if not user_text:
-            return jsonify({'error': 'No text provided'}), 400
+            return fast_jsonify({'error': 'No text provided'}), 400
         
         # Get current voice state
         voice_state = session.get('voice_state', 'active')
@@ -1435,7 +1593,7 @@ def voice_process_command():
             # Check if user said the trigger phrase (with fuzzy matching)
             if user_text.upper().replace(' ', '').endswith(user_trigger.upper().replace(' ', '')):
                 session['voice_state'] = 'active'
-                return jsonify({
+                return fast_jsonify({
                     'success': True,
                     'state': 'trigger_detected',
                     'speak_text': 'What can I do for you today?',
@@ -1444,7 +1602,7 @@ def voice_process_command():
                 })
             else:
                 # Trigger not recognized
-                return jsonify({
+                return fast_jsonify({
                     'success': False,
                     'state': 'trigger_not_detected',
                     'speak_text': f'I did not recognize that. Please say your trigger phrase: {user_trigger}',
@@ -1488,7 +1646,7 @@ def voice_process_command():
                     
                     created_event = service.events().insert(calendarId='primary', body=event).execute()
                     session['voice_state'] = 'active'
-                    return jsonify({
+                    return fast_jsonify({
                         'success': True,
                         'command_type': 'book_meeting',
                         'message': f"Meeting booked: {booking_ctx.get('summary')} at {start_time_obj.strftime('%I:%M %p')}",
@@ -1497,7 +1655,7 @@ def voice_process_command():
                     })
             except Exception as e:
                 session['voice_state'] = 'active'
-                return jsonify({
+                return fast_jsonify({
                     'success': False,
                     'message': f'Failed to book: {str(e)}',
                     'speak_text': 'Could not book that meeting. What else can I do?',
@@ -1597,22 +1755,22 @@ def voice_process_command():
                         response['speak_text'] = 'I did not catch that. You can book a meeting, see your events, or tell me what you need. What would you like?'
                         response['state'] = 'active'
             
-            return jsonify(response)
+            return fast_jsonify(response)
         
         # STATE 3: Inactive
         if voice_state == 'inactive':
-            return jsonify({
+            return fast_jsonify({
                 'success': False,
                 'message': 'Voice assistant is inactive. Say your trigger phrase to reactivate.',
                 'speak_text': 'Voice assistant is inactive.',
                 'state': 'inactive'
             })
         
-        return jsonify({'error': 'Unknown voice state'}), 400
+        return fast_jsonify({'error': 'Unknown voice state'}), 400
     
     except Exception as e:
         print(f"Error processing command: {e}")
-        return jsonify({'error': str(e), 'speak_text': 'An error occurred. Please try again.'}), 500
+        return fast_jsonify({'error': str(e), 'speak_text': 'An error occurred. Please try again.'}), 500
 
 
 @app.route('/api/voice/end-session', methods=['POST'])
@@ -1626,9 +1784,9 @@ def voice_end_session():
             logger = get_logger()
             logger.end_session(session_id)
         
-        return jsonify({'success': True})
+        return fast_jsonify({'success': True})
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/voice/save-transcript', methods=['POST'])
@@ -1646,7 +1804,7 @@ def save_transcript():
         # If the session is ephemeral, do not persist transcripts to disk
         if ephemeral_mode:
             print(f"Ephemeral mode active for session {session_id}: skipping transcript save")
-            return jsonify({
+            return fast_jsonify({
                 'success': True,
                 'message': 'Ephemeral session - transcript not saved',
                 'session_id': session_id,
@@ -1674,7 +1832,7 @@ def save_transcript():
         except Exception as e:
             print(f"Warning: Could not save transcript file: {e}")
         
-        return jsonify({
+        return fast_jsonify({
             'success': True,
             'message': 'Transcript saved',
             'session_id': session_id,
@@ -1682,7 +1840,7 @@ def save_transcript():
         })
     except Exception as e:
         print(f"Error saving transcript: {e}")
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/voice/transcript-history', methods=['GET'])
@@ -1724,7 +1882,7 @@ def get_transcript_history():
         # Sort by timestamp descending
         history.sort(key=lambda x: x['timestamp'], reverse=True)
         
-        return jsonify({
+        return fast_jsonify({
             'success': True,
             'user_email': user_email,
             'days': days,
@@ -1732,7 +1890,7 @@ def get_transcript_history():
             'total': len(history)
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/voice_cmd', methods=['POST'])
@@ -1765,7 +1923,7 @@ def voice_cmd():
         # Check rate limit
         if not check_rate_limit(user_id):
             voice_logger.warning(f"Rate limit exceeded for user {user_id}")
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'rate_limit_exceeded',
                 'assistant_text': 'You are sending requests too quickly. Please wait a moment.'
@@ -1776,7 +1934,7 @@ def voice_cmd():
         
         # Check for empty transcript
         if not normalized:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'empty_transcript',
                 'assistant_text': "I didn't catch that. Please repeat."
@@ -1806,7 +1964,7 @@ def voice_cmd():
         if action == 'book':
             if confirm_required or not title or not date_str or not iso_time:
                 # Missing required info - ask for clarification
-                return jsonify({
+                return fast_jsonify({
                     'ok': True,
                     'assistant_text': reply,
                     'spoken_time': None,
@@ -1824,7 +1982,7 @@ def voice_cmd():
                 )
                 
                 if result.get('ok'):
-                    return jsonify({
+                    return fast_jsonify({
                         'ok': True,
                         'assistant_text': reply,
                         'spoken_time': result.get('spoken_time') or spoken_time,
@@ -1832,7 +1990,7 @@ def voice_cmd():
                         'data': None
                     })
                 else:
-                    return jsonify({
+                    return fast_jsonify({
                         'ok': False,
                         'assistant_text': result.get('reply', 'Failed to create event.'),
                         'spoken_time': None,
@@ -1858,7 +2016,7 @@ def voice_cmd():
                 else:
                     assistant_text = f"You have no events scheduled for {date_to_fetch}."
                 
-                return jsonify({
+                return fast_jsonify({
                     'ok': True,
                     'assistant_text': assistant_text,
                     'spoken_time': None,
@@ -1866,7 +2024,7 @@ def voice_cmd():
                     'data': {'events': events_list}
                 })
             else:
-                return jsonify({
+                return fast_jsonify({
                     'ok': False,
                     'assistant_text': result.get('reply', 'Could not fetch events.'),
                     'spoken_time': None,
@@ -1876,7 +2034,7 @@ def voice_cmd():
         
         elif action == 'cancel':
             # For cancel, we need more info typically
-            return jsonify({
+            return fast_jsonify({
                 'ok': True,
                 'assistant_text': reply,
                 'spoken_time': None,
@@ -1885,7 +2043,7 @@ def voice_cmd():
             })
         
         else:  # action == 'other'
-            return jsonify({
+            return fast_jsonify({
                 'ok': True,
                 'assistant_text': reply,
                 'spoken_time': spoken_time,
@@ -1895,7 +2053,7 @@ def voice_cmd():
     
     except Exception as e:
         voice_logger.error(f"Error processing voice command: {e}", exc_info=True)
-        return jsonify({
+        return fast_jsonify({
             'ok': False,
             'error': 'internal_error',
             'assistant_text': 'An error occurred processing your request.'
@@ -1931,9 +2089,9 @@ def internal_voice_probe():
             except Exception as e:
                 info['import_error'] = str(e)
 
-        return jsonify(info)
+        return fast_jsonify(info)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/internal/voice_simulate', methods=['POST'])
@@ -1957,7 +2115,7 @@ def internal_voice_simulate():
             is_demo = bool(data.get('demo', False))
 
         if not transcript:
-            return jsonify({'ok': False, 'error': 'empty_transcript'}), 400
+            return fast_jsonify({'ok': False, 'error': 'empty_transcript'}), 400
 
         # Normalize and parse
         normalized = normalize_transcript(transcript)
@@ -2057,7 +2215,7 @@ def internal_voice_simulate():
                     pass
 
             if not title or not date_str or not iso_time:
-                return jsonify({'ok': True, 'assistant_text': reply, 'needs_more_info': True})
+                return fast_jsonify({'ok': True, 'assistant_text': reply, 'needs_more_info': True})
 
             # If this is a demo simulation user, store event locally and return success
             if is_demo:
@@ -2091,9 +2249,9 @@ def internal_voice_simulate():
                         _save_demo_user_to_disk(uid)
                     except Exception:
                         pass
-                    return jsonify({'ok': True, 'assistant_text': f'Booked {title} on {resolved_date}', 'result': {'ok': True, 'event': event}})
+                    return fast_jsonify({'ok': True, 'assistant_text': f'Booked {title} on {resolved_date}', 'result': {'ok': True, 'event': event}})
                 except Exception as e:
-                    return jsonify({'ok': False, 'assistant_text': f'Failed to create demo event: {e}'}), 500
+                    return fast_jsonify({'ok': False, 'assistant_text': f'Failed to create demo event: {e}'}), 500
 
             raw_result = create_event(
                 user_id=user_id,
@@ -2103,7 +2261,7 @@ def internal_voice_simulate():
                 timezone=user_timezone
             )
             result = _ensure_dict(raw_result)
-            return jsonify({'ok': bool(result.get('ok')), 'assistant_text': reply, 'result': result})
+            return fast_jsonify({'ok': bool(result.get('ok')), 'assistant_text': reply, 'result': result})
 
         elif action == 'cancel':
             # Cancel an event (demo mode supports deletion from in-memory demo DB)
@@ -2146,7 +2304,7 @@ def internal_voice_simulate():
 
                     events_list = _voice_users_db.get(uid, {}).get('events', [])
                     if not events_list:
-                        return jsonify({'ok': False, 'assistant_text': 'No demo events to cancel.'})
+                        return fast_jsonify({'ok': False, 'assistant_text': 'No demo events to cancel.'})
 
                     def _match(ev):
                         # Prefer matching by title or time. Do not match by date alone.
@@ -2180,19 +2338,19 @@ def internal_voice_simulate():
                         pass
 
                     if removed:
-                        return jsonify({'ok': True, 'assistant_text': f'Removed {len(removed)} event(s).', 'removed': removed})
+                        return fast_jsonify({'ok': True, 'assistant_text': f'Removed {len(removed)} event(s).', 'removed': removed})
                     else:
                         # Include debug info to help understand why matching failed
                         try:
                             titles = [ev.get('title') for ev in events_list]
                         except Exception:
                             titles = []
-                        return jsonify({'ok': False, 'assistant_text': 'No matching demo events found to cancel.', 'debug': {'target_title': target_title, 'target_date': target_date, 'target_time': target_time, 'events': titles}})
+                        return fast_jsonify({'ok': False, 'assistant_text': 'No matching demo events found to cancel.', 'debug': {'target_title': target_title, 'target_date': target_date, 'target_time': target_time, 'events': titles}})
                 except Exception as e:
-                    return jsonify({'ok': False, 'assistant_text': f'Failed to cancel demo event: {e}'})
+                    return fast_jsonify({'ok': False, 'assistant_text': f'Failed to cancel demo event: {e}'})
             else:
                 # Non-demo: return assistant reply (may request clarification)
-                return jsonify({'ok': True, 'assistant_text': reply, 'spoken_time': None})
+                return fast_jsonify({'ok': True, 'assistant_text': reply, 'spoken_time': None})
 
         elif action == 'get_events':
             date_to_fetch = date_str or 'today'
@@ -2230,9 +2388,9 @@ def internal_voice_simulate():
                             {'title': 'TestStandup', 'date': resolved, 'iso_time': sample_time, 'spoken_time': sample_spoken},
                             {'title': 'Project Sync', 'date': resolved, 'iso_time': '16:00', 'spoken_time': '4 PM'}
                         ]
-                    return jsonify({'ok': True, 'assistant_text': reply, 'events': events})
+                    return fast_jsonify({'ok': True, 'assistant_text': reply, 'events': events})
                 except Exception as e:
-                    return jsonify({'ok': False, 'assistant_text': f'Could not fetch demo events: {e}', 'debug': {}})
+                    return fast_jsonify({'ok': False, 'assistant_text': f'Could not fetch demo events: {e}', 'debug': {}})
 
             # Handle cancellation in demo mode: allow deleting stored demo events
             if is_demo and action == 'cancel':
@@ -2246,7 +2404,7 @@ def internal_voice_simulate():
 
                     events_list = _voice_users_db.get(uid, {}).get('events', [])
                     if not events_list:
-                        return jsonify({'ok': False, 'assistant_text': 'No demo events to cancel.'})
+                        return fast_jsonify({'ok': False, 'assistant_text': 'No demo events to cancel.'})
 
                     # Find matching events (loose matching)
                     def _match(ev):
@@ -2269,24 +2427,24 @@ def internal_voice_simulate():
                     _voice_users_db[uid]['events'] = remaining
 
                     if removed:
-                        return jsonify({'ok': True, 'assistant_text': f'Removed {len(removed)} event(s).', 'removed': removed})
+                        return fast_jsonify({'ok': True, 'assistant_text': f'Removed {len(removed)} event(s).', 'removed': removed})
                     else:
-                        return jsonify({'ok': False, 'assistant_text': 'No matching demo events found to cancel.'})
+                        return fast_jsonify({'ok': False, 'assistant_text': 'No matching demo events found to cancel.'})
                 except Exception as e:
-                    return jsonify({'ok': False, 'assistant_text': f'Failed to cancel demo event: {e}'})
+                    return fast_jsonify({'ok': False, 'assistant_text': f'Failed to cancel demo event: {e}'})
 
             raw_result = get_events(user_id=user_id, date_str=date_to_fetch, timezone=user_timezone)
             result = _ensure_dict(raw_result)
             if result.get('ok'):
                 events = result.get('events') or []
-                return jsonify({'ok': True, 'assistant_text': reply, 'events': events})
-            return jsonify({'ok': False, 'assistant_text': result.get('reply', 'Could not fetch events.'), 'debug': result})
+                return fast_jsonify({'ok': True, 'assistant_text': reply, 'events': events})
+            return fast_jsonify({'ok': False, 'assistant_text': result.get('reply', 'Could not fetch events.'), 'debug': result})
 
         else:
-            return jsonify({'ok': True, 'assistant_text': reply, 'spoken_time': spoken_time})
+            return fast_jsonify({'ok': True, 'assistant_text': reply, 'spoken_time': spoken_time})
 
     except Exception as e:
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        return fast_jsonify({'ok': False, 'error': str(e)}), 500
 
 
 @app.route('/api/set_trigger', methods=['POST'])
@@ -2313,7 +2471,7 @@ def set_trigger():
         user_id = session.get('user_email', 'unknown')
         
         if not trigger:
-            return jsonify({'ok': False, 'error': 'empty_trigger'})
+            return fast_jsonify({'ok': False, 'error': 'empty_trigger'})
         
         # Store trigger in .config/triggers/ directory
         os.makedirs('.config/triggers', exist_ok=True)
@@ -2331,11 +2489,11 @@ def set_trigger():
         voice_logger.info(f"Trigger set for user {user_id}")
         
         # Return success WITHOUT the trigger phrase
-        return jsonify({'ok': True})
+        return fast_jsonify({'ok': True})
     
     except Exception as e:
         voice_logger.error(f"Error setting trigger: {e}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        return fast_jsonify({'ok': False, 'error': str(e)}), 500
 
 
 @app.route('/api/get_trigger_status', methods=['GET'])
@@ -2357,11 +2515,11 @@ def get_trigger_status():
         
         trigger_set = os.path.exists(trigger_file)
         
-        return jsonify({'trigger_set': trigger_set})
+        return fast_jsonify({'trigger_set': trigger_set})
     
     except Exception as e:
         voice_logger.error(f"Error getting trigger status: {e}")
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/voice/transcribe', methods=['POST'])
@@ -2391,7 +2549,7 @@ def voice_transcribe():
         # Get OpenAI API key from environment
         openai_api_key = os.environ.get('OPENAI_API_KEY')
         if not openai_api_key:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'openai_not_configured',
                 'transcript': '',
@@ -2403,7 +2561,7 @@ def voice_transcribe():
         audio_format = data.get('format', 'wav')
         
         if not audio_b64:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'no_audio',
                 'transcript': '',
@@ -2414,7 +2572,7 @@ def voice_transcribe():
         try:
             audio_bytes = base64.b64decode(audio_b64)
         except Exception as e:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'invalid_audio_encoding',
                 'transcript': '',
@@ -2441,7 +2599,7 @@ def voice_transcribe():
             transcript = transcript_response.get('text', '').strip()
             
             if not transcript:
-                return jsonify({
+                return fast_jsonify({
                     'ok': False,
                     'error': 'empty_transcript',
                     'transcript': '',
@@ -2450,7 +2608,7 @@ def voice_transcribe():
             
             voice_logger.info(f"Transcribed audio: {transcript[:100]}")
             
-            return jsonify({
+            return fast_jsonify({
                 'ok': True,
                 'transcript': transcript,
                 'error': None
@@ -2465,7 +2623,7 @@ def voice_transcribe():
     
     except Exception as e:
         voice_logger.error(f"Error transcribing audio: {e}")
-        return jsonify({
+        return fast_jsonify({
             'ok': False,
             'error': 'transcription_error',
             'transcript': '',
@@ -2499,7 +2657,7 @@ def voice_respond():
         context = data.get('context', '')
         
         if not transcript:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'no_transcript',
                 'response': '',
@@ -2533,7 +2691,7 @@ Respond naturally and concisely as if speaking aloud. Keep responses under 50 wo
         
         voice_logger.info(f"GPT response: {gpt_response[:100]}")
         
-        return jsonify({
+        return fast_jsonify({
             'ok': True,
             'response': gpt_response,
             'speak_text': gpt_response,  # Same as response for now
@@ -2542,7 +2700,7 @@ Respond naturally and concisely as if speaking aloud. Keep responses under 50 wo
     
     except Exception as e:
         voice_logger.error(f"Error generating response: {e}")
-        return jsonify({
+        return fast_jsonify({
             'ok': False,
             'error': 'response_generation_error',
             'response': '',
@@ -2570,13 +2728,13 @@ def text_to_speech():
     """
     try:
         # Placeholder for future TTS implementation
-        return jsonify({
+        return fast_jsonify({
             'ok': False,
             'error': 'not_implemented',
             'message': 'TTS endpoint is not yet implemented. Use browser speechSynthesis API.'
         })
     except Exception as e:
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        return fast_jsonify({'ok': False, 'error': str(e)}), 500
 
 
 
@@ -2594,19 +2752,19 @@ def get_trigger_phrase():
         trigger = session.get('user_trigger', None)
         
         if not trigger:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'no_trigger_set',
                 'message': 'No trigger phrase configured. Set one in Settings.'
             }), 400
         
-        return jsonify({
+        return fast_jsonify({
             'ok': True,
             'trigger_phrase': trigger
         })
     except Exception as e:
         voice_logger.error(f"Error getting trigger: {e}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        return fast_jsonify({'ok': False, 'error': str(e)}), 500
 
 
 @app.route('/api/set_trigger', methods=['POST'])
@@ -2621,14 +2779,14 @@ def set_trigger_phrase():
         new_trigger = data.get('trigger_phrase', '').strip()
         
         if not new_trigger or len(new_trigger) < 2:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'invalid_trigger',
                 'message': 'Trigger phrase must be at least 2 characters'
             }), 400
         
         if len(new_trigger) > 50:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'trigger_too_long',
                 'message': 'Trigger phrase must be 50 characters or less'
@@ -2641,13 +2799,13 @@ def set_trigger_phrase():
         user_email = session.get('user_email', 'unknown')
         voice_logger.info(f"Trigger phrase updated for {user_email}")
         
-        return jsonify({
+        return fast_jsonify({
             'ok': True,
             'message': 'Trigger phrase saved successfully'
         })
     except Exception as e:
         voice_logger.error(f"Error setting trigger: {e}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        return fast_jsonify({'ok': False, 'error': str(e)}), 500
 
 
 @app.route('/api/chat', methods=['POST'])
@@ -2662,7 +2820,7 @@ def gpt_chat():
         message = data.get('message', '').strip()
 
         if not message:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'empty_message',
                 'message': 'Message cannot be empty'
@@ -2671,7 +2829,7 @@ def gpt_chat():
         # Rate limiting
         user_id = session.get('user_id', session.get('user_email', 'unknown'))
         if not check_rate_limit(user_id):
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'rate_limit',
                 'message': 'Too many requests. Try again in a moment.'
@@ -2680,7 +2838,7 @@ def gpt_chat():
         # Get OpenAI API key
         api_key = os.environ.get('OPENAI_API_KEY')
         if not api_key:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'no_api_key',
                 'message': 'OpenAI API key not configured'
@@ -2689,7 +2847,7 @@ def gpt_chat():
         try:
             from openai import OpenAI
         except ImportError:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'openai_not_installed',
                 'message': 'OpenAI library not installed. Run: pip install openai'
@@ -2723,7 +2881,7 @@ def gpt_chat():
         user_email = session.get('user_email', 'unknown')
         voice_logger.info(f"GPT-5 Chat from {user_email}: {message[:50]}...")
         
-        return jsonify({
+        return fast_jsonify({
             'ok': True,
             'response': assistant_message,
             'message': 'Response generated successfully'
@@ -2731,7 +2889,7 @@ def gpt_chat():
 
     except Exception as e:
         voice_logger.error(f"GPT-5 Chat error: {e}", exc_info=True)
-        return jsonify({
+        return fast_jsonify({
             'ok': False,
             'error': 'chat_error',
             'message': 'Sorry, I couldn\'t process that. Try again?'
@@ -2759,14 +2917,14 @@ def parse_event_command():
         command = data.get('command', '').strip()
         
         if not command:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'empty_command'
             }), 400
         
         api_key = os.environ.get('OPENAI_API_KEY')
         if not api_key:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'no_api_key'
             }), 500
@@ -2774,7 +2932,7 @@ def parse_event_command():
         try:
             from openai import OpenAI
         except ImportError:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'openai_not_installed'
             }), 500
@@ -2818,7 +2976,7 @@ If any required field is missing, return null for that field.'''
             
             # Ensure required fields exist
             if not event_data.get('title') or not event_data.get('date'):
-                return jsonify({
+                return fast_jsonify({
                     'ok': True,
                     'event': None,
                     'partial': event_data
@@ -2828,13 +2986,13 @@ If any required field is missing, return null for that field.'''
             if not event_data.get('timezone'):
                 event_data['timezone'] = session.get('timezone', 'UTC')
             
-            return jsonify({
+            return fast_jsonify({
                 'ok': True,
                 'event': event_data
             })
         except json.JSONDecodeError:
             voice_logger.warning(f"Failed to parse event JSON: {response_text}")
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'parse_error',
                 'raw': response_text
@@ -2842,7 +3000,7 @@ If any required field is missing, return null for that field.'''
     
     except Exception as e:
         voice_logger.error(f"Event parsing error: {e}")
-        return jsonify({
+        return fast_jsonify({
             'ok': False,
             'error': 'parse_error'
         }), 500
@@ -2874,7 +3032,7 @@ def book_event_endpoint():
         
         # Validate required fields
         if not title or not date_str:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'missing_fields',
                 'message': 'Title and date are required'
@@ -2882,7 +3040,7 @@ def book_event_endpoint():
         
         service = get_calendar_service()
         if not service:
-            return jsonify({'ok': False, 'error': 'not_authenticated'}), 401
+            return fast_jsonify({'ok': False, 'error': 'not_authenticated'}), 401
         
         try:
             from datetime import time
@@ -2927,7 +3085,7 @@ def book_event_endpoint():
             user_email = session.get('user_email', 'unknown')
             voice_logger.info(f"Event booked by {user_email}: {title} on {date_str}")
             
-            return jsonify({
+            return fast_jsonify({
                 'ok': True,
                 'event_id': result.get('id'),
                 'message': f'Event "{title}" booked successfully',
@@ -2935,7 +3093,7 @@ def book_event_endpoint():
             })
         
         except ValueError as e:
-            return jsonify({
+            return fast_jsonify({
                 'ok': False,
                 'error': 'invalid_date_format',
                 'message': f'Invalid date or time format: {e}'
@@ -2943,7 +3101,7 @@ def book_event_endpoint():
     
     except Exception as e:
         voice_logger.error(f"Booking error: {e}")
-        return jsonify({
+        return fast_jsonify({
             'ok': False,
             'error': 'booking_error',
             'message': str(e)